@@ -0,0 +1,27 @@
+"""Module containing the benchmarks of the hot paths, which are run by `python -m datacademy.benchmark`."""
+
+from .load import DEFAULT_CHECKS, DEFAULT_STUDENTS, LoadReport, LoadTest, default_workload
+from .runner import (
+    DEFAULT_MIN_TIME,
+    DEFAULT_REPEAT,
+    DEFAULT_TOLERANCE,
+    BenchmarkCase,
+    BenchmarkComparison,
+    BenchmarkReport,
+    BenchmarkResult,
+    compare_reports,
+    select_cases,
+)
+
+__all__ = [
+    'DEFAULT_MIN_TIME',
+    'DEFAULT_REPEAT',
+    'DEFAULT_TOLERANCE',
+    'BenchmarkCase',
+    'BenchmarkComparison',
+    'BenchmarkReport',
+    'BenchmarkResult',
+    'compare_reports',
+    'select_cases',
+]
+__all__ += ['DEFAULT_CHECKS', 'DEFAULT_STUDENTS', 'LoadReport', 'LoadTest', 'default_workload']
@@ -0,0 +1,147 @@
+"""Command line interface of the benchmarks, which is run by `python -m datacademy.benchmark`.
+
+Baselines are not part of the package, as timings only compare well on the same machine. To check a change for
+regressions, save a baseline before the change and compare against it afterwards:
+
+    python -m datacademy.benchmark --quick --output baseline.json
+    python -m datacademy.benchmark --quick --baseline baseline.json
+
+NOTE: The load test is run by `python -m datacademy.benchmark load`.
+"""
+
+import argparse
+import sys
+from collections.abc import Sequence
+
+from . import load
+from .cases import CASES
+from .runner import (
+    DEFAULT_MIN_TIME,
+    DEFAULT_REPEAT,
+    DEFAULT_TOLERANCE,
+    BenchmarkReport,
+    compare_reports,
+    select_cases,
+)
+
+
+def format_seconds(seconds: float) -> str:
+    """Format a duration with a fitting unit.
+
+    Args:
+        seconds (float): Seconds.
+
+    Returns:
+        str: Formatted duration, such as `12.3 ms`.
+    """
+    for unit, scale in (('s', 1.0), ('ms', 1e-3), ('us', 1e-6)):
+        if seconds >= scale:
+            return f'{seconds / scale:.3g} {unit}'
+    return f'{seconds / 1e-9:.3g} ns'
+
+
+def format_bytes(size: int) -> str:
+    """Format an amount of bytes with a fitting unit.
+
+    Args:
+        size (int): Amount of bytes.
+
+    Returns:
+        str: Formatted amount, such as `12.3 kB`.
+    """
+    for unit, scale in (('GB', 1e9), ('MB', 1e6), ('kB', 1e3)):
+        if size >= scale:
+            return f'{size / scale:.3g} {unit}'
+    return f'{size} B'
+
+
+def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
+    """Parse the command line arguments.
+
+    Args:
+        argv (Sequence[str] | None, optional): Arguments, those of the process if None. Defaults to None.
+
+    Returns:
+        argparse.Namespace: Parsed arguments.
+    """
+    parser = argparse.ArgumentParser(prog='datacademy-benchmark', description='Benchmark the hot paths of datacademy.')
+    parser.add_argument('-k', '--filter', help='only run benchmarks of which the name contains this regex')
+    parser.add_argument('-q', '--quick', action='store_true', help='skip benchmarks that use a lot of time or memory')
+    parser.add_argument('-r', '--repeat', type=int, default=DEFAULT_REPEAT, help='amount of timings per benchmark')
+    parser.add_argument(
+        '--min-time', type=float, default=DEFAULT_MIN_TIME, help='minimum seconds of a single timing',
+    )
+    parser.add_argument('-o', '--output', help='path of the JSON file to save the results to')
+    parser.add_argument(
+        '-b', '--baseline',
+        help='path of a JSON file with results to compare against, as saved by --output on the same machine',
+    )
+    parser.add_argument(
+        '-t', '--tolerance', type=float, default=DEFAULT_TOLERANCE,
+        help='fraction by which a benchmark may be slower than the baseline',
+    )
+    parser.add_argument('-l', '--list', action='store_true', help='list the benchmarks instead of running them')
+    return parser.parse_args(argv)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Run the benchmarks, or the load test if the first argument is `load`.
+
+    Args:
+        argv (Sequence[str] | None, optional): Command line arguments, those of the process if None.
+            Defaults to None.
+
+    Returns:
+        int: Exit code, which is 1 if a benchmark regressed compared to the baseline.
+    """
+    argv = sys.argv[1:] if argv is None else argv
+    if len(argv) > 0 and argv[0] == 'load':
+        return load.main(argv[1:])
+
+    args = parse_args(argv)
+    cases = select_cases(CASES, args.filter, quick=args.quick)
+    if args.list:
+        for case in cases:
+            print(case.name + (' (large)' if case.large else ''))
+        return 0
+
+    # The baseline is loaded first, so an invalid path fails before the benchmarks run
+    baseline = None if args.baseline is None else BenchmarkReport.load(args.baseline)
+
+    results = []
+    for case in cases:
+        result = case.run(args.repeat, args.min_time)
+        results.append(result)
+        size = '' if result.size is None else f'  {format_bytes(result.size)}'
+        print(f'{case.name:<40} {format_seconds(result.best):>10}  (x{result.number}){size}', flush=True)
+
+    report = BenchmarkReport.create(results)
+    if args.output is not None:
+        report.save(args.output)
+
+    if baseline is None:
+        return 0
+
+    print(f'\nCompared to the baseline of {baseline.created:%Y-%m-%d %H:%M} ({baseline.machine}):')
+    if baseline.machine != report.machine or baseline.python != report.python:
+        print(
+            f'NOTE: The baseline was run with Python {baseline.python} on {baseline.machine}, but this run with '
+            f'Python {report.python} on {report.machine}, so differences need not be regressions.',
+        )
+    regressions = 0
+    for comparison in compare_reports(report, baseline):
+        regressed = comparison.is_regression(args.tolerance)
+        regressions += regressed
+        print(
+            f'{comparison.name:<40} {format_seconds(comparison.baseline):>10} -> '
+            f'{format_seconds(comparison.current):>10}  x{comparison.ratio:.2f}' + (' SLOWER' if regressed else ''),
+        )
+
+    if regressions > 0:
+        print(f'\n{regressions} benchmark(s) are more than {args.tolerance:.0%} slower.')
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,533 @@
+"""Module containing the benchmarks of the serialization and database hot paths."""
+
+import json
+import os
+import subprocess
+import sys
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from functools import partial
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import text
+
+from datacademy.checker.compression import DeflateCodec, GzipCodec, ZlibCodec
+from datacademy.checker.encoding import decode_array, encode_array
+from datacademy.checker.objects import ObjectModel
+from datacademy.checker.request import VerificationRequest
+from datacademy.checker.response import VerificationResponse
+from datacademy.checker.types import ANSWER_TYPES
+from datacademy.database import DatabaseConnection
+from datacademy.util import check_isinstance
+from datacademy.util.paths import CACHE_DIR_VARIABLE
+
+from .runner import BenchmarkCase, BenchmarkSetup, MeasureSetup
+
+if TYPE_CHECKING:
+    from datacademy.modules.m03_sql import Module03
+
+SEED = 42
+"""Seed of the random generator, so every run benchmarks the same data."""
+
+FRAME_COLUMNS = 10
+"""Amount of columns of DataFrame answers."""
+
+CASES: list[BenchmarkCase] = []
+"""Benchmarks that are run by the command line interface."""
+
+
+M03_CHANGES = {
+    'rows': (
+        'DELETE FROM orders WHERE id <= 100',
+        'UPDATE products SET price = price * 2 WHERE id <= 10',
+        "INSERT INTO customers (first_name, last_name, address) VALUES ('New', 'Customer', 'Street 1')",
+    ),
+    'drop': ('DROP TABLE orders',),
+    'replace': (
+        'CREATE UNIQUE INDEX products_name ON products (name)',
+        "INSERT OR REPLACE INTO products (id, name, price, stock) VALUES (1000000, 'Product 0', 1, 1)",
+    ),
+}
+"""Statements that change the database of module 3 before it is reset, by name of the change."""
+
+CODECS: dict[str, type[ZlibCodec]] = {'gzip': GzipCodec, 'deflate': DeflateCodec}
+"""Codecs of which the compression of request bodies is benchmarked, by name."""
+
+COMPRESSION_LEVELS = (1, 6, 9)
+"""Compression levels of which the compression of request bodies is benchmarked."""
+
+IMPORTS = {
+    'checker': 'import datacademy.checker',
+    'modules': 'import datacademy.modules',
+    'module03': 'from datacademy.modules import Module03',
+    'module07': 'from datacademy.modules import Module07',
+    'all': 'from datacademy.modules import *',
+}
+"""Import statements of which the import time is benchmarked, by name."""
+
+
+def register(
+    name: str,
+    setup: BenchmarkSetup | MeasureSetup,
+    *,
+    large: bool = False,
+    measured: bool = False,
+    sized: bool = False
+) -> None:
+    """Add a benchmark to the benchmarks that are run by the command line interface.
+
+    Args:
+        name (str): Name of the benchmark.
+        setup (BenchmarkSetup | MeasureSetup): Function that prepares the benchmark.
+        large (bool, optional): Whether the benchmark is skipped by quick runs. Defaults to False.
+        measured (bool, optional): Whether the benchmark measures the seconds itself. Defaults to False.
+        sized (bool, optional): Whether the size of the bytes returned by the benchmark is reported. Defaults to False.
+    """
+    CASES.append(BenchmarkCase(name, setup, large=large, measured=measured, sized=sized))
+
+
+def create_frame(cells: int) -> pd.DataFrame:
+    """Create a DataFrame with float, integer and string columns, like the answers to the assignments.
+
+    Args:
+        cells (int): Amount of cells.
+
+    Returns:
+        pd.DataFrame: DataFrame.
+    """
+    rng = np.random.default_rng(SEED)
+    rows = cells // FRAME_COLUMNS
+    data: dict[str, np.ndarray] = {f'value_{i}': rng.random(rows) for i in range(FRAME_COLUMNS - 2)}
+    data['count'] = rng.integers(0, 1000, rows)
+    data['label'] = rng.choice([f'label_{i}' for i in range(100)], rows).astype(object)
+    return pd.DataFrame(data)
+
+
+ANSWERS: dict[str, tuple[Callable[[], ANSWER_TYPES], bool]] = {
+    'int': (lambda: 42, False),
+    'str': (lambda: 'answer ' * 100, False),
+    'list': (lambda: [[i * j for j in range(10)] for i in range(1000)], False),
+    'nested_list_1e5': (lambda: [[i, f'item_{i}', i / 2] for i in range(10 ** 5)], False),
+    'nested_dict_1e5': (lambda: {f'key_{i}': {'value': i, 'values': [i, i + 1]} for i in range(10 ** 5)}, False),
+    'frame_1e3': (partial(create_frame, 10 ** 3), False),
+    'frame_1e5': (partial(create_frame, 10 ** 5), False),
+    'frame_1e7': (partial(create_frame, 10 ** 7), True),
+    'array_1e6': (lambda: np.random.default_rng(SEED).random(10 ** 6), False),
+    'array_1e7': (lambda: np.random.default_rng(SEED).random(10 ** 7), True),
+}
+"""Answers by name, with whether they are large."""
+
+
+ARRAYS: dict[str, Callable[[], np.ndarray]] = {
+    'float_1e6': lambda: np.random.default_rng(SEED).random(10 ** 6),
+    'big_endian': lambda: np.random.default_rng(SEED).random(10 ** 5).astype('>f8'),
+    'fortran': lambda: np.asfortranarray(np.random.default_rng(SEED).random((1000, 100))),
+    'scalar': lambda: np.array(1.5),
+    'empty': lambda: np.empty((0, 3), dtype=np.int32),
+    'datetime': lambda: np.arange(10 ** 5).astype('datetime64[ns]'),
+    'timedelta': lambda: np.arange(10 ** 5).astype('timedelta64[ms]'),
+}
+"""Arrays of which the encoding is benchmarked and checked, by name, covering byte orders, layouts and shapes."""
+
+
+def check_round_trip(values: np.ndarray, decoded: object) -> None:
+    """Check that an array is decoded exactly, with the same dtype, byte order, shape and bytes.
+
+    Args:
+        values (np.ndarray): Array.
+        decoded (object): Decoded array.
+
+    Raises:
+        ValueError: If the decoded array is not exactly the same.
+    """
+    # Bytes are compared instead of values, so NaN and NaT compare equal to themselves
+    if not isinstance(decoded, np.ndarray) or decoded.dtype.str != values.dtype.str \
+            or decoded.shape != values.shape or decoded.tobytes() != values.tobytes():
+        raise ValueError(f'Array of dtype {values.dtype.str} and shape {values.shape} is not decoded exactly')
+
+
+@contextmanager
+def setup_create(answer: Callable[[], ANSWER_TYPES]) -> Iterator[Callable[[], object]]:
+    """Benchmark converting an answer to a request object.
+
+    Args:
+        answer (Callable[[], ANSWER_TYPES]): Function that creates the answer.
+
+    Yields:
+        Callable[[], object]: Function to time.
+    """
+    obj = answer()
+    yield lambda: ObjectModel.create(obj)
+
+
+@contextmanager
+def setup_get(answer: Callable[[], ANSWER_TYPES]) -> Iterator[Callable[[], object]]:
+    """Benchmark decoding an answer from the parsed JSON of a request object.
+
+    Args:
+        answer (Callable[[], ANSWER_TYPES]): Function that creates the answer.
+
+    Yields:
+        Callable[[], object]: Function to time.
+    """
+    data = json.loads(ObjectModel.create(answer()).model_dump_json())
+    # A new object is created for every call, as objects only decode once
+    yield lambda: ObjectModel.lazy(data).get()
+
+
+@contextmanager
+def setup_dump(answer: Callable[[], ANSWER_TYPES]) -> Iterator[Callable[[], object]]:
+    """Benchmark serializing a verification request to JSON.
+
+    Args:
+        answer (Callable[[], ANSWER_TYPES]): Function that creates the answer.
+
+    Yields:
+        Callable[[], object]: Function to time.
+    """
+    request = VerificationRequest.create('benchmark', 'question', answer())
+    yield request.model_dump_json
+
+
+@contextmanager
+def setup_encode(array: Callable[[], np.ndarray], *, memmap: bool = False) -> Iterator[Callable[[], object]]:
+    """Benchmark encoding an array as raw buffer and decoding it again, after checking both are exact.
+
+    Args:
+        array (Callable[[], np.ndarray]): Function that creates the array.
+        memmap (bool, optional): Whether the array is memory-mapped from a file. Defaults to False.
+
+    Yields:
+        Callable[[], object]: Function to time.
+    """
+    # The file of a memory-mapped array cannot be removed while it is open on Windows
+    with TemporaryDirectory(ignore_cleanup_errors=True) as directory:
+        values = array()
+        if memmap:
+            mapped = np.lib.format.open_memmap(Path(directory) / 'array.npy', 'w+', values.dtype, values.shape)
+            mapped[...] = values
+            values = mapped
+
+        # Both the request object and its JSON are checked, as the JSON is what the server decodes
+        check_round_trip(values, ObjectModel.create(values).get())
+        check_round_trip(values, ObjectModel.lazy(json.loads(ObjectModel.create(values).model_dump_json())).get())
+        yield lambda: decode_array(check_isinstance(encode_array(values), dict))
+
+
+@contextmanager
+def setup_compress(answer: Callable[[], ANSWER_TYPES], codec: str, level: int) -> Iterator[Callable[[], object]]:
+    """Benchmark compressing the body of a verification request, of which the compressed size is reported.
+
+    Args:
+        answer (Callable[[], ANSWER_TYPES]): Function that creates the answer.
+        codec (str): Name of a codec in CODECS, or `identity` to not compress the body.
+        level (int): Compression level of the codec.
+
+    Yields:
+        Callable[[], object]: Function to time.
+    """
+    body = VerificationRequest.create('benchmark', 'question', answer()).model_dump_json().encode()
+    if codec == 'identity':
+        yield lambda: body
+    else:
+        yield partial(CODECS[codec](level).compress, body)
+
+
+@contextmanager
+def setup_parse(messages: int) -> Iterator[Callable[[], object]]:
+    """Benchmark parsing a verification response.
+
+    Args:
+        messages (int): Amount of error messages, every tenth of which has a DataFrame attached.
+
+    Yields:
+        Callable[[], object]: Function to time.
+    """
+    response = VerificationResponse()
+    for i in range(messages):
+        response.add_error(f'Error {i}', create_frame(100) if i % 10 == 0 else None)
+    content = response.model_dump_json().encode()
+    yield lambda: VerificationResponse.parse(content)
+
+
+@contextmanager
+def setup_query(rows: int, method: str = 'query') -> Iterator[Callable[[], object]]:
+    """Benchmark getting the result of a query as DataFrame.
+
+    Args:
+        rows (int): Amount of rows of the result.
+        method (str, optional): 'query' to get a single DataFrame, 'iter' to get a DataFrame per chunk of rows,
+            'categories' to also convert text columns to categories, or 'rows' to create the DataFrame from a list per
+            row, like queries did before the rows were passed to pandas as they are. Defaults to 'query'.
+
+    Yields:
+        Callable[[], object]: Function to time.
+    """
+    sql = 'SELECT * FROM items'
+
+    with TemporaryDirectory() as directory:
+        connection = DatabaseConnection(str(Path(directory, 'benchmark.db')))
+        df = create_frame(rows * FRAME_COLUMNS)
+        df['date'] = pd.Timestamp('2023-01-01').date()
+        df.to_sql('items', connection.engine, index_label='id')
+
+        def _rows() -> pd.DataFrame:
+            with connection.engine.connect() as sql_connection:
+                result = sql_connection.execute(text(sql))
+                return pd.DataFrame(columns=list(result.keys()), data=[list(row) for row in result])
+
+        try:
+            match method:
+                case 'iter':
+                    yield lambda: sum(len(chunk) for chunk in connection.query_iter(sql))
+                case 'categories':
+                    yield lambda: connection.query(sql, categories=True)
+                case 'rows':
+                    yield _rows
+                case _:
+                    yield lambda: connection.query(sql)
+        finally:
+            connection.engine.dispose()
+
+
+def import_times(statement: str) -> dict[str, float]:
+    """Run a statement in a new process, and get the cumulative import time of the modules it imports directly.
+
+    Args:
+        statement (str): Python statement.
+
+    Returns:
+        dict[str, float]: Seconds by name of the module, as reported by `python -X importtime`.
+    """
+    # The package is found like it is by this process, also when it is not installed
+    root = str(Path(__file__).resolve().parents[2])
+    env = {**os.environ, 'PYTHONPATH': os.pathsep.join(filter(None, (root, os.environ.get('PYTHONPATH'))))}
+    process = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', statement],  # noqa: S603
+        capture_output=True, check=True, text=True, env=env,
+    )
+
+    times: dict[str, float] = {}
+    for line in process.stderr.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        _, cumulative, name = line.split('|')
+        # Modules imported by other modules are indented, and included in the time of the importing module
+        if cumulative.strip().isdigit() and not name.startswith('  '):
+            times[name.strip()] = int(cumulative) / 1e6
+    return times
+
+
+@contextmanager
+def setup_import(statement: str) -> Iterator[Callable[[], float]]:
+    """Benchmark the time a statement takes to import modules, in a new process so nothing is imported yet.
+
+    Args:
+        statement (str): Python statement.
+
+    Yields:
+        Callable[[], float]: Function that measures the seconds.
+    """
+    # Modules imported while starting the interpreter are not imported by the statement
+    startup = set(import_times('pass'))
+    yield lambda: sum(seconds for name, seconds in import_times(statement).items() if name not in startup)
+
+
+def write_m03_resources(directory: Path, orders: int) -> None:
+    """Write synthetic resources of module 3.
+
+    Args:
+        directory (Path): Resource folder.
+        orders (int): Amount of orders, where there are a tenth as many customers and products.
+    """
+    rng = np.random.default_rng(SEED)
+    people = max(orders // 10, 1)
+    pd.DataFrame({
+        'id': np.arange(1, people + 1),
+        'first_name': [f'First {i}' for i in range(people)],
+        'last_name': [f'Last {i}' for i in range(people)],
+        'address': [f'Street {i}' for i in range(people)],
+    }).to_csv(directory / 'customers.csv', index=False)
+    pd.DataFrame({
+        'id': np.arange(1, people + 1),
+        'name': [f'Product {i}' for i in range(people)],
+        'price': rng.random(people).round(2) * 100,
+        'stock': rng.integers(0, 100, people),
+    }).to_csv(directory / 'products.csv', index=False)
+    dates = pd.Timestamp('2023-01-01') + pd.to_timedelta(rng.integers(0, 365, orders), unit='D')
+    pd.DataFrame({
+        'id': np.arange(1, orders + 1),
+        'customer_id': rng.integers(1, people + 1, orders),
+        'product_id': rng.integers(1, people + 1, orders),
+        'date': dates.strftime('%d/%m/%Y'),
+        'quantity': rng.integers(1, 10, orders),
+    }).to_csv(directory / 'orders.csv', index=False)
+
+
+@contextmanager
+def m03_directory(orders: int) -> Iterator[Path]:
+    """Create a working directory with the resources of module 3, and a temporary cache directory for templates.
+
+    NOTE: Resources are read relative to the working directory, which is changed until the context is exited.
+
+    Args:
+        orders (int): Amount of orders.
+
+    Yields:
+        Iterator[Path]: Working directory.
+    """
+    # Imported here, so only the benchmarks of module 3 import it
+    from datacademy.modules import Module03
+
+    with TemporaryDirectory() as directory:
+        resources = Path(directory, Module03.RESOURCE_FOLDER)
+        resources.mkdir()
+        write_m03_resources(resources, orders)
+
+        cwd = Path.cwd()
+        cache_dir = os.environ.get(CACHE_DIR_VARIABLE)
+        os.chdir(directory)
+        os.environ[CACHE_DIR_VARIABLE] = str(Path(directory, 'cache'))
+        try:
+            yield Path(directory)
+        finally:
+            os.chdir(cwd)
+            if cache_dir is None:
+                del os.environ[CACHE_DIR_VARIABLE]
+            else:
+                os.environ[CACHE_DIR_VARIABLE] = cache_dir
+
+
+def create_m03(directory: Path, *, template: bool = True) -> 'Module03':
+    """Create module 3, with its database in a directory created by `m03_directory`.
+
+    Args:
+        directory (Path): Working directory.
+        template (bool, optional): Whether the database is copied from a template. Defaults to True.
+
+    Returns:
+        Module03: Module 3.
+    """
+    from datacademy.modules import Module03
+
+    return Module03(
+        database_location=str(directory / 'database.db'), server_address='localhost', server_port=1,
+        notebook=False, template=template,
+    )
+
+
+@contextmanager
+def setup_m03(orders: int, *, template: bool) -> Iterator[Callable[[], object]]:
+    """Benchmark creating module 3, which populates its database from the resources or copies it from a template.
+
+    Args:
+        orders (int): Amount of orders.
+        template (bool): Whether the database is copied from a template, which is built before timing.
+
+    Yields:
+        Callable[[], object]: Function to time.
+    """
+    with m03_directory(orders) as directory:
+        if template:
+            create_m03(directory)
+        yield partial(create_m03, directory, template=template)
+
+
+def m03_content(module: 'Module03') -> dict[str, tuple[str, list[tuple]]]:
+    """Get the content of the database of module 3.
+
+    Args:
+        module (Module03): Module 3.
+
+    Returns:
+        dict[str, tuple[str, list[tuple]]]: SQL that created every object, with the rows of tables, by name.
+    """
+    with module.connection.engine.connect() as connection:
+        objects = connection.exec_driver_sql(
+            "SELECT type, name, sql FROM sqlite_master WHERE name NOT LIKE 'sqlite_%'",
+        ).fetchall()
+        return {
+            name: (sql, [] if kind != 'table' else list(
+                connection.exec_driver_sql(f'SELECT * FROM "{name}" ORDER BY rowid').fetchall(),  # noqa: S608
+            ))
+            for kind, name, sql in objects
+        }
+
+
+@contextmanager
+def setup_m03_reset(orders: int, statements: tuple[str, ...]) -> Iterator[Callable[[], object]]:
+    """Benchmark changing the database of module 3 like an exercise would, and resetting it.
+
+    Args:
+        orders (int): Amount of orders.
+        statements (tuple[str, ...]): SQL statements that change the database.
+
+    Raises:
+        ValueError: If the database is not the same as before it was changed, after it is reset.
+
+    Yields:
+        Callable[[], object]: Function to time.
+    """
+    with m03_directory(orders) as directory:
+        module = create_m03(directory)
+
+        def _change_and_reset() -> None:
+            # Not run with `query`, which prints a message for every statement
+            with module.connection.engine.begin() as connection:
+                for statement in statements:
+                    connection.exec_driver_sql(statement)
+            module.reset()
+
+        # Checked twice, as a reset that misses a change does not restore it the next time either
+        content = m03_content(module)
+        for _ in range(2):
+            _change_and_reset()
+            if m03_content(module) != content:
+                raise ValueError(f'Database of module 3 differs after resetting {statements}')
+        yield _change_and_reset
+
+
+for name, (answer, large) in ANSWERS.items():
+    register(f'objects.create.{name}', partial(setup_create, answer), large=large)
+    register(f'objects.get.{name}', partial(setup_get, answer), large=large)
+    register(f'request.dump.{name}', partial(setup_dump, answer), large=large)
+
+for name, array in ARRAYS.items():
+    register(f'array.encode.{name}', partial(setup_encode, array))
+register('array.encode.memmap', partial(setup_encode, ARRAYS['fortran'], memmap=True))
+
+for name in ('str', 'list', 'frame_1e3', 'frame_1e5'):
+    register(f'request.compress.identity.{name}', partial(setup_compress, ANSWERS[name][0], 'identity', 0), sized=True)
+    for codec in CODECS:
+        for level in COMPRESSION_LEVELS:
+            register(
+                f'request.compress.{codec}_{level}.{name}',
+                partial(setup_compress, ANSWERS[name][0], codec, level),
+                sized=True,
+            )
+
+for name, statement in IMPORTS.items():
+    register(f'imports.{name}', partial(setup_import, statement), measured=True)
+
+for messages in (1, 100):
+    register(f'response.parse.{messages}', partial(setup_parse, messages))
+
+for rows in (10 ** 3, 10 ** 5, 10 ** 6):
+    register(f'database.query.{rows}', partial(setup_query, rows), large=rows > 10 ** 5)
+    register(f'database.query_iter.{rows}', partial(setup_query, rows, 'iter'), large=rows > 10 ** 5)
+    for method in ('categories', 'rows'):
+        register(f'database.query.{method}.{rows}', partial(setup_query, rows, method), large=rows > 10 ** 5)
+
+for orders in (10 ** 3, 10 ** 4, 10 ** 5):
+    register(f'module03.populate.{orders}', partial(setup_m03, orders, template=False), large=orders > 10 ** 3)
+    register(f'module03.clone.{orders}', partial(setup_m03, orders, template=True), large=orders > 10 ** 4)
+
+for orders in (10 ** 3, 10 ** 5):
+    for name, statements in M03_CHANGES.items():
+        register(
+            f'module03.reset.{name}.{orders}', partial(setup_m03_reset, orders, statements), large=orders > 10 ** 3,
+        )
@@ -0,0 +1,300 @@
+"""Module containing the load test, which simulates a cohort of students checking their answers at the same time."""
+
+import argparse
+import asyncio
+import os
+from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import redirect_stdout
+from pathlib import Path
+from time import perf_counter, sleep
+from typing import Any, Literal
+
+import numpy as np
+import pandas as pd
+from pydantic import BaseModel
+
+from datacademy.checker.checker import Checker
+from datacademy.checker.instrumentation import Instrumentation
+from datacademy.checker.session import CheckerSession
+from datacademy.checker.types import ANSWER_TYPES
+
+DEFAULT_STUDENTS = 20
+"""Amount of simulated students."""
+
+DEFAULT_CHECKS = 10
+"""Amount of answers checked by every simulated student."""
+
+LOAD_MODULE = 'LOAD_TEST'
+"""Module identifier of the answers of simulated students."""
+
+LoadMode = Literal['threaded', 'async']
+"""Whether simulated students run in their own thread, or as tasks on a single event loop."""
+
+Workload = Callable[[int, int], tuple[str, ANSWER_TYPES]]
+"""Function that gets the question identifier and answer of a check, by student and number of the check."""
+
+
+def default_workload(student: int, check: int) -> tuple[str, ANSWER_TYPES]:
+    """Get the answers of a simulated student, which alternate between scalars, lists and DataFrames.
+
+    Args:
+        student (int): Number of the student.
+        check (int): Number of the check of the student.
+
+    Returns:
+        tuple[str, ANSWER_TYPES]: Question identifier and answer, which differs between students.
+    """
+    question = f'q{check}'
+    match check % 3:
+        case 0:
+            return question, student * 1000 + check
+        case 1:
+            return question, [student, check, *range(100)]
+        case _:
+            rng = np.random.default_rng(student * 1000 + check)
+            return question, pd.DataFrame(rng.random((100, 10)), columns=[f'column_{i}' for i in range(10)])
+
+
+class LoadReport(BaseModel):
+    """Pydantic model for the outcome of a load test."""
+
+    mode: LoadMode
+    """How the simulated students ran."""
+
+    students: int
+    """Amount of simulated students."""
+
+    checks: int
+    """Amount of answers that were checked."""
+
+    duration: float
+    """Seconds the load test took."""
+
+    throughput: float
+    """Checks per second."""
+
+    error_rate: float
+    """Fraction of checks that failed."""
+
+    outcomes: dict[str, int]
+    """Amount of checks by outcome."""
+
+    latency: dict[str, float]
+    """Mean and percentiles of the seconds per check, keyed like `p95`."""
+
+    bytes_sent: int
+    """Amount of bytes of request bodies sent."""
+
+
+class LoadTest:
+    """Class for a load test, where simulated students check answers with their own checker.
+
+    NOTE: Checkers in the same process share the health of the server, so once the server fails too often, checks of
+    all simulated students fail fast like they would for a single student.
+    """
+
+    def __init__(
+        self,
+        server_address: str,
+        server_port: int | None = None,
+        *,
+        students: int = DEFAULT_STUDENTS,
+        checks: int = DEFAULT_CHECKS,
+        mode: LoadMode = 'threaded',
+        workload: Workload = default_workload,
+        think_time: float = 0.0,
+        **options: Any  # noqa: ANN401
+    ) -> None:
+        """Create a new load test.
+
+        Args:
+            server_address (str): Address of the server.
+            server_port (int | None, optional): Port of the server, if a non-default port is used. Defaults to None.
+            students (int, optional): Amount of simulated students. Defaults to DEFAULT_STUDENTS.
+            checks (int, optional): Amount of answers checked by every student. Defaults to DEFAULT_CHECKS.
+            mode (LoadMode, optional): Whether students run in their own thread, or as tasks on a single event loop.
+                Defaults to 'threaded'.
+            workload (Workload, optional): Function that gets the answers of the students.
+                Defaults to default_workload.
+            think_time (float, optional): Seconds a student waits between checks. Defaults to 0.0.
+            **options (Any): Other arguments of the checkers, such as `timeout` or `compression`.
+        """
+        self.server_address = server_address
+        self.server_port = server_port
+        self.students = students
+        self.checks = checks
+        self.mode = mode
+        self.workload = workload
+        self.think_time = think_time
+        self.options = options
+
+    def run(self) -> LoadReport:
+        """Run the load test.
+
+        NOTE: The outcomes the checkers print are discarded.
+
+        Returns:
+            LoadReport: Outcome of the load test.
+        """
+        instrumentation = Instrumentation(capacity=self.students * self.checks)
+        checkers = [self.__create_checker(instrumentation) for _ in range(self.students)]
+
+        started = perf_counter()
+        with open(os.devnull, 'w') as devnull, redirect_stdout(devnull):  # noqa: PTH123
+            if self.mode == 'async':
+                asyncio.run(self.__run_async(checkers))
+            else:
+                self.__run_threaded(checkers)
+        duration = perf_counter() - started
+
+        # The asynchronous clients are closed by the event loop they belong to, at the end of the run
+        if self.mode != 'async':
+            for checker in checkers:
+                checker.close()
+
+        traces = instrumentation.traces()
+        outcomes: dict[str, int] = {}
+        for trace in traces:
+            outcomes[trace.outcome or 'none'] = outcomes.get(trace.outcome or 'none', 0) + 1
+        latency = instrumentation.summary().get('total', {})
+        latency.pop('count', None)
+
+        return LoadReport(
+            mode=self.mode,
+            students=self.students,
+            checks=len(traces),
+            duration=duration,
+            throughput=len(traces) / duration if duration > 0 else 0.0,
+            error_rate=outcomes.get('error', 0) / len(traces) if len(traces) > 0 else 0.0,
+            outcomes=outcomes,
+            latency=latency,
+            bytes_sent=sum(trace.bytes_sent for trace in traces),
+        )
+
+    def __create_checker(self, instrumentation: Instrumentation) -> Checker:
+        """Create the checker of a simulated student.
+
+        Args:
+            instrumentation (Instrumentation): Instrumentation shared by all students.
+
+        Returns:
+            Checker: Checker with its own connections and without caching, like that of a separate student.
+        """
+        options = {'cache': False, 'manifest': False, **self.options}
+        return Checker(
+            LOAD_MODULE,
+            server_address=self.server_address,
+            server_port=self.server_port,
+            notebook=False,
+            session=CheckerSession(),
+            instrumentation=instrumentation,
+            **options,
+        )
+
+    def __run_threaded(self, checkers: list[Checker]) -> None:
+        """Run every simulated student in its own thread.
+
+        Args:
+            checkers (list[Checker]): Checkers of the students.
+        """
+        def _student(student: int) -> None:
+            for check in range(self.checks):
+                checkers[student].check(*self.workload(student, check))
+                if self.think_time > 0:
+                    sleep(self.think_time)
+
+        with ThreadPoolExecutor(max_workers=len(checkers)) as executor:
+            # Results are collected so exceptions are raised
+            list(executor.map(_student, range(len(checkers))))
+
+    async def __run_async(self, checkers: list[Checker]) -> None:
+        """Run every simulated student as a task on the running event loop, closing the checkers afterwards.
+
+        Args:
+            checkers (list[Checker]): Checkers of the students.
+        """
+        async def _student(student: int) -> None:
+            for check in range(self.checks):
+                await checkers[student].acheck(*self.workload(student, check))
+                if self.think_time > 0:
+                    await asyncio.sleep(self.think_time)
+
+        try:
+            await asyncio.gather(*(_student(student) for student in range(len(checkers))))
+        finally:
+            await asyncio.gather(*(checker.aclose() for checker in checkers))
+
+
+def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
+    """Parse the command line arguments.
+
+    Args:
+        argv (Sequence[str] | None, optional): Arguments, those of the process if None. Defaults to None.
+
+    Returns:
+        argparse.Namespace: Parsed arguments.
+    """
+    parser = argparse.ArgumentParser(
+        prog='datacademy-benchmark load',
+        description='Simulate a cohort of students checking answers, against a local stand-in server by default.',
+    )
+    parser.add_argument('-n', '--students', type=int, default=DEFAULT_STUDENTS, help='amount of students')
+    parser.add_argument('-c', '--checks', type=int, default=DEFAULT_CHECKS, help='amount of checks per student')
+    parser.add_argument('-m', '--mode', choices=['threaded', 'async'], default='threaded', help='how students run')
+    parser.add_argument('--think-time', type=float, default=0.0, help='seconds a student waits between checks')
+    parser.add_argument('--address', help='address of a running server, instead of a local stand-in server')
+    parser.add_argument('--port', type=int, help='port of the running server')
+    parser.add_argument('--latency', type=float, default=0.0, help='seconds the stand-in server adds per request')
+    parser.add_argument('--jitter', type=float, default=0.0, help='maximum seconds randomly added to the latency')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='fraction of requests the stand-in fails')
+    parser.add_argument('--seed', type=int, help='seed of the random latency and errors of the stand-in server')
+    parser.add_argument('--retries', type=int, help='amount of retries of the checkers')
+    parser.add_argument('-o', '--output', help='path of the JSON file to save the report to')
+    return parser.parse_args(argv)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Run a load test.
+
+    Args:
+        argv (Sequence[str] | None, optional): Command line arguments, those of the process if None.
+            Defaults to None.
+
+    Returns:
+        int: Exit code.
+    """
+    args = parse_args(argv)
+    options = {} if args.retries is None else {'retries': args.retries}
+
+    if args.address is not None:
+        report = LoadTest(
+            args.address, args.port, students=args.students, checks=args.checks, mode=args.mode,
+            think_time=args.think_time, **options,
+        ).run()
+    else:
+        # Imported here, as the stand-in server is only needed when no server is given
+        from datacademy.server import LocalServer, StandInServer
+
+        server = StandInServer(latency=args.latency, jitter=args.jitter, error_rate=args.error_rate, seed=args.seed)
+        with LocalServer(server.app) as local:
+            report = LoadTest(
+                local.address, students=args.students, checks=args.checks, mode=args.mode,
+                think_time=args.think_time, **options,
+            ).run()
+        print(
+            f'Server: {server.requests} requests, {server.errors} injected errors, {server.uploads} uploads',
+        )
+
+    print(
+        f'{report.checks} checks by {report.students} students ({report.mode}) in {report.duration:.2f} s: '
+        f'{report.throughput:.1f} checks/s, {report.error_rate:.1%} errors',
+    )
+    latency = ', '.join(f'{name} {value * 1000:.1f} ms' for name, value in report.latency.items())
+    print(f'Latency: {latency}')
+    print('Outcomes: ' + ', '.join(f'{name} {count}' for name, count in report.outcomes.items()))
+
+    if args.output is not None:
+        Path(args.output).write_text(report.model_dump_json(indent=2), encoding='utf-8')
+    return 0
+
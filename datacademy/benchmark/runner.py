@@ -0,0 +1,236 @@
+"""Module containing the benchmark runner and the comparison of results against a baseline."""
+
+import platform
+import re
+import statistics
+from collections.abc import Callable, Iterable
+from contextlib import AbstractContextManager
+from datetime import datetime, timezone
+from pathlib import Path
+from timeit import Timer
+
+from pydantic import BaseModel
+
+from datacademy.util import check_isinstance
+
+DEFAULT_REPEAT = 5
+"""Amount of times every benchmark is timed."""
+
+DEFAULT_MIN_TIME = 0.2
+"""Minimum seconds of a single timing, for which fast benchmarks are called multiple times."""
+
+DEFAULT_TOLERANCE = 0.25
+"""Fraction by which a benchmark may be slower than the baseline before it counts as a regression."""
+
+BenchmarkSetup = Callable[[], AbstractContextManager[Callable[[], object]]]
+"""Function that prepares a benchmark, giving the function to time and cleaning up afterwards."""
+
+MeasureSetup = Callable[[], AbstractContextManager[Callable[[], float]]]
+"""Function that prepares a benchmark, giving a function that measures the seconds itself."""
+
+
+class BenchmarkCase:
+    """Class for a benchmark: a function that is timed, with preparation that is not timed."""
+
+    def __init__(
+        self,
+        name: str,
+        setup: BenchmarkSetup | MeasureSetup,
+        *,
+        large: bool = False,
+        measured: bool = False,
+        sized: bool = False
+    ) -> None:
+        """Create a new benchmark.
+
+        Args:
+            name (str): Name, of which dot-separated parts group related benchmarks, such as `objects.create.int`.
+            setup (BenchmarkSetup | MeasureSetup): Function that prepares the benchmark.
+            large (bool, optional): Whether the benchmark uses a lot of time or memory, so it is skipped by quick
+                runs. Defaults to False.
+            measured (bool, optional): Whether the function of the benchmark measures the seconds itself, such as
+                the import time reported by a new process, instead of being timed. Defaults to False.
+            sized (bool, optional): Whether the function of the benchmark returns bytes of which the size is reported,
+                such as a compressed request body. Defaults to False.
+        """
+        self.name = name
+        self.setup = setup
+        self.large = large
+        self.measured = measured
+        self.sized = sized
+
+    def run(self, repeat: int = DEFAULT_REPEAT, min_time: float = DEFAULT_MIN_TIME) -> 'BenchmarkResult':
+        """Time the benchmark.
+
+        Args:
+            repeat (int, optional): Amount of times the benchmark is timed. Defaults to DEFAULT_REPEAT.
+            min_time (float, optional): Minimum seconds of a single timing. Defaults to DEFAULT_MIN_TIME.
+
+        Returns:
+            BenchmarkResult: Seconds per call of every timing, with the size of the result if the benchmark is sized.
+        """
+        if self.measured:
+            with self.setup() as measure:
+                times = [check_isinstance(measure(), float) for _ in range(repeat)]
+            return BenchmarkResult(name=self.name, number=1, times=times)
+
+        with self.setup() as function:
+            timer = Timer(function)
+            # Calibrate how often the function is called per timing, which also warms up caches
+            number = 1
+            while (elapsed := timer.timeit(number)) < min_time:
+                number *= 10 if elapsed < min_time / 10 else 2
+            times = [elapsed / number] + [timer.timeit(number) / number for _ in range(repeat - 1)]
+            size = len(check_isinstance(function(), bytes)) if self.sized else None
+        return BenchmarkResult(name=self.name, number=number, times=times, size=size)
+
+
+class BenchmarkResult(BaseModel):
+    """Pydantic model for the timings of a benchmark."""
+
+    name: str
+    """Name of the benchmark."""
+
+    number: int
+    """Amount of calls per timing."""
+
+    times: list[float]
+    """Seconds per call of every timing."""
+
+    size: int | None = None
+    """Amount of bytes returned by a sized benchmark, such as a compressed request body."""
+
+    @property
+    def best(self) -> float:
+        """Seconds per call of the fastest timing, which is the least affected by other processes."""
+        return min(self.times)
+
+    @property
+    def median(self) -> float:
+        """Median seconds per call."""
+        return statistics.median(self.times)
+
+
+class BenchmarkReport(BaseModel):
+    """Pydantic model for the results of a benchmark run, as saved to JSON."""
+
+    created: datetime
+    """Time at which the benchmarks were run."""
+
+    python: str
+    """Python version the benchmarks were run with."""
+
+    machine: str
+    """Description of the machine the benchmarks were run on, as baselines only compare well on the same machine."""
+
+    results: dict[str, BenchmarkResult] = {}
+    """Results by name of the benchmark."""
+
+    @staticmethod
+    def create(results: Iterable[BenchmarkResult]) -> 'BenchmarkReport':
+        """Create a new report for results of this machine.
+
+        Args:
+            results (Iterable[BenchmarkResult]): Results.
+
+        Returns:
+            BenchmarkReport: Report.
+        """
+        return BenchmarkReport(
+            created=datetime.now(tz=timezone.utc),
+            python=platform.python_version(),
+            machine=f'{platform.system()} {platform.machine()} {platform.processor()}'.strip(),
+            results={result.name: result for result in results},
+        )
+
+    @staticmethod
+    def load(path: str | Path) -> 'BenchmarkReport':
+        """Load a report from a JSON file.
+
+        Args:
+            path (str | Path): Path of the file.
+
+        Returns:
+            BenchmarkReport: Report.
+        """
+        return BenchmarkReport.model_validate_json(Path(path).read_bytes())
+
+    def save(self, path: str | Path) -> None:
+        """Save this report to a JSON file.
+
+        Args:
+            path (str | Path): Path of the file.
+        """
+        Path(path).write_text(self.model_dump_json(indent=2), encoding='utf-8')
+
+
+class BenchmarkComparison(BaseModel):
+    """Pydantic model for the comparison of a benchmark against the baseline."""
+
+    name: str
+    """Name of the benchmark."""
+
+    baseline: float
+    """Seconds per call of the fastest timing of the baseline."""
+
+    current: float
+    """Seconds per call of the fastest timing of the current run."""
+
+    @property
+    def ratio(self) -> float:
+        """Seconds of the current run relative to the baseline, where more than 1 is slower."""
+        return self.current / self.baseline if self.baseline > 0 else float('inf')
+
+    def is_regression(self, tolerance: float = DEFAULT_TOLERANCE) -> bool:
+        """Get whether the benchmark is slower than the baseline, by more than the tolerance.
+
+        Args:
+            tolerance (float, optional): Fraction by which the benchmark may be slower. Defaults to DEFAULT_TOLERANCE.
+
+        Returns:
+            bool: True if it is slower, False otherwise.
+        """
+        return self.ratio > 1 + tolerance
+
+
+def select_cases(
+    cases: Iterable[BenchmarkCase],
+    pattern: str | None = None,
+    *,
+    quick: bool = False
+) -> list[BenchmarkCase]:
+    """Select the benchmarks to run.
+
+    Args:
+        cases (Iterable[BenchmarkCase]): Benchmarks.
+        pattern (str | None, optional): Regular expression that the names of the benchmarks must contain, all
+            benchmarks if None. Defaults to None.
+        quick (bool, optional): Whether to skip large benchmarks. Defaults to False.
+
+    Returns:
+        list[BenchmarkCase]: Selected benchmarks.
+    """
+    regex = None if pattern is None else re.compile(pattern)
+    return [
+        case for case in cases
+        if (regex is None or regex.search(case.name) is not None) and not (quick and case.large)
+    ]
+
+
+def compare_reports(report: BenchmarkReport, baseline: BenchmarkReport) -> list[BenchmarkComparison]:
+    """Compare the results of a report against a baseline.
+
+    NOTE: Benchmarks that are missing from either report are not compared.
+
+    Args:
+        report (BenchmarkReport): Report of the current run.
+        baseline (BenchmarkReport): Report of the baseline.
+
+    Returns:
+        list[BenchmarkComparison]: Comparisons, in the order of the current report.
+    """
+    return [
+        BenchmarkComparison(name=name, baseline=baseline.results[name].best, current=result.best)
+        for name, result in report.results.items()
+        if name in baseline.results
+    ]
@@ -1,8 +1,37 @@
 """Module containing the checker, corresponding pydantic models and the supportive classes."""
 
-from .checker import DEFAULT_ADDRESS, DEFAULT_TIMEOUT, DEFAULT_URL, Checker
-from .request import VerificationRequest
-from .response import VerificationMessage, VerificationResponse
+from .checker import DEFAULT_ADDRESS, DEFAULT_CONCURRENCY, DEFAULT_TIMEOUT, DEFAULT_URL, Checker
+from .compression import DEFAULT_CODEC, DEFAULT_COMPRESSION_THRESHOLD, Codec, get_codec, register_codec
+from .digest import content_digest
+from .instrumentation import CheckTrace, Instrumentation, JsonLinesExporter
+from .manifest import ManifestLoader, QuestionManifest, QuestionSpec
+from .outbox import (
+    DEFAULT_FLUSH_INTERVAL,
+    DEFAULT_MAX_ATTEMPTS,
+    DEFAULT_OUTBOX_BATCH_SIZE,
+    Outbox,
+    QueuedVerification,
+)
+from .request import VerificationBatchRequest, VerificationDigestRequest, VerificationRequest
+from .resilience import DEFAULT_RETRIES, CircuitOpenError, RetryPolicy, ServerHealth
+from .response import (
+    VerificationBatchResponse,
+    VerificationDigestResponse,
+    VerificationMessage,
+    VerificationResponse,
+)
+from .session import DEFAULT_IDLE_TIMEOUT, DEFAULT_POOL_SIZE, CheckerSession
+from .stream import DEFAULT_STREAM_THRESHOLD
 
-__all__ = ['Checker', 'DEFAULT_ADDRESS', 'DEFAULT_TIMEOUT', 'DEFAULT_URL']
+__all__ = ['Checker', 'DEFAULT_ADDRESS', 'DEFAULT_CONCURRENCY', 'DEFAULT_TIMEOUT', 'DEFAULT_URL']
 __all__ += ['VerificationRequest', 'VerificationResponse', 'VerificationMessage']
+__all__ += ['VerificationBatchRequest', 'VerificationBatchResponse']
+__all__ += ['CheckerSession', 'DEFAULT_IDLE_TIMEOUT', 'DEFAULT_POOL_SIZE']
+__all__ += ['Codec', 'DEFAULT_CODEC', 'DEFAULT_COMPRESSION_THRESHOLD', 'get_codec', 'register_codec']
+__all__ += ['DEFAULT_STREAM_THRESHOLD']
+__all__ += ['CircuitOpenError', 'DEFAULT_RETRIES', 'RetryPolicy', 'ServerHealth']
+__all__ += ['DEFAULT_FLUSH_INTERVAL', 'DEFAULT_OUTBOX_BATCH_SIZE', 'Outbox', 'QueuedVerification']
+__all__ += ['DEFAULT_MAX_ATTEMPTS']
+__all__ += ['VerificationDigestRequest', 'VerificationDigestResponse', 'content_digest']
+__all__ += ['ManifestLoader', 'QuestionManifest', 'QuestionSpec']
+__all__ += ['CheckTrace', 'Instrumentation', 'JsonLinesExporter']
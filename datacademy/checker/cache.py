@@ -0,0 +1,270 @@
+"""Module containing the local cache of verification results."""
+
+import hashlib
+import json
+from collections import OrderedDict
+from pathlib import Path
+from threading import Lock
+from time import time
+from typing import ClassVar
+
+from .response import VerificationResponse
+
+DEFAULT_CACHE_SIZE = 256
+"""Maximum amount of verification results kept in memory."""
+
+DEFAULT_CACHE_TTL = 3600.0
+"""Seconds for which a cached verification result is used."""
+
+DEFAULT_DISK_CACHE_SIZE = 64 * 1024 * 1024
+"""Maximum amount of bytes of verification results kept on disk."""
+
+CacheKey = tuple[str, str, str, str]
+"""Key of a cached verification result: server, module, question and digest of the answer."""
+
+
+class ResultCache:
+    """Class to cache verification results, keyed by the content of the answer."""
+
+    __shared: ClassVar['ResultCache | None'] = None
+    __shared_lock = Lock()
+
+    def __init__(
+        self,
+        *,
+        max_entries: int = DEFAULT_CACHE_SIZE,
+        ttl: float = DEFAULT_CACHE_TTL,
+        directory: str | Path | None = None,
+        max_disk_size: int = DEFAULT_DISK_CACHE_SIZE
+    ) -> None:
+        """Create a new cache.
+
+        Args:
+            max_entries (int, optional): Maximum amount of results kept in memory. Defaults to DEFAULT_CACHE_SIZE.
+            ttl (float, optional): Seconds for which a result is used. Defaults to DEFAULT_CACHE_TTL.
+            directory (str | Path | None, optional): Directory to persist results in, only kept in memory if None.
+                Defaults to None.
+            max_disk_size (int, optional): Maximum amount of bytes of results kept on disk.
+                Defaults to DEFAULT_DISK_CACHE_SIZE.
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.directory = None if directory is None else Path(directory)
+        self.max_disk_size = max_disk_size
+
+        self.__entries: OrderedDict[CacheKey, tuple[float, VerificationResponse]] = OrderedDict()
+        self.__lock = Lock()
+
+        if self.directory is not None:
+            self.directory.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def digest(data: str | bytes) -> str:
+        """Compute a stable digest of a serialized answer.
+
+        Args:
+            data (str | bytes): Serialized answer.
+
+        Returns:
+            str: Hexadecimal digest.
+        """
+        return hashlib.sha256(data.encode() if isinstance(data, str) else data).hexdigest()
+
+    def get(self, module: str, question: str, digest: str, *, server: str = '') -> VerificationResponse | None:
+        """Get a cached verification result.
+
+        Args:
+            module (str): Module identifier.
+            question (str): Question identifier.
+            digest (str): Digest of the answer.
+            server (str, optional): URL of the server that verified the answer, as servers can differ in their
+                results. Defaults to ''.
+
+        Returns:
+            VerificationResponse | None: Cached verification result, None if there is none or if it expired.
+        """
+        key = (server, module, question, digest)
+        with self.__lock:
+            entry = self.__entries.get(key)
+            if entry is None:
+                entry = self.__load(key)
+                if entry is None:
+                    return None
+                self.__remember(key, entry)
+
+            created, response = entry
+            if time() - created > self.ttl:
+                self.__forget(key)
+                return None
+
+            self.__entries.move_to_end(key)
+            return response
+
+    def put(
+        self,
+        module: str,
+        question: str,
+        digest: str,
+        response: VerificationResponse,
+        *,
+        server: str = ''
+    ) -> None:
+        """Cache a verification result.
+
+        Args:
+            module (str): Module identifier.
+            question (str): Question identifier.
+            digest (str): Digest of the answer.
+            response (VerificationResponse): Verification result.
+            server (str, optional): URL of the server that verified the answer. Defaults to ''.
+        """
+        key = (server, module, question, digest)
+        entry = (time(), response)
+        with self.__lock:
+            self.__remember(key, entry)
+            self.__store(key, entry)
+
+    def invalidate(self, module: str | None = None, question: str | None = None) -> None:
+        """Remove cached verification results.
+
+        Args:
+            module (str | None, optional): Only remove results of this module. Defaults to None.
+            question (str | None, optional): Only remove results of this question. Defaults to None.
+        """
+        def _matches(key: CacheKey) -> bool:
+            return (module is None or key[1] == module) and (question is None or key[2] == question)
+
+        with self.__lock:
+            for key in [key for key in self.__entries if _matches(key)]:
+                del self.__entries[key]
+
+            for path in self.__files():
+                try:
+                    stored = json.loads(path.read_bytes())
+                    key = (stored['server'], stored['module'], stored['question'], stored['digest'])
+                except (OSError, ValueError, KeyError):
+                    key = None
+                if key is None or _matches(key):
+                    path.unlink(missing_ok=True)
+
+    def clear(self) -> None:
+        """Remove all cached verification results."""
+        self.invalidate()
+
+    def __remember(self, key: CacheKey, entry: tuple[float, VerificationResponse]) -> None:
+        """Keep a verification result in memory, evicting the least recently used results if needed.
+
+        Args:
+            key (CacheKey): Key of the result.
+            entry (tuple[float, VerificationResponse]): Creation time and verification result.
+        """
+        self.__entries[key] = entry
+        self.__entries.move_to_end(key)
+        while len(self.__entries) > self.max_entries:
+            self.__entries.popitem(last=False)
+
+    def __forget(self, key: CacheKey) -> None:
+        """Remove a verification result from memory and disk.
+
+        Args:
+            key (CacheKey): Key of the result.
+        """
+        self.__entries.pop(key, None)
+        path = self.__path(key)
+        if path is not None:
+            path.unlink(missing_ok=True)
+
+    def __path(self, key: CacheKey) -> Path | None:
+        """Get the path where a verification result is persisted.
+
+        Args:
+            key (CacheKey): Key of the result.
+
+        Returns:
+            Path | None: Path, None if results are not persisted.
+        """
+        if self.directory is None:
+            return None
+        return self.directory / f'{self.digest(json.dumps(key))}.json'
+
+    def __files(self) -> list[Path]:
+        """Get the files of all persisted verification results.
+
+        Returns:
+            list[Path]: Files.
+        """
+        if self.directory is None:
+            return []
+        return list(self.directory.glob('*.json'))
+
+    def __load(self, key: CacheKey) -> tuple[float, VerificationResponse] | None:
+        """Load a persisted verification result.
+
+        Args:
+            key (CacheKey): Key of the result.
+
+        Returns:
+            tuple[float, VerificationResponse] | None: Creation time and verification result, None if not persisted.
+        """
+        path = self.__path(key)
+        if path is None or not path.is_file():
+            return None
+
+        try:
+            stored = json.loads(path.read_bytes())
+            return stored['created'], VerificationResponse.lazy(stored['response'])
+        except (OSError, ValueError, KeyError):
+            path.unlink(missing_ok=True)
+            return None
+
+    def __store(self, key: CacheKey, entry: tuple[float, VerificationResponse]) -> None:
+        """Persist a verification result, evicting the oldest results if the disk cache becomes too large.
+
+        Args:
+            key (CacheKey): Key of the result.
+            entry (tuple[float, VerificationResponse]): Creation time and verification result.
+        """
+        path = self.__path(key)
+        if path is None:
+            return
+
+        server, module, question, digest = key
+        created, response = entry
+        stored = {
+            'server': server,
+            'module': module,
+            'question': question,
+            'digest': digest,
+            'created': created,
+            'response': response.model_dump(mode='json'),
+        }
+        try:
+            path.write_text(json.dumps(stored), encoding='utf-8')
+        except OSError:
+            return
+
+        # Files may be removed by other processes sharing this directory in the meantime
+        stats = []
+        for file in self.__files():
+            try:
+                stats.append((file, file.stat()))
+            except OSError:
+                continue
+
+        total_size = 0
+        for file, stat in sorted(stats, key=lambda item: item[1].st_mtime, reverse=True):
+            total_size += stat.st_size
+            if total_size > self.max_disk_size:
+                file.unlink(missing_ok=True)
+
+    @classmethod
+    def shared(cls) -> 'ResultCache':
+        """Get the in-memory cache that is shared by all checkers in this process.
+
+        Returns:
+            ResultCache: Shared cache.
+        """
+        with cls.__shared_lock:
+            if cls.__shared is None:
+                cls.__shared = ResultCache()
+            return cls.__shared
@@ -1,19 +1,45 @@
 """Module containing the checker class."""
 
+import asyncio
 import json
-from collections.abc import Collection
+import sys
+from asyncio import AbstractEventLoop
+from collections.abc import Collection, Iterable, Iterator
 from datetime import datetime
-from typing import TypeVar
+from pathlib import Path
+from threading import Lock
+from time import monotonic, sleep
+from types import TracebackType
+from typing import TYPE_CHECKING, TypeVar
 
 import pandas as pd
 import requests
-from IPython.display import display
 from requests import Response
+from urllib3.exceptions import NewConnectionError
 
+from datacademy.util import check_isinstance, iterate_async, run_sync
 from datacademy.util.animation import TextAnimation
 
-from .request import VerificationRequest
-from .response import VerificationMessage, VerificationResponse
+from .cache import ResultCache
+from .compression import DEFAULT_CODEC, DEFAULT_COMPRESSION_THRESHOLD, Codec, get_codec
+from .digest import content_digest
+from .discovery import DISCOVERY_ADDRESS, DISCOVERY_TIMEOUT, ServerDiscovery
+from .instrumentation import CheckTrace, Instrumentation, activate, add_bytes, count_sent, span
+from .manifest import MANIFEST_URL, ManifestLoader
+from .outbox import Outbox, QueuedVerification
+from .request import VerificationDigestRequest
+from .resilience import DEFAULT_RETRIES, RETRY_STATUS_CODES, CircuitOpenError, RetryPolicy, ServerHealth
+from .response import (
+    VerificationBatchResponse,
+    VerificationDigestResponse,
+    VerificationMessage,
+    VerificationResponse,
+)
+from .session import CheckerSession
+from .stream import DEFAULT_STREAM_THRESHOLD, RequestBody
+
+if TYPE_CHECKING:
+    import httpx
 
 T = TypeVar('T', float, int, datetime, str, list, dict, pd.DataFrame)
 """Type variable for supported data types to send."""
@@ -24,17 +50,53 @@ DEFAULT_ADDRESS = 'localhost'
 DEFAULT_URL = '/verify'
 """URL at address where verification requests should be sent."""
 
+BATCH_URL = '/batch'
+"""URL relative to the verification endpoint where batches of verification requests should be sent."""
+
+DIGEST_URL = '/digest'
+"""URL relative to the verification endpoint where digests of answers should be sent."""
+
 DEFAULT_TIMEOUT = 30.0
 """Seconds before checking request will time out."""
 
+DEFAULT_CONCURRENCY = 8
+"""Maximum amount of answers that are checked at the same time by `check_many`."""
+
+HEADERS = {'Content-Type': 'application/json'}
+"""Headers to send with verification requests."""
+
 ERROR = '🔴 ERROR:'
 """Start of error message."""
 
+QUEUED = '🟡 QUEUED:'
+"""Start of message for answers that are checked once the server is available again."""
+
+LEGACY_STATUS_CODES = frozenset({400, 415, 422})
+"""Status codes of servers that reject the compact encodings or compression, after which they are no longer used."""
+
+CONNECTION_ERRORS = (TimeoutError, ConnectionError, requests.ConnectionError, requests.Timeout)
+"""Errors raised when a verification request could not be sent, after which answers can be queued."""
+
+
+def httpx_errors(*names: str) -> tuple[type[Exception], ...]:
+    """Get errors of httpx by name, without importing it.
+
+    NOTE: httpx is only imported for asynchronous checks, so its errors cannot be raised before it is imported.
+
+    Args:
+        *names (str): Names of the errors, such as `TransportError`.
+
+    Returns:
+        tuple[type[Exception], ...]: Errors, none if httpx is not imported.
+    """
+    httpx = sys.modules.get('httpx')
+    return () if httpx is None else tuple(getattr(httpx, name) for name in names)
+
 
 class Checker:
     """Class that can be used at the Datacademy user to check the answers."""
 
-    def __init__(
+    def __init__(  # noqa: PLR0913
         self,
         module: str,
         *,
@@ -42,7 +104,17 @@ class Checker:
         server_port: int | None = None,
         server_url: str = DEFAULT_URL,
         timeout: float = DEFAULT_TIMEOUT,
-        notebook: bool = True
+        notebook: bool = True,
+        session: CheckerSession | None = None,
+        cache: ResultCache | bool = True,
+        compression: Codec | str | None = DEFAULT_CODEC,
+        compression_threshold: int = DEFAULT_COMPRESSION_THRESHOLD,
+        stream_threshold: int | None = DEFAULT_STREAM_THRESHOLD,
+        retries: int = DEFAULT_RETRIES,
+        outbox: Outbox | str | Path | None = None,
+        digest_first: bool = False,
+        manifest: bool = True,
+        instrumentation: Instrumentation | None = None
     ) -> None:
         """Create a new Checker.
 
@@ -51,27 +123,152 @@ class Checker:
             server_address (str, optional): Address of the server. Defaults to DEFAULT_ADDRESS.
             server_port (int | None, optional): Port of the server, if a non-default port is used. Defaults to None.
             server_url (str, optional): URL from address[:port] to verification endpoint. Defaults to DEFAULT_URL.
-            timeout (float, optional): Seconds before a checking request will time out. Defaults to DEFAULT_TIMEOUT.
+            timeout (float, optional): Seconds before a checking request will time out, where only the time to connect
+                is lowered to fit the latency of the server once it is known. Defaults to DEFAULT_TIMEOUT.
             notebook (bool, optional): Whether this checker is run in a notebook. Defaults to True.
+            session (CheckerSession | None, optional): Connection pool to use, which is closed with this checker.
+                Defaults to the session shared by all checkers in this process, which is not.
+            cache (ResultCache | bool, optional): Cache of verification results, where True uses the in-memory cache
+                shared by all checkers in this process and False disables caching. Defaults to True.
+            compression (Codec | str | None, optional): Codec, or name of a registered codec, to compress large
+                request bodies with. None disables compression. Defaults to DEFAULT_CODEC.
+                NOTE: Once the server rejects a compressed request, or a DataFrame or array in a compact encoding,
+                the request is sent once more without them, and they are no longer used by this checker.
+            compression_threshold (int, optional): Minimum amount of bytes of a request body before it is
+                compressed. Defaults to DEFAULT_COMPRESSION_THRESHOLD.
+            stream_threshold (int | None, optional): Minimum amount of bytes of a DataFrame or array answer before its
+                request is serialized while it is sent, instead of at once. None disables streaming.
+                Defaults to DEFAULT_STREAM_THRESHOLD.
+            retries (int, optional): Amount of times a request that could not connect or got a response of an
+                unavailable server is retried, with exponential backoff. Requests that failed after connecting are not
+                retried, as the server may have received them. Defaults to DEFAULT_RETRIES.
+            outbox (Outbox | str | Path | None, optional): Outbox, or path of its database, to queue answers in when
+                the server is unavailable. None disables queueing. Defaults to None.
+            digest_first (bool, optional): Whether to send the digest of an answer first, and only send the answer
+                itself if the server does not know the result for it yet. Defaults to False.
+            manifest (bool, optional): Whether to reject structurally wrong answers without sending them, using the
+                manifest of the module that is cached locally and refreshed in the background from the first check
+                on. Defaults to True.
+            instrumentation (Instrumentation | None, optional): Instrumentation to record the duration of the steps
+                and the amount of bytes of every check with. None disables instrumentation. Defaults to None.
         """
         self.module = module
         self.notebook = notebook
         self.timeout = timeout
-
-        try:
-            response = requests.get('https://proddatacademyapi.azurewebsites.net/', timeout=60)
-            response.raise_for_status()  # Raise an HTTPError for bad responses (4xx and 5xx)
-            # If the request was successful, store the URL in a variable
-            server_address = 'https://proddatacademyapi.azurewebsites.net'
-        except requests.exceptions.RequestException as e:
-            print(f'Error accessing server: {e}')
+        self.session = CheckerSession.shared() if session is None else session
+        # The shared session is used by other checkers too, so it is never closed by this one
+        self.__owns_session = self.session is not CheckerSession.shared()
+        self.cache = cache if isinstance(cache, ResultCache) else ResultCache.shared() if cache else None
+        self.compression = get_codec(compression) if isinstance(compression, str) else compression
+        # Set once the server rejects a request in a compact encoding or compressed, as it may not support them yet
+        self.__legacy = False
+        self.compression_threshold = compression_threshold
+        self.stream_threshold = stream_threshold
+        self.retry = RetryPolicy(retries)
+        self.digest_first = digest_first
+        self.instrumentation = instrumentation
 
         if server_address == 'localhost':
             server_address = 'http://127.0.0.1'
-        elif not server_address.startswith('https://'):
+        elif not server_address.startswith(('https://', 'http://')):
             server_address = 'https://' + server_address
 
-        self.url = server_address + ('' if server_port is None else f':{server_port}') + server_url
+        self.server_url = server_url
+        self.__async_client: 'httpx.AsyncClient | None' = None
+        self.__async_loop: AbstractEventLoop | None = None
+
+        # The manifest is loaded in another thread, which can resolve the URL at the same time as this one
+        self.__url_lock = Lock()
+        self.__url: str | None = server_address + ('' if server_port is None else f':{server_port}') + server_url
+
+        # Only the default address is replaced by the hosted API, which is probed without blocking
+        self.__discovery: ServerDiscovery | None = None
+        if server_address == 'http://127.0.0.1' and server_port is None:
+            self.__fallback_url, self.__url = self.__url, None
+            self.__discovery = ServerDiscovery.start(DISCOVERY_ADDRESS, self.session)
+
+        # Loaded on the first check, so creating a checker does not contact the server or use the cache directory
+        self.__manifest_enabled = manifest
+        self.__manifest_lock = Lock()
+        self.__manifest: ManifestLoader | None = None
+
+        self.outbox: Outbox | None = None
+        if outbox is not None:
+            self.enable_outbox(outbox)
+
+    @property
+    def url(self) -> str:
+        """URL of the verification endpoint.
+
+        NOTE: Blocks until the hosted API is probed, if this has not finished yet.
+        """
+        with self.__url_lock:
+            if self.__url is None and self.__discovery is not None:
+                if self.__discovery.wait(DISCOVERY_TIMEOUT):
+                    self.__url = DISCOVERY_ADDRESS + self.server_url
+                else:
+                    print(f'Error accessing server: {self.__discovery.error or "probe timed out"}')
+                    self.__url = self.__fallback_url
+            return check_isinstance(self.__url, str)
+
+    @url.setter
+    def url(self, url: str) -> None:
+        with self.__url_lock:
+            self.__url = url
+
+    def enable_outbox(self, outbox: Outbox | str | Path) -> Outbox:
+        """Queue answers when the server is unavailable, which are checked in the background once it is available.
+
+        NOTE: Answers that are still queued from before are sent right away.
+
+        Args:
+            outbox (Outbox | str | Path): Outbox, or path of its database.
+
+        Returns:
+            Outbox: Outbox.
+        """
+        self.outbox = outbox if isinstance(outbox, Outbox) else Outbox(outbox)
+        if len(self.outbox) > 0:
+            self.outbox.start(self.__flush)
+        return self.outbox
+
+    def show_queued(self) -> None:
+        """Show the results of queued answers of this module that have been checked since they were last shown."""
+        if self.outbox is None:
+            return
+
+        for result in self.outbox.results(self.module):
+            print(f'{result.question}:')
+            if result.response is not None:
+                self.__print_response(result.response)
+            else:
+                self.__print_error(result.error or 'Unknown error')
+
+        waiting = len(self.outbox)
+        if waiting > 0:
+            print(QUEUED, f'{waiting} answer(s) are waiting until the server is available again.')
+
+    def close(self) -> None:
+        """Close the pooled connections of this checker, unless it uses the session shared by all checkers."""
+        if self.__owns_session:
+            self.session.close()
+
+    def __enter__(self) -> 'Checker':
+        """Enter the context of this checker.
+
+        Returns:
+            Checker: This checker.
+        """
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None
+    ) -> None:
+        """Exit the context of this checker, closing its pooled connections."""
+        self.close()
 
     def check(
         self,
@@ -87,23 +284,411 @@ class Checker:
         Raises:
             TypeError: If a non-JSON related type error occurs.
         """
+        trace = self.__start_trace(question)
+        with activate(trace):
+            try:
+                outcome = self.__verify(question, answer)
+            except (TimeoutError, ConnectionError, requests.RequestException, NotImplementedError, TypeError) as error:
+                outcome = self.__describe_error(answer, error)
+                self.__print_error(outcome)
+            else:
+                with span('render'):
+                    self.__print_outcome(answer, outcome)
+
+        self.__finish_trace(trace, outcome)
+
+    async def acheck(self, question: str, answer: T) -> None:
+        """Check an answer without blocking the event loop.
+
+        Args:
+            question (str): Question identifier.
+            answer (T): The answer.
+        """
+        await self.acheck_many([(question, answer)], concurrency=1, headers=False)
+
+    def check_many(self, answers: Iterable[tuple[str, T]], concurrency: int = DEFAULT_CONCURRENCY) -> None:
+        """Check multiple answers concurrently. Results are shown in the order of the answers.
+
+        Args:
+            answers (Iterable[tuple[str, T]]): Pairs of question identifier and answer.
+            concurrency (int, optional): Maximum amount of answers checked at the same time.
+                Defaults to DEFAULT_CONCURRENCY.
+        """
+        async def _check_many() -> None:
+            try:
+                await self.acheck_many(answers, concurrency=concurrency)
+            finally:
+                # The event loop is discarded afterwards, and so is its client
+                await self.__close_async_client()
+
+        run_sync(_check_many())
+
+    async def acheck_many(
+        self,
+        answers: Iterable[tuple[str, T]],
+        concurrency: int = DEFAULT_CONCURRENCY,
+        *,
+        headers: bool = True
+    ) -> None:
+        """Check multiple answers concurrently without blocking the event loop.
+
+        Args:
+            answers (Iterable[tuple[str, T]]): Pairs of question identifier and answer.
+            concurrency (int, optional): Maximum amount of answers checked at the same time.
+                Defaults to DEFAULT_CONCURRENCY.
+            headers (bool, optional): Whether to print the question identifier before each result. Defaults to True.
+        """
+        answers = list(answers)
+        # Resolving the URL may wait for the discovery of the server
+        url = await asyncio.to_thread(getattr, self, 'url')
+        client = self.__get_async_client()
+        semaphore = asyncio.Semaphore(concurrency)
+
+        traces = [self.__start_trace(question) for question, _ in answers]
+
+        async def _check(
+            question: str,
+            answer: T,
+            trace: CheckTrace | None
+        ) -> VerificationResponse | QueuedVerification | str:
+            async with semaphore:
+                # Every task runs in a copy of the context, so the trace is only active for this answer
+                with activate(trace):
+                    return await _verify(question, answer)
+
+        async def _verify(question: str, answer: T) -> VerificationResponse | QueuedVerification | str:
+            try:
+                rejected = self.__prevalidate(question, answer)
+                if rejected is not None:
+                    return rejected
+
+                digest, size = self.__digest(answer)
+                cached = self.__lookup(question, digest)
+                if cached is not None:
+                    return cached
+
+                return await self.__arequest_verification(client, url, question, answer, digest, size)
+            except (ConnectionError, *httpx_errors('TransportError'), NotImplementedError, TypeError) as error:
+                return self.__describe_error(answer, error)
+
+        animation = TextAnimation(self.__animation, frequency=4)
         try:
-            response = self.__request_verification(question, answer)
-        except TimeoutError:
-            self.__print_error('Checking the answer timed out.')
-            return
-        except NotImplementedError:
-            self.__print_error(f'Answer of type {type(answer)} is not supported!')
+            animation.start()
+            outcomes = await asyncio.gather(*(
+                _check(question, answer, trace) for (question, answer), trace in zip(answers, traces, strict=True)
+            ))
+        finally:
+            animation.stop()
+
+        for (question, answer), outcome, trace in zip(answers, outcomes, traces, strict=True):
+            with activate(trace), span('render'):
+                if headers:
+                    print(f'{question}:')
+                self.__print_outcome(answer, outcome)
+            self.__finish_trace(trace, outcome)
+
+    def check_batch(self, answers: Iterable[tuple[str, T]]) -> None:
+        """Check multiple answers with a single request. Results are shown in the order of the answers.
+
+        NOTE: Answers of which the result is cached are not sent. Digests are not sent first, even if enabled.
+
+        Args:
+            answers (Iterable[tuple[str, T]]): Pairs of question identifier and answer.
+        """
+        answers = list(answers)
+        trace = self.__start_trace(','.join(question for question, _ in answers))
+        with activate(trace):
+            self.__check_batch(answers)
+        self.__finish_trace(trace, None)
+
+    def __check_batch(self, answers: list[tuple[str, T]]) -> None:
+        """Check multiple answers with a single request, like `check_batch`.
+
+        Args:
+            answers (list[tuple[str, T]]): Pairs of question identifier and answer.
+        """
+        outcomes: list[VerificationResponse | QueuedVerification | str | None] = []
+        missing: list[tuple[int, str, RequestBody]] = []
+
+        for index, (question, answer) in enumerate(answers):
+            rejected = self.__prevalidate(question, answer)
+            if rejected is not None:
+                outcomes.append(rejected)
+                continue
+
+            try:
+                digest, _ = self.__digest(answer)
+                cached = self.__lookup(question, digest)
+                data = self.__create_request(question, answer, digest) if cached is None else None
+            except (NotImplementedError, TypeError) as error:
+                outcomes.append(self.__describe_error(answer, error))
+                continue
+
+            outcomes.append(cached)
+            if data is not None:
+                missing.append((index, digest, data))
+
+        if len(missing) > 0:
+            batch_outcomes = self.__verify_batch([(answers[index][0], digest, data) for index, digest, data in missing])
+            for (index, _, _), outcome in zip(missing, batch_outcomes, strict=True):
+                outcomes[index] = outcome
+
+        with span('render'):
+            for (question, answer), outcome in zip(answers, outcomes, strict=True):
+                print(f'{question}:')
+                self.__print_outcome(answer, check_isinstance(outcome, VerificationResponse | QueuedVerification | str))
+
+    async def aclose(self) -> None:
+        """Close the pooled connections of this checker, including those used by the asynchronous methods."""
+        self.close()
+        await self.__close_async_client()
+
+    async def __close_async_client(self) -> None:
+        """Close the asynchronous client, if any."""
+        if self.__async_client is not None:
+            await self.__async_client.aclose()
+            self.__async_client = None
+            self.__async_loop = None
+
+    def __get_async_client(self) -> 'httpx.AsyncClient':
+        """Get the asynchronous client for the running event loop.
+
+        Returns:
+            httpx.AsyncClient: Asynchronous client.
+        """
+        # Imported here, as httpx is only needed for asynchronous checks
+        import httpx
+
+        # Clients are bound to the event loop they are first used in
+        loop = asyncio.get_running_loop()
+        if self.__async_client is None or self.__async_loop is not loop:
+            self.__async_client = httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=self.session.pool_size,
+                    keepalive_expiry=self.session.idle_timeout,
+                ),
+            )
+            self.__async_loop = loop
+        return self.__async_client
+
+    def __create_request(self, question: str, answer: T, digest: str) -> RequestBody:
+        """Create the body of a verification request, which is streamed for large answers.
+
+        Args:
+            question (str): Question identifier.
+            answer (T): Answer.
+            digest (str): Content digest of the answer.
+
+        Returns:
+            RequestBody: JSON body.
+        """
+        return RequestBody.create(
+            self.module, question, answer, self.stream_threshold, digest, legacy=self.__legacy,
+        )
+
+    def __encode_body(self, data: RequestBody) -> tuple[bytes | Iterator[bytes], dict[str, str]]:
+        """Encode the body of a request, compressing it if it is large.
+
+        Args:
+            data (RequestBody): JSON body.
+
+        Returns:
+            tuple[bytes | Iterator[bytes], dict[str, str]]: Encoded body, or chunks of a streamed body, and the headers
+                to send with it.
+        """
+        if data.streamed:
+            if self.compression is None or self.__legacy:
+                return iter(count_sent(data)), HEADERS
+            return iter(count_sent(data.compress(self.compression))), {
+                **HEADERS, 'Content-Encoding': self.compression.name,
+            }
+
+        body = data.read()
+        if self.compression is None or self.__legacy or len(body) < self.compression_threshold:
+            add_bytes(sent=len(body))
+            return body, HEADERS
+
+        with span('compress'):
+            body = self.compression.compress(body)
+        add_bytes(sent=len(body))
+        return body, {**HEADERS, 'Content-Encoding': self.compression.name}
+
+    def __prevalidate(self, question: str, answer: T) -> VerificationResponse | None:
+        """Validate the structure of an answer against the manifest of the module, if it is loaded.
+
+        Args:
+            question (str): Question identifier.
+            answer (T): Answer.
+
+        Returns:
+            VerificationResponse | None: Response with the errors if the answer is structurally wrong, None if it is
+                not or there is no manifest.
+        """
+        loader = self.__get_manifest()
+        if loader is None or loader.manifest is None:
+            return None
+        with span('validate'):
+            return loader.manifest.validate_answer(question, answer)
+
+    def __get_manifest(self) -> ManifestLoader | None:
+        """Get the loader of the manifest of the module, which starts loading it the first time.
+
+        Returns:
+            ManifestLoader | None: Loader, None if manifests are disabled.
+        """
+        if not self.__manifest_enabled:
+            return None
+        with self.__manifest_lock:
+            if self.__manifest is None:
+                module = self.module
+                self.__manifest = ManifestLoader(module, lambda: f'{self.url}{MANIFEST_URL}/{module}', self.session)
+            return self.__manifest
+
+    @staticmethod
+    def __digest(answer: T) -> tuple[str, int]:
+        """Compute the content digest of an answer.
+
+        Args:
+            answer (T): Answer.
+
+        Returns:
+            tuple[str, int]: Hexadecimal digest and amount of bytes of the answer.
+        """
+        with span('digest'):
+            return content_digest(answer)
+
+    def __start_trace(self, question: str) -> CheckTrace | None:
+        """Start the trace of a check, if this checker is instrumented.
+
+        Args:
+            question (str): Question identifier.
+
+        Returns:
+            CheckTrace | None: Trace, None if this checker is not instrumented.
+        """
+        return None if self.instrumentation is None else self.instrumentation.start(self.module, question)
+
+    def __finish_trace(
+        self,
+        trace: CheckTrace | None,
+        outcome: VerificationResponse | QueuedVerification | str | None
+    ) -> None:
+        """Finish the trace of a check, if this checker is instrumented.
+
+        Args:
+            trace (CheckTrace | None): Trace.
+            outcome (VerificationResponse | QueuedVerification | str | None): Outcome of the check, None if there is no
+                single outcome.
+        """
+        if trace is None or self.instrumentation is None:
             return
-        except TypeError as error:
-            if 'JSON' in str(error):
-                self.__print_error(f'Answer cannot be converted to JSON: {error!s}')
-                return
-            raise
 
-        self.__process_response(response)
+        if isinstance(outcome, VerificationResponse):
+            name: str | None = 'correct' if outcome.correct else 'incorrect'
+        elif isinstance(outcome, QueuedVerification):
+            name = 'queued'
+        else:
+            name = None if outcome is None else 'error'
+        self.instrumentation.finish(trace, name)
+
+    def __lookup(self, question: str, digest: str) -> VerificationResponse | None:
+        """Look up the cached result of an answer.
+
+        Args:
+            question (str): Question identifier.
+            digest (str): Content digest of the answer.
+
+        Returns:
+            VerificationResponse | None: Cached result, if any.
+        """
+        if self.cache is None:
+            return None
+        return self.cache.get(self.module, question, digest, server=self.url)
+
+    def __remember(
+        self,
+        question: str,
+        digest: str,
+        outcome: VerificationResponse | str
+    ) -> VerificationResponse | str:
+        """Cache the result of a verification request.
+
+        Args:
+            question (str): Question identifier.
+            digest (str): Digest of the request.
+            outcome (VerificationResponse | str): Verification response, or error message which is not cached.
+
+        Returns:
+            VerificationResponse | str: The outcome.
+        """
+        if self.cache is not None and isinstance(outcome, VerificationResponse):
+            self.cache.put(self.module, question, digest, outcome, server=self.url)
+        return outcome
+
+    def __describe_error(self, answer: T, error: Exception) -> str:
+        """Get the message to show for an error that occurred while checking an answer.
+
+        Args:
+            answer (T): Answer.
+            error (Exception): Error.
+
+        Raises:
+            Exception: The error itself, if it is not related to the answer or the connection.
+
+        Returns:
+            str: Error message.
+        """
+        if isinstance(error, (OSError, *httpx_errors('TransportError'))):
+            return self.__describe_connection_error(error)
+        if isinstance(error, NotImplementedError):
+            return f'Answer of type {type(answer)} is not supported!'
+        if isinstance(error, TypeError) and 'JSON' in str(error):
+            return f'Answer cannot be converted to JSON: {error!s}'
+        raise error
+
+    @staticmethod
+    def __describe_connection_error(error: Exception) -> str:
+        """Get the message to show for an error that occurred while sending a verification request.
+
+        Args:
+            error (Exception): Error.
+
+        Raises:
+            Exception: The error itself, if it is not related to the connection.
+
+        Returns:
+            str: Error message.
+        """
+        if isinstance(error, CircuitOpenError):
+            return f'Server is unavailable, checking is paused for {error.retry_in:.0f} seconds.'
+        if isinstance(error, (TimeoutError, requests.Timeout, *httpx_errors('TimeoutException'))):
+            return 'Checking the answer timed out.'
+        if isinstance(error, (ConnectionError, requests.ConnectionError, *httpx_errors('TransportError'))):
+            return 'Could not reach the server, please try again later.'
+        raise error
+
+    @staticmethod
+    def __animation(step: int) -> str:
+        """Get the text of the checking animation.
+
+        Args:
+            step (int): Animation step.
+
+        Returns:
+            str: Animation text.
+        """
+        return '🔵 Checking your answer' + '.' * (step % 4)
+
+    def __display_answer(self, answer: T) -> None:
+        """Display the answer below the result.
 
+        Args:
+            answer (T): Answer.
+        """
         if self.notebook:
+            # Imported here, as IPython is slow to import and only needed in notebooks
+            from IPython.display import display
+
             display(answer)
         else:
             print(answer)
@@ -116,50 +701,502 @@ class Checker:
         """
         print(ERROR, message)
 
-    def __request_verification(self, question: str, answer: T) -> Response:
-        """Request verfication from the API server.
+    def __verify(self, question: str, answer: T) -> VerificationResponse | QueuedVerification | str:
+        """Verify an answer, using the cached result if the same answer was checked before.
 
         Args:
             question (str): Question identifier.
             answer (T): Answer.
 
         Returns:
-            Response: Response to request.
+            VerificationResponse | QueuedVerification | str: Verification response, queued request if the server is
+                unavailable and an outbox is used, or error message.
+        """
+        rejected = self.__prevalidate(question, answer)
+        if rejected is not None:
+            return rejected
+
+        digest, size = self.__digest(answer)
+        cached = self.__lookup(question, digest)
+        if cached is not None:
+            return cached
+
+        animation = TextAnimation(self.__animation, frequency=4)
+        try:
+            animation.start()
+            return self.__request_verification(question, answer, digest, size)
+        finally:
+            animation.stop()
+
+    def __verify_batch(
+        self,
+        entries: list[tuple[str, str, RequestBody]]
+    ) -> list[VerificationResponse | QueuedVerification | str]:
+        """Verify multiple answers with a single request, caching the results.
+
+        Args:
+            entries (list[tuple[str, str, RequestBody]]): Question identifier, digest and JSON body of each request.
+
+        Returns:
+            list[VerificationResponse | QueuedVerification | str]: Verification responses, queued requests if the server
+                is unavailable and an outbox is used, or error messages, in the order of the requests.
+        """
+        try:
+            response = self.__request_batch_verification([data for _, _, data in entries])
+        except CONNECTION_ERRORS as error:
+            if self.outbox is None:
+                return [self.__describe_connection_error(error)] * len(entries)
+            response = None
+
+        if self.outbox is not None and (response is None or response.status_code in RETRY_STATUS_CODES):
+            return [self.__enqueue(question, digest, data) for question, digest, data in entries]
+
+        outcomes = self.__parse_batch_response(check_isinstance(response, Response), len(entries))
+        return [
+            self.__remember(question, digest, outcome)
+            for (question, digest, _), outcome in zip(entries, outcomes, strict=True)
+        ]
+
+    def __enqueue(self, question: str, digest: str, data: RequestBody) -> QueuedVerification:
+        """Queue a verification request in the outbox, which is sent once the server is available again.
+
+        Args:
+            question (str): Question identifier.
+            digest (str): Digest of the request.
+            data (RequestBody): JSON body of the request.
+
+        Returns:
+            QueuedVerification: Queued request.
+        """
+        outbox = check_isinstance(self.outbox, Outbox)
+        queued = outbox.put(self.module, question, digest, data.read())
+        outbox.start(self.__flush)
+        return queued
+
+    def __flush(
+        self,
+        entries: list[QueuedVerification],
+        bodies: list[bytes]
+    ) -> list[VerificationResponse | str] | None:
+        """Send a batch of queued verification requests, caching the results.
+
+        Args:
+            entries (list[QueuedVerification]): Queued requests.
+            bodies (list[bytes]): JSON bodies of the requests.
+
+        Returns:
+            list[VerificationResponse | str] | None: Verification responses or error messages, None if the server is
+                still unavailable.
+        """
+        try:
+            response = self.__send(self.url + BATCH_URL, RequestBody.join([RequestBody.wrap(body) for body in bodies]))
+        except CONNECTION_ERRORS:
+            return None
+        if response.status_code in RETRY_STATUS_CODES:
+            return None
+
+        outcomes = self.__parse_batch_response(response, len(bodies))
+        if self.cache is not None:
+            for entry, outcome in zip(entries, outcomes, strict=True):
+                if isinstance(outcome, VerificationResponse):
+                    self.cache.put(entry.module, entry.question, entry.digest, outcome, server=self.url)
+        return outcomes
+
+    def __request_verification(
+        self,
+        question: str,
+        answer: T,
+        digest: str,
+        size: int
+    ) -> VerificationResponse | QueuedVerification | str:
+        """Request verfication from the API server, sending the digest of the answer first if enabled.
+
+        Args:
+            question (str): Question identifier.
+            answer (T): Answer.
+            digest (str): Content digest of the answer.
+            size (int): Amount of bytes of the answer.
+
+        Returns:
+            VerificationResponse | QueuedVerification | str: Verification response, queued request if the server is
+                unavailable and an outbox is used, or error message.
+        """
+        data: RequestBody | None = None
+        try:
+            if self.digest_first:
+                known = self.__query_digest(question, digest, size)
+                if known is not None:
+                    return self.__remember(question, digest, known)
+            data = self.__create_request(question, answer, digest)
+            response = self.__send(self.url, data)
+        except CONNECTION_ERRORS:
+            if self.outbox is None:
+                raise
+            return self.__enqueue(question, digest, data or self.__create_request(question, answer, digest))
+
+        if self.outbox is not None and response.status_code in RETRY_STATUS_CODES:
+            return self.__enqueue(question, digest, data)
+        return self.__remember(question, digest, self.__parse_response(response))
+
+    async def __arequest_verification(
+        self,
+        client: 'httpx.AsyncClient',
+        url: str,
+        question: str,
+        answer: T,
+        digest: str,
+        size: int
+    ) -> VerificationResponse | QueuedVerification | str:
+        """Request verfication from the API server asynchronously, like `__request_verification`.
+
+        Args:
+            client (httpx.AsyncClient): Asynchronous client.
+            url (str): URL of the verification endpoint.
+            question (str): Question identifier.
+            answer (T): Answer.
+            digest (str): Content digest of the answer.
+            size (int): Amount of bytes of the answer.
+
+        Returns:
+            VerificationResponse | QueuedVerification | str: Verification response, queued request if the server is
+                unavailable and an outbox is used, or error message.
+        """
+        data: RequestBody | None = None
+        try:
+            if self.digest_first:
+                known = await self.__aquery_digest(client, url, question, digest, size)
+                if known is not None:
+                    return self.__remember(question, digest, known)
+            data = self.__create_request(question, answer, digest)
+            response = await self.__asend(client, url, data)
+        except (ConnectionError, *httpx_errors('TransportError')):
+            if self.outbox is None:
+                raise
+            return self.__enqueue(question, digest, data or self.__create_request(question, answer, digest))
+
+        if self.outbox is not None and response.status_code in RETRY_STATUS_CODES:
+            return self.__enqueue(question, digest, data)
+        return self.__remember(question, digest, self.__parse_response(response))
+
+    def __create_digest_request(self, question: str, digest: str, size: int) -> RequestBody:
+        """Create the body of a request that identifies an answer by its content digest.
+
+        Args:
+            question (str): Question identifier.
+            digest (str): Content digest of the answer.
+            size (int): Amount of bytes of the answer.
+
+        Returns:
+            RequestBody: JSON body.
+        """
+        request = VerificationDigestRequest.model_construct(
+            module=self.module, question=question, digest=digest, size=size,
+        )
+        return RequestBody.wrap(request.model_dump_json().encode())
+
+    def __query_digest(self, question: str, digest: str, size: int) -> VerificationResponse | None:
+        """Ask the API server for the result of an answer, identified by its content digest.
+
+        Args:
+            question (str): Question identifier.
+            digest (str): Content digest of the answer.
+            size (int): Amount of bytes of the answer.
+
+        Returns:
+            VerificationResponse | None: Verification response, None if the server does not know the result.
+        """
+        response = self.__send(self.url + DIGEST_URL, self.__create_digest_request(question, digest, size))
+        # Servers without support for digests are treated as not knowing any result
+        if response.status_code != 200:  # noqa: PLR2004
+            return None
+        with span('parse'):
+            return VerificationDigestResponse.parse(response.content).response
+
+    async def __aquery_digest(
+        self,
+        client: 'httpx.AsyncClient',
+        url: str,
+        question: str,
+        digest: str,
+        size: int
+    ) -> VerificationResponse | None:
+        """Ask the API server for the result of an answer asynchronously, like `__query_digest`.
+
+        Args:
+            client (httpx.AsyncClient): Asynchronous client.
+            url (str): URL of the verification endpoint.
+            question (str): Question identifier.
+            digest (str): Content digest of the answer.
+            size (int): Amount of bytes of the answer.
+
+        Returns:
+            VerificationResponse | None: Verification response, None if the server does not know the result.
         """
-        data = VerificationRequest.create(module=self.module, question=question, answer=answer).model_dump_json()
-        headers = {
-            'Content-Type': 'application/json'
-        }
+        response = await self.__asend(client, url + DIGEST_URL, self.__create_digest_request(question, digest, size))
+        if response.status_code != 200:  # noqa: PLR2004
+            return None
+        with span('parse'):
+            return VerificationDigestResponse.parse(response.content).response
 
-        def _animation(step: int) -> str:
-            return '🔵 Checking your answer' + '.' * (step % 4)
+    def __request_batch_verification(self, data: list[RequestBody]) -> Response:
+        """Request verification of multiple answers from the API server in a single request.
 
-        animation = TextAnimation(_animation, frequency=4)
+        Args:
+            data (list[RequestBody]): JSON bodies of the verification requests.
+
+        Returns:
+            Response: Response to request.
+        """
+        animation = TextAnimation(self.__animation, frequency=4)
         try:
             animation.start()
-            response = requests.request('POST', self.url, headers=headers, data=data, timeout=30)
+            # Equal to the JSON of a VerificationBatchRequest, without serializing the answers again
+            response = self.__send(self.url + BATCH_URL, RequestBody.join(data))
         finally:
             animation.stop()
 
         return response
 
-    def __process_response(self, response: Response) -> None:
-        """Handle the verification response.
+    def __parse_batch_response(self, response: Response, count: int) -> list[VerificationResponse | str]:
+        """Parse the batch verification response.
 
         Args:
-            response (Response): Verification response.
+            response (Response): Response to the batch verification request.
+            count (int): Amount of answers in the request.
+
+        Returns:
+            list[VerificationResponse | str]: Verification responses or error messages, in the order of the requests.
         """
-        # Print any error that may occur
         if response.status_code != 200:  # noqa: PLR2004
+            return [self.__status_error(response)] * count
+
+        with span('parse'):
+            batch_response = VerificationBatchResponse.parse(response.content)
+        if len(batch_response.responses) != count:
+            return [f'Server returned {len(batch_response.responses)} results for {count} answers'] * count
+        return list(batch_response.responses)
+
+    def __send(self, url: str, data: RequestBody) -> Response:
+        """Send a verification request, sending it once more in the legacy encoding if the server rejects it.
+
+        Args:
+            url (str): URL of the endpoint.
+            data (RequestBody): JSON body of the request.
+
+        Returns:
+            Response: Response.
+        """
+        response = self.__send_retrying(url, data)
+        if self.__fall_back(response.status_code, data):
+            response = self.__send_retrying(url, data if data.legacy is None else data.legacy())
+        return response
+
+    def __send_retrying(self, url: str, data: RequestBody) -> Response:
+        """Send a verification request, retrying it if it could not connect or the server is unavailable.
+
+        Args:
+            url (str): URL of the endpoint.
+            data (RequestBody): JSON body of the request.
+
+        Raises:
+            CircuitOpenError: If requests to the server fail instantly, as too many requests failed before.
+            requests.RequestException: If the request failed after connecting, or could not connect on the last attempt.
+
+        Returns:
+            Response: Response to the last attempt.
+        """
+        health = ServerHealth.get(url)
+        attempt = 0
+        while True:
+            health.check(lambda: self.__probe(url))
+            # A streamed body is consumed by each attempt, so it is encoded again
+            body, headers = self.__encode_body(data)
+            timeout = (health.connect_timeout(self.timeout), self.timeout)
+            started = monotonic()
             try:
-                message = json.loads(response.content)['detail']
-                self.__print_error(f'Server returned {response.status_code} - {message}')
-            except BaseException:  # noqa: BLE001
-                self.__print_error(f'Server returned {response.status_code}')
-            return
+                with span('http'):
+                    response = self.session.request('POST', url, headers=headers, data=body, timeout=timeout)
+                add_bytes(received=len(response.content))
+            except (requests.ConnectionError, requests.Timeout) as error:
+                health.record_failure()
+                # Verification requests are not idempotent, so only requests that were never received are sent again
+                if attempt >= self.retry.retries or not self.__is_connect_error(error):
+                    raise
+            else:
+                if response.status_code not in RETRY_STATUS_CODES:
+                    health.record_success(monotonic() - started)
+                    return response
+                health.record_failure()
+                if attempt >= self.retry.retries:
+                    return response
+
+            sleep(self.retry.delay(attempt))
+            attempt += 1
+
+    async def __asend(self, client: 'httpx.AsyncClient', url: str, data: RequestBody) -> 'httpx.Response':
+        """Send a verification request asynchronously, like `__send`.
+
+        Args:
+            client (httpx.AsyncClient): Asynchronous client.
+            url (str): URL of the endpoint.
+            data (RequestBody): JSON body of the request.
+
+        Returns:
+            httpx.Response: Response.
+        """
+        response = await self.__asend_retrying(client, url, data)
+        if self.__fall_back(response.status_code, data):
+            response = await self.__asend_retrying(client, url, data if data.legacy is None else data.legacy())
+        return response
+
+    def __fall_back(self, status_code: int, data: RequestBody) -> bool:
+        """Stop using the compact encodings and compression, if the server rejected a request that may use them.
+
+        Args:
+            status_code (int): Status code of the response.
+            data (RequestBody): JSON body of the request.
+
+        Returns:
+            bool: True if the request should be sent again without them, False otherwise.
+        """
+        if self.__legacy or status_code not in LEGACY_STATUS_CODES \
+                or (data.legacy is None and self.compression is None):
+            return False
+        self.__legacy = True
+        return True
+
+    async def __asend_retrying(self, client: 'httpx.AsyncClient', url: str, data: RequestBody) -> 'httpx.Response':
+        """Send a verification request asynchronously, retrying it like `__send_retrying`.
+
+        Args:
+            client (httpx.AsyncClient): Asynchronous client.
+            url (str): URL of the endpoint.
+            data (RequestBody): JSON body of the request.
+
+        Raises:
+            CircuitOpenError: If requests to the server fail instantly, as too many requests failed before.
+            httpx.TransportError: If the request failed after connecting, or could not connect on the last attempt.
+
+        Returns:
+            httpx.Response: Response to the last attempt.
+        """
+        # Imported here, as httpx is only needed for asynchronous checks
+        import httpx
+
+        connect_errors = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+        health = ServerHealth.get(url)
+        attempt = 0
+        while True:
+            health.check(lambda: self.__probe(url))
+            body, headers = self.__encode_body(data)
+            if not isinstance(body, bytes):
+                body = iterate_async(body)
+            timeout = httpx.Timeout(self.timeout, connect=health.connect_timeout(self.timeout))
+            started = monotonic()
+            try:
+                with span('http'):
+                    response = await client.post(url, headers=headers, content=body, timeout=timeout)
+                add_bytes(received=len(response.content))
+            except httpx.TransportError as error:
+                health.record_failure()
+                # Only requests that were never received are sent again, like `__send_retrying`
+                if attempt >= self.retry.retries or not isinstance(error, connect_errors):
+                    raise
+            else:
+                if response.status_code not in RETRY_STATUS_CODES:
+                    health.record_success(monotonic() - started)
+                    return response
+                health.record_failure()
+                if attempt >= self.retry.retries:
+                    return response
+
+            await asyncio.sleep(self.retry.delay(attempt))
+            attempt += 1
+
+    @staticmethod
+    def __is_connect_error(error: requests.RequestException) -> bool:
+        """Get whether a request failed before it was sent, because the connection could not be established.
+
+        Args:
+            error (requests.RequestException): Error of the request.
+
+        Returns:
+            bool: True if the request could not connect, False if it failed after connecting.
+        """
+        if isinstance(error, requests.ConnectTimeout):
+            return True
+        # Other connection errors wrap the error of urllib3, of which only some happen before connecting
+        reason = getattr(error.args[0], 'reason', None) if len(error.args) > 0 else None
+        return isinstance(error, requests.ConnectionError) and isinstance(reason, NewConnectionError)
+
+    def __probe(self, url: str) -> bool:
+        """Probe whether a server that failed before is available again.
+
+        Args:
+            url (str): URL of the endpoint.
+
+        Returns:
+            bool: True if the server responded without a server error, False otherwise.
+        """
+        try:
+            response = self.session.request('GET', url, timeout=DISCOVERY_TIMEOUT)
+        except requests.RequestException:
+            return False
+        return response.status_code < 500  # noqa: PLR2004
+
+    def __parse_response(self, response: 'Response | httpx.Response') -> VerificationResponse | str:
+        """Parse the verification response.
+
+        Args:
+            response (Response | httpx.Response): Response to the verification request.
+
+        Returns:
+            VerificationResponse | str: Verification response, or error message if the server returned an error.
+        """
+        if response.status_code != 200:  # noqa: PLR2004
+            return self.__status_error(response)
+
+        with span('parse'):
+            return VerificationResponse.parse(response.content)
 
-        # Load answer and show if correct
-        answer_response = VerificationResponse(**json.loads(response.content))
+    def __status_error(self, response: 'Response | httpx.Response') -> str:
+        """Get the error message for an error returned by the server.
+
+        Args:
+            response (Response | httpx.Response): Response with an unsuccessful status code.
+
+        Returns:
+            str: Error message.
+        """
+        try:
+            message = json.loads(response.content)['detail']
+        except BaseException:  # noqa: BLE001
+            return f'Server returned {response.status_code}'
+        return f'Server returned {response.status_code} - {message}'
+
+    def __print_outcome(self, answer: T, outcome: VerificationResponse | QueuedVerification | str) -> None:
+        """Print the outcome of checking an answer, followed by the answer itself.
+
+        Args:
+            answer (T): Answer.
+            outcome (VerificationResponse | QueuedVerification | str): Verification response, queued request, or error
+                message.
+        """
+        if isinstance(outcome, str):
+            self.__print_error(outcome)
+        elif isinstance(outcome, QueuedVerification):
+            print(QUEUED, 'Server is unavailable, your answer is checked once it is available again. '
+                  'Use show_queued() to see the result.')
+        else:
+            self.__print_response(outcome)
+        self.__display_answer(answer)
+
+    def __print_response(self, answer_response: VerificationResponse) -> None:
+        """Print whether the answer is correct, followed by the messages of the response.
+
+        Args:
+            answer_response (VerificationResponse): Verification response.
+        """
         if answer_response.correct:
             print('🟢 ' + answer_response.message_correct)
         else:
@@ -194,6 +1231,8 @@ class Checker:
             obj = message.obj.get()
             if isinstance(obj, pd.DataFrame):
                 if self.notebook:
+                    from IPython.display import display
+
                     display(obj)
                 else:
                     print(obj)
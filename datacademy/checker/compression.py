@@ -0,0 +1,200 @@
+"""Module containing the codecs to compress request bodies with."""
+
+import zlib
+from typing import Protocol
+
+DEFAULT_CODEC = 'gzip'
+"""Name of the codec to compress large request bodies with."""
+
+DEFAULT_COMPRESSION_THRESHOLD = 64 * 1024
+"""Minimum amount of bytes of a request body before it is compressed."""
+
+DEFAULT_COMPRESSION_LEVEL = 1
+"""Compression level of the built-in codecs, trading speed for size."""
+
+
+class Compressor(Protocol):
+    """Protocol for objects that compress data incrementally, like those returned by `zlib.compressobj`."""
+
+    def compress(self, data: bytes, /) -> bytes:
+        """Compress a chunk of data.
+
+        Args:
+            data (bytes): Chunk of data.
+
+        Returns:
+            bytes: Compressed data that is available so far.
+        """
+
+    def flush(self) -> bytes:
+        """Finish compressing.
+
+        Returns:
+            bytes: Remaining compressed data.
+        """
+
+
+class Codec:
+    """Base class for a content encoding that request bodies can be compressed with."""
+
+    name: str = 'identity'
+    """Name of the content encoding, as used in the `Content-Encoding` header."""
+
+    def compressor(self) -> Compressor:
+        """Get a new compressor.
+
+        Raises:
+            NotImplementedError: If this codec does not implement compression.
+
+        Returns:
+            Compressor: Compressor.
+        """
+        raise NotImplementedError(f'Codec {self.name} does not implement compression')
+
+    def decompress(self, data: bytes, max_size: int | None = None) -> bytes:
+        """Decompress data.
+
+        Args:
+            data (bytes): Compressed data.
+            max_size (int | None, optional): Maximum amount of decompressed bytes. Defaults to None.
+
+        Raises:
+            NotImplementedError: If this codec does not implement decompression.
+
+        Returns:
+            bytes: Decompressed data.
+        """
+        raise NotImplementedError(f'Codec {self.name} does not implement decompression')
+
+    def compress(self, data: bytes) -> bytes:
+        """Compress data at once.
+
+        Args:
+            data (bytes): Data.
+
+        Returns:
+            bytes: Compressed data.
+        """
+        compressor = self.compressor()
+        return compressor.compress(data) + compressor.flush()
+
+
+class ZlibCodec(Codec):
+    """Base class for codecs that are implemented by zlib."""
+
+    wbits: int = zlib.MAX_WBITS
+    """Window size and header format, as used by zlib."""
+
+    def __init__(self, level: int = DEFAULT_COMPRESSION_LEVEL) -> None:
+        """Create a new codec.
+
+        Args:
+            level (int, optional): Compression level from 1 (fastest) to 9 (smallest).
+                Defaults to DEFAULT_COMPRESSION_LEVEL.
+        """
+        self.level = level
+
+    def compressor(self) -> Compressor:
+        """Get a new compressor.
+
+        Returns:
+            Compressor: Compressor.
+        """
+        return zlib.compressobj(self.level, zlib.DEFLATED, self.wbits)
+
+    def decompress(self, data: bytes, max_size: int | None = None) -> bytes:
+        """Decompress data.
+
+        Args:
+            data (bytes): Compressed data.
+            max_size (int | None, optional): Maximum amount of decompressed bytes. Defaults to None.
+
+        Raises:
+            ValueError: If the data is invalid, or decompresses to more than the maximum amount of bytes.
+
+        Returns:
+            bytes: Decompressed data.
+        """
+        decompressor = zlib.decompressobj(self.wbits)
+        try:
+            if max_size is None:
+                result = decompressor.decompress(data) + decompressor.flush()
+            else:
+                # Read one byte more than allowed, to detect oversized data without decompressing all of it
+                result = decompressor.decompress(data, max_size + 1)
+        except zlib.error as error:
+            raise ValueError(f'Invalid {self.name} data: {error}') from error
+
+        if max_size is not None and len(result) > max_size:
+            raise ValueError(f'Decompressed data exceeds {max_size} bytes')
+        return result
+
+
+class GzipCodec(ZlibCodec):
+    """Codec for the gzip content encoding."""
+
+    name = 'gzip'
+    wbits = 16 + zlib.MAX_WBITS
+
+
+class DeflateCodec(ZlibCodec):
+    """Codec for the deflate content encoding."""
+
+    name = 'deflate'
+    wbits = zlib.MAX_WBITS
+
+
+CODECS: dict[str, Codec] = {}
+"""Registered codecs by name."""
+
+
+def register_codec(codec: Codec) -> None:
+    """Register a codec, replacing any codec with the same name.
+
+    Args:
+        codec (Codec): Codec.
+    """
+    CODECS[codec.name] = codec
+
+
+def get_codec(name: str) -> Codec:
+    """Get a registered codec.
+
+    Args:
+        name (str): Name of the codec.
+
+    Raises:
+        ValueError: If no codec with this name is registered.
+
+    Returns:
+        Codec: Codec.
+    """
+    try:
+        return CODECS[name.strip().lower()]
+    except KeyError:
+        raise ValueError(f'Unsupported content encoding {name!r}') from None
+
+
+def decompress(data: bytes, content_encoding: str | None = None, max_size: int | None = None) -> bytes:
+    """Decompress data according to the `Content-Encoding` header.
+
+    Args:
+        data (bytes): Possibly compressed data.
+        content_encoding (str | None, optional): Value of the `Content-Encoding` header. Defaults to None.
+        max_size (int | None, optional): Maximum amount of decompressed bytes. Defaults to None.
+
+    Returns:
+        bytes: Decompressed data.
+    """
+    if content_encoding is None:
+        return data
+
+    # Encodings are listed in the order they were applied
+    for name in reversed(content_encoding.split(',')):
+        if name.strip().lower() not in ('', 'identity'):
+            data = get_codec(name).decompress(data, max_size)
+    return data
+
+
+register_codec(GzipCodec())
+register_codec(DeflateCodec())
@@ -0,0 +1,105 @@
+"""Module containing the content digests of answers, which identify answers without sending them."""
+
+import hashlib
+import json
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import is_bool_dtype, is_datetime64_any_dtype, is_numeric_dtype, is_timedelta64_dtype
+
+from .encoding import can_encode_array, iter_bytes
+from .objects import ObjectModel
+from .types import ANSWER_TYPES
+
+DIGEST_SIZE = 32
+"""Amount of bytes of a content digest."""
+
+
+def column_hashes(values: pd.Series | pd.Index) -> np.ndarray:
+    """Hash the values of a column or index level, including the types of the values of object columns.
+
+    NOTE: pandas hashes object values by their string, so `1` and `'1'` would have the same hash. Values of such
+    columns are hashed with the name of their type, only columns of numeric, bool and datetime dtypes are hashed as
+    they are.
+
+    Args:
+        values (pd.Series | pd.Index): Values.
+
+    Returns:
+        np.ndarray: Hash of every value.
+    """
+    dtype = values.dtype
+    if not (is_numeric_dtype(dtype) or is_bool_dtype(dtype) or is_datetime64_any_dtype(dtype)
+            or is_timedelta64_dtype(dtype)):
+        values = pd.Index([f'{type(value).__module__}.{type(value).__qualname__}:{value!r}' for value in values])
+    return pd.util.hash_pandas_object(values, index=False).to_numpy()
+
+
+def frame_digest(df: pd.DataFrame) -> str | None:
+    """Compute the content digest of a DataFrame from the hashes of its columns and index.
+
+    Args:
+        df (pd.DataFrame): DataFrame.
+
+    Returns:
+        str | None: Hexadecimal digest, None if the DataFrame contains values that cannot be hashed.
+    """
+    digest = hashlib.blake2b(b'frame', digest_size=DIGEST_SIZE)
+    # Value hashes ignore labels and dtypes, which are part of the answer too
+    labels = {
+        'columns': [repr(label) for label in df.columns],
+        'dtypes': [str(dtype) for dtype in df.dtypes],
+        'index': [repr(name) for name in df.index.names],
+        'index_dtype': str(df.index.dtype),
+    }
+    digest.update(json.dumps(labels).encode())
+    try:
+        for level in range(df.index.nlevels):
+            digest.update(column_hashes(df.index.get_level_values(level)).tobytes())
+        for position in range(df.shape[1]):
+            digest.update(column_hashes(df.iloc[:, position]).tobytes())
+    except TypeError:
+        return None
+    return digest.hexdigest()
+
+
+def array_digest(values: np.ndarray) -> str:
+    """Compute the content digest of an array from its raw buffer.
+
+    Args:
+        values (np.ndarray): Array that can be encoded as raw buffer.
+
+    Returns:
+        str: Hexadecimal digest.
+    """
+    digest = hashlib.blake2b(b'array', digest_size=DIGEST_SIZE)
+    digest.update(json.dumps({'dtype': values.dtype.str, 'shape': list(values.shape)}).encode())
+    for chunk in iter_bytes(values):
+        digest.update(chunk)
+    return digest.hexdigest()
+
+
+def content_digest(answer: ANSWER_TYPES) -> tuple[str, int]:
+    """Compute a canonical digest of an answer, without serializing DataFrames and arrays.
+
+    NOTE: Answers that are equal, including their types, have the same digest in every process.
+
+    Args:
+        answer (ANSWER_TYPES): Answer.
+
+    Raises:
+        NotImplementedError: If the type of the answer is not supported.
+
+    Returns:
+        tuple[str, int]: Hexadecimal digest and amount of bytes of the answer.
+    """
+    if isinstance(answer, pd.DataFrame):
+        digest = frame_digest(answer)
+        if digest is not None:
+            return digest, int(answer.memory_usage(index=True, deep=False).sum())
+    elif isinstance(answer, np.ndarray) and can_encode_array(answer):
+        return array_digest(answer), answer.nbytes
+
+    # Other answers are identified by their JSON, which includes their type
+    data = ObjectModel.create(answer).model_dump_json().encode()
+    return hashlib.blake2b(data, digest_size=DIGEST_SIZE).hexdigest(), len(data)
@@ -0,0 +1,102 @@
+"""Module containing the background discovery of the verification server."""
+
+from threading import Event, Lock, Thread
+from time import monotonic
+from typing import ClassVar
+
+import requests
+
+from .session import CheckerSession
+
+DISCOVERY_ADDRESS = 'https://proddatacademyapi.azurewebsites.net'
+"""Address of the hosted Datacademy API that is preferred when it is reachable."""
+
+DISCOVERY_TIMEOUT = 10.0
+"""Seconds before probing the hosted Datacademy API will time out."""
+
+DISCOVERY_TTL = 600.0
+"""Seconds for which a successful probe is reused by new checkers."""
+
+DISCOVERY_FAILURE_TTL = 30.0
+"""Seconds for which a failed probe is reused by new checkers."""
+
+
+class ServerDiscovery:
+    """Class to probe whether a server is reachable, without blocking the caller."""
+
+    __probes: ClassVar[dict[str, 'ServerDiscovery']] = {}
+    __lock = Lock()
+
+    def __init__(self, address: str, session: CheckerSession, timeout: float = DISCOVERY_TIMEOUT) -> None:
+        """Create a new discovery and start probing in a background thread.
+
+        Args:
+            address (str): Address of the server to probe.
+            session (CheckerSession): Session to probe with, which keeps the connection warm for later requests.
+            timeout (float, optional): Seconds before the probe will time out. Defaults to DISCOVERY_TIMEOUT.
+        """
+        self.address = address
+        self.session = session
+        self.timeout = timeout
+
+        self.reachable: bool | None = None
+        self.error: str | None = None
+        self.finished_at: float | None = None
+
+        self.__done = Event()
+        Thread(target=self.__probe, daemon=True).start()
+
+    def __probe(self) -> None:
+        """Probe the server."""
+        try:
+            response = self.session.request('GET', self.address + '/', timeout=self.timeout)
+            response.raise_for_status()  # Raise an HTTPError for bad responses (4xx and 5xx)
+            self.reachable = True
+        except requests.exceptions.RequestException as e:
+            self.reachable = False
+            self.error = str(e)
+        finally:
+            self.finished_at = monotonic()
+            self.__done.set()
+
+    def wait(self, timeout: float | None = None) -> bool:
+        """Wait until the server is probed.
+
+        Args:
+            timeout (float | None, optional): Maximum seconds to wait. Defaults to None.
+
+        Returns:
+            bool: True if the server is reachable, False if it is not or if probing did not finish in time.
+        """
+        self.__done.wait(timeout)
+        return self.reachable is True
+
+    def is_expired(self) -> bool:
+        """Get whether the outcome of this probe is too old to be reused.
+
+        Returns:
+            bool: True if expired, False if the probe is still running or its outcome can be reused.
+        """
+        if self.finished_at is None:
+            return False
+
+        ttl = DISCOVERY_TTL if self.reachable else DISCOVERY_FAILURE_TTL
+        return monotonic() - self.finished_at > ttl
+
+    @classmethod
+    def start(cls, address: str, session: CheckerSession) -> 'ServerDiscovery':
+        """Get a running or recent probe of a server, starting a new one if there is none.
+
+        Args:
+            address (str): Address of the server to probe.
+            session (CheckerSession): Session to probe with.
+
+        Returns:
+            ServerDiscovery: Discovery of the server, shared by all checkers in this process.
+        """
+        with cls.__lock:
+            discovery = cls.__probes.get(address)
+            if discovery is None or discovery.is_expired():
+                discovery = ServerDiscovery(address, session)
+                cls.__probes[address] = discovery
+            return discovery
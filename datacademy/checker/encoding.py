@@ -0,0 +1,304 @@
+"""Module containing the compact binary encodings of arrays and DataFrames for requests."""
+
+import base64
+from collections.abc import Iterator
+from typing import Any
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import infer_dtype
+
+BUFFER_KINDS = 'biufcmM'
+"""Kinds of NumPy dtypes that are sent as raw buffers: booleans, numbers, datetimes and timedeltas."""
+
+BUFFER_CHUNK_SIZE = 3 * 1024 * 1024
+"""Amount of bytes of a buffer that are encoded at once, a multiple of 3 so encoded chunks can be concatenated."""
+
+
+def iter_bytes(values: np.ndarray, chunk_size: int = BUFFER_CHUNK_SIZE) -> Iterator[memoryview | bytes]:
+    """Get the raw buffer of an array in C order, chunk by chunk, without copying the array as a whole.
+
+    NOTE: Memory-mapped arrays are read chunk by chunk, instead of being loaded into memory at once.
+
+    Args:
+        values (np.ndarray): Array.
+        chunk_size (int, optional): Maximum amount of bytes per chunk. Defaults to BUFFER_CHUNK_SIZE.
+
+    Yields:
+        memoryview | bytes: Chunks, of which all but the last are a multiple of 3 bytes if the chunk size is.
+    """
+    if values.flags.c_contiguous:
+        buffer = memoryview(values.reshape(-1).view(np.uint8))
+        for start in range(0, len(buffer), chunk_size):
+            yield buffer[start:start + chunk_size]
+        return
+
+    # Other layouts, such as Fortran order or slices, are copied in C order one chunk of items at a time
+    items = max(chunk_size // values.itemsize // 3 * 3, 3)
+    flags = ['external_loop', 'buffered', 'zerosize_ok']
+    for chunk in np.nditer(values, flags=flags, order='C', buffersize=items):
+        yield chunk.tobytes()
+
+
+def iter_buffer(values: np.ndarray, chunk_size: int = BUFFER_CHUNK_SIZE) -> Iterator[str]:
+    """Encode the raw buffer of an array in base64, chunk by chunk.
+
+    Args:
+        values (np.ndarray): Array.
+        chunk_size (int, optional): Amount of bytes to encode at once, must be a multiple of 3.
+            Defaults to BUFFER_CHUNK_SIZE.
+
+    Yields:
+        str: Encoded chunks.
+    """
+    for chunk in iter_bytes(values, chunk_size):
+        yield base64.b64encode(chunk).decode('ascii')
+
+
+def encode_buffer(values: np.ndarray) -> str:
+    """Encode the raw buffer of an array in base64.
+
+    NOTE: The encoded buffer is kept in memory as a whole, see `iter_buffer` to encode it chunk by chunk instead.
+
+    Args:
+        values (np.ndarray): Array.
+
+    Returns:
+        str: Encoded buffer.
+    """
+    return ''.join(iter_buffer(values))
+
+
+def decode_buffer(data: str, dtype: str, shape: tuple[int, ...] | list[int] | None = None) -> np.ndarray:
+    """Decode an array from its raw buffer in base64.
+
+    Args:
+        data (str): Encoded buffer.
+        dtype (str): Dtype of the array, including byte order.
+        shape (tuple[int, ...] | list[int] | None, optional): Shape of the array, one-dimensional if None.
+            Defaults to None.
+
+    Returns:
+        np.ndarray: Array.
+    """
+    # Decode into a bytearray, so the array is writable
+    values = np.frombuffer(bytearray(base64.b64decode(data)), dtype=np.dtype(dtype))
+    return values if shape is None else values.reshape(shape)
+
+
+def can_encode_array(values: np.ndarray) -> bool:
+    """Get whether an array can be encoded as raw buffer.
+
+    Args:
+        values (np.ndarray): Array.
+
+    Returns:
+        bool: True if its dtype can be sent as raw buffer, False otherwise.
+    """
+    return values.dtype.kind in BUFFER_KINDS
+
+
+def encode_array(values: np.ndarray) -> dict[str, Any] | None:
+    """Encode an array of any shape as raw buffer, including its dtype, byte order and shape.
+
+    Args:
+        values (np.ndarray): Array.
+
+    Returns:
+        dict[str, Any] | None: Encoded array, None if its dtype cannot be sent as raw buffer.
+    """
+    if not can_encode_array(values):
+        return None
+    return {'dtype': values.dtype.str, 'shape': list(values.shape), 'data': encode_buffer(values)}
+
+
+def decode_array(encoded: dict[str, Any]) -> np.ndarray:
+    """Decode an array of any shape.
+
+    Args:
+        encoded (dict[str, Any]): Encoded array.
+
+    Returns:
+        np.ndarray: Array.
+    """
+    return decode_buffer(encoded['data'], encoded['dtype'], encoded['shape'])
+
+
+def is_text(values: np.ndarray | pd.Series | pd.Index) -> bool:
+    """Get whether an object array only has strings and None, which are the only objects JSON keeps exactly.
+
+    Args:
+        values (np.ndarray | pd.Series | pd.Index): Array of objects.
+
+    Returns:
+        bool: True if it only has strings and None, False otherwise.
+    """
+    if infer_dtype(values, skipna=False) == 'string':
+        return True
+    if infer_dtype(values, skipna=True) not in ('string', 'empty'):
+        return False
+    # Missing values other than None, such as NaN, would be decoded as None
+    values = np.asarray(values)
+    return all(value is None for value in values[pd.isna(values)])
+
+
+def can_encode_column(values: np.ndarray | pd.Series | pd.Index) -> bool:
+    """Get whether a one-dimensional array, column or index can be encoded exactly.
+
+    Args:
+        values (np.ndarray | pd.Series | pd.Index): Array, column or index.
+
+    Returns:
+        bool: True if it can be encoded, False otherwise.
+    """
+    # Extension dtypes, such as categoricals, cannot be restored from a NumPy array
+    if not isinstance(values.dtype, np.dtype):
+        return False
+    return values.dtype.kind in BUFFER_KINDS or (values.dtype == object and is_text(values))
+
+
+def encode_column(values: np.ndarray) -> dict[str, Any] | None:
+    """Encode a one-dimensional array.
+
+    Args:
+        values (np.ndarray): Array.
+
+    Returns:
+        dict[str, Any] | None: Encoded array, None if it cannot be encoded.
+    """
+    if not can_encode_column(values):
+        return None
+
+    if values.dtype.kind in BUFFER_KINDS:
+        return {'dtype': values.dtype.str, 'data': encode_buffer(values)}
+    return {'dtype': 'object', 'values': values.tolist()}
+
+
+def decode_column(encoded: dict[str, Any]) -> np.ndarray:
+    """Decode a one-dimensional array.
+
+    Args:
+        encoded (dict[str, Any]): Encoded array.
+
+    Returns:
+        np.ndarray: Array.
+    """
+    if encoded['dtype'] == 'object':
+        values = np.empty(len(encoded['values']), dtype=object)
+        values[:] = encoded['values']
+        return values
+
+    return decode_buffer(encoded['data'], encoded['dtype'])
+
+
+def can_encode_index(index: pd.Index) -> bool:
+    """Get whether an index can be encoded exactly.
+
+    Args:
+        index (pd.Index): Index.
+
+    Returns:
+        bool: True if it can be encoded, False otherwise.
+    """
+    if isinstance(index, pd.MultiIndex) or not isinstance(index.name, str | int | None):
+        return False
+
+    return isinstance(index, pd.RangeIndex) or can_encode_column(index)
+
+
+def encode_index(index: pd.Index) -> dict[str, Any] | None:
+    """Encode an index.
+
+    Args:
+        index (pd.Index): Index.
+
+    Returns:
+        dict[str, Any] | None: Encoded index, None if it cannot be encoded.
+    """
+    if not can_encode_index(index):
+        return None
+
+    if isinstance(index, pd.RangeIndex):
+        return {'name': index.name, 'start': index.start, 'stop': index.stop, 'step': index.step}
+
+    encoded: dict[str, Any] = {'name': index.name, 'values': encode_column(index.to_numpy())}
+    # Only datetime and timedelta indexes have a frequency, such as those created by `pd.date_range`
+    freq = getattr(index, 'freqstr', None)
+    if freq is not None:
+        encoded['freq'] = freq
+    return encoded
+
+
+def decode_index(encoded: dict[str, Any]) -> pd.Index:
+    """Decode an index.
+
+    Args:
+        encoded (dict[str, Any]): Encoded index.
+
+    Returns:
+        pd.Index: Index.
+    """
+    if 'values' not in encoded:
+        return pd.RangeIndex(encoded['start'], encoded['stop'], encoded['step'], name=encoded['name'])
+    index = pd.Index(decode_column(encoded['values']), name=encoded['name'], copy=False)
+    if encoded.get('freq') is not None:
+        index = type(index)(index, freq=encoded['freq'])
+    return index
+
+
+def can_encode_frame(df: pd.DataFrame) -> bool:
+    """Get whether a DataFrame can be encoded exactly.
+
+    Args:
+        df (pd.DataFrame): DataFrame.
+
+    Returns:
+        bool: True if it can be encoded, False otherwise.
+    """
+    return can_encode_index(df.index) and can_encode_index(df.columns) \
+        and all(can_encode_column(series) for _, series in df.items())
+
+
+def encode_frame(df: pd.DataFrame) -> dict[str, Any] | None:
+    """Encode a DataFrame column by column, sending booleans, numbers and datetimes as raw buffers.
+
+    NOTE: Only DataFrames that are decoded exactly are encoded, including the frequency of their index. Those with a
+    MultiIndex, extension dtypes such as categoricals, strings or timezones, or object columns or labels with values
+    other than strings and None, such as NaN or dates, cannot be encoded.
+
+    Args:
+        df (pd.DataFrame): DataFrame.
+
+    Returns:
+        dict[str, Any] | None: Encoded DataFrame, None if it cannot be encoded exactly.
+    """
+    if not can_encode_frame(df):
+        return None
+
+    return {
+        'index': encode_index(df.index),
+        'columns': encode_index(df.columns),
+        'data': [encode_column(series.to_numpy()) for _, series in df.items()],
+    }
+
+
+def decode_frame(encoded: dict[str, Any]) -> pd.DataFrame:
+    """Decode a DataFrame.
+
+    Args:
+        encoded (dict[str, Any]): Encoded DataFrame.
+
+    Returns:
+        pd.DataFrame: DataFrame.
+    """
+    index = decode_index(encoded['index'])
+    columns = decode_index(encoded['columns'])
+
+    # Columns are set afterwards, as column labels need not be unique
+    df = pd.DataFrame(
+        dict(enumerate(decode_column(column) for column in encoded['data'])),
+        index=index,
+        copy=False,
+    )
+    df.columns = columns
+    return df
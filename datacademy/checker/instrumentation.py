@@ -0,0 +1,328 @@
+"""Module containing the instrumentation of checks: the duration of their steps and the amount of bytes sent."""
+
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import AbstractContextManager, nullcontext
+from contextvars import ContextVar
+from pathlib import Path
+from threading import Lock
+from time import perf_counter, time
+from types import TracebackType
+
+import numpy as np
+from pydantic import BaseModel, PrivateAttr
+
+DEFAULT_CAPACITY = 1024
+"""Maximum amount of checks kept in memory by an instrumentation."""
+
+DEFAULT_PERCENTILES = (50.0, 95.0, 99.0)
+"""Percentiles of the summary of an instrumentation."""
+
+SPANS = ('validate', 'digest', 'create', 'serialize', 'compress', 'http', 'parse', 'render')
+"""Names of the steps of a check that are timed, in the order they happen."""
+
+
+class CheckTrace(BaseModel):
+    """Pydantic model for the measurements of a single check.
+
+    NOTE: Streamed requests are serialized and compressed while they are sent, so this is part of the `http` span.
+    """
+
+    module: str
+    """Module identifier."""
+
+    question: str
+    """Question identifier, or comma separated identifiers for batches."""
+
+    started: float
+    """Time at which the check started, in seconds since the epoch."""
+
+    duration: float = 0.0
+    """Seconds the check took in total."""
+
+    spans: dict[str, float] = {}
+    """Seconds spent per step, summed if a step happened multiple times, such as retried requests."""
+
+    bytes_sent: int = 0
+    """Amount of bytes of request bodies sent, after compression."""
+
+    bytes_received: int = 0
+    """Amount of bytes of response bodies received."""
+
+    outcome: str | None = None
+    """Outcome of the check: `correct`, `incorrect`, `error` or `queued`."""
+
+    _counter: float = PrivateAttr(default=0.0)
+
+    def span(self, name: str) -> 'Span':
+        """Time a step of this check.
+
+        Args:
+            name (str): Name of the step.
+
+        Returns:
+            Span: Context manager that adds the duration of its body to the step.
+        """
+        return Span(self, name)
+
+
+class Span:
+    """Context manager that times a step of a check."""
+
+    __slots__ = ('trace', 'name', 'started')
+
+    def __init__(self, trace: CheckTrace, name: str) -> None:
+        """Create a new span.
+
+        Args:
+            trace (CheckTrace): Trace of the check.
+            name (str): Name of the step.
+        """
+        self.trace = trace
+        self.name = name
+        self.started = 0.0
+
+    def __enter__(self) -> 'Span':
+        """Start timing.
+
+        Returns:
+            Span: This span.
+        """
+        self.started = perf_counter()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None
+    ) -> None:
+        """Stop timing, adding the duration to the step."""
+        spans = self.trace.spans
+        spans[self.name] = spans.get(self.name, 0.0) + perf_counter() - self.started
+
+
+CURRENT_TRACE: ContextVar[CheckTrace | None] = ContextVar('CURRENT_TRACE', default=None)
+"""Trace of the check that is running in the current context, if it is instrumented."""
+
+NO_SPAN = nullcontext()
+"""Context manager used instead of a span when the check is not instrumented."""
+
+
+def span(name: str) -> AbstractContextManager:
+    """Time a step of the check that is running in the current context, if it is instrumented.
+
+    Args:
+        name (str): Name of the step.
+
+    Returns:
+        AbstractContextManager: Context manager that times its body.
+    """
+    trace = CURRENT_TRACE.get()
+    return NO_SPAN if trace is None else Span(trace, name)
+
+
+def add_bytes(sent: int = 0, received: int = 0) -> None:
+    """Count bytes of the check that is running in the current context, if it is instrumented.
+
+    Args:
+        sent (int, optional): Amount of bytes sent. Defaults to 0.
+        received (int, optional): Amount of bytes received. Defaults to 0.
+    """
+    trace = CURRENT_TRACE.get()
+    if trace is not None:
+        trace.bytes_sent += sent
+        trace.bytes_received += received
+
+
+def count_sent(chunks: Iterable[bytes]) -> Iterable[bytes]:
+    """Count the bytes of a streamed body as they are sent, if the check is instrumented.
+
+    Args:
+        chunks (Iterable[bytes]): Chunks of the body.
+
+    Returns:
+        Iterable[bytes]: The same chunks.
+    """
+    trace = CURRENT_TRACE.get()
+    if trace is None:
+        return chunks
+
+    def _count() -> Iterator[bytes]:
+        for chunk in chunks:
+            trace.bytes_sent += len(chunk)
+            yield chunk
+
+    return _count()
+
+
+class Activation:
+    """Context manager that makes a trace the trace of the current context."""
+
+    __slots__ = ('trace', 'token')
+
+    def __init__(self, trace: CheckTrace) -> None:
+        """Create a new activation.
+
+        Args:
+            trace (CheckTrace): Trace.
+        """
+        self.trace = trace
+        self.token = None
+
+    def __enter__(self) -> CheckTrace:
+        """Activate the trace.
+
+        Returns:
+            CheckTrace: Trace.
+        """
+        self.token = CURRENT_TRACE.set(self.trace)
+        return self.trace
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None
+    ) -> None:
+        """Restore the previous trace of the current context."""
+        CURRENT_TRACE.reset(self.token)
+
+
+def activate(trace: CheckTrace | None) -> AbstractContextManager:
+    """Make a trace the trace of the current context, so steps are timed.
+
+    Args:
+        trace (CheckTrace | None): Trace, nothing is timed if None.
+
+    Returns:
+        AbstractContextManager: Context manager that activates the trace.
+    """
+    return NO_SPAN if trace is None else Activation(trace)
+
+
+TraceHook = Callable[[CheckTrace], None]
+"""Function that is called with the trace of every finished check."""
+
+
+class Instrumentation:
+    """Class that collects the traces of checks, keeping the most recent ones in memory."""
+
+    def __init__(self, *, capacity: int = DEFAULT_CAPACITY, hooks: Iterable[TraceHook] = ()) -> None:
+        """Create a new instrumentation.
+
+        Args:
+            capacity (int, optional): Maximum amount of traces kept in memory. Defaults to DEFAULT_CAPACITY.
+            hooks (Iterable[TraceHook], optional): Functions called with every finished trace, such as exporters.
+                Defaults to ().
+        """
+        self.hooks = list(hooks)
+        self.__traces: deque[CheckTrace] = deque(maxlen=capacity)
+
+    def add_hook(self, hook: TraceHook) -> None:
+        """Add a function that is called with every finished trace.
+
+        Args:
+            hook (TraceHook): Function.
+        """
+        self.hooks.append(hook)
+
+    def remove_hook(self, hook: TraceHook) -> None:
+        """Remove a function that is called with every finished trace.
+
+        Args:
+            hook (TraceHook): Function.
+        """
+        self.hooks.remove(hook)
+
+    def start(self, module: str, question: str) -> CheckTrace:
+        """Start the trace of a check.
+
+        Args:
+            module (str): Module identifier.
+            question (str): Question identifier.
+
+        Returns:
+            CheckTrace: Trace, which should be activated while the check runs.
+        """
+        trace = CheckTrace.model_construct(module=module, question=question, started=time(), spans={})
+        trace._counter = perf_counter()  # noqa: SLF001
+        return trace
+
+    def finish(self, trace: CheckTrace, outcome: str | None = None) -> None:
+        """Finish the trace of a check, keeping it and passing it to the hooks.
+
+        Args:
+            trace (CheckTrace): Trace.
+            outcome (str | None, optional): Outcome of the check. Defaults to None.
+        """
+        trace.duration = perf_counter() - trace._counter  # noqa: SLF001
+        trace.outcome = outcome
+        self.__traces.append(trace)
+        for hook in self.hooks:
+            hook(trace)
+
+    def traces(self) -> list[CheckTrace]:
+        """Get the traces kept in memory.
+
+        Returns:
+            list[CheckTrace]: Traces, oldest first.
+        """
+        return list(self.__traces)
+
+    def clear(self) -> None:
+        """Remove the traces kept in memory."""
+        self.__traces.clear()
+
+    def summary(self, percentiles: Iterable[float] = DEFAULT_PERCENTILES) -> dict[str, dict[str, float]]:
+        """Summarize the traces kept in memory.
+
+        Args:
+            percentiles (Iterable[float], optional): Percentiles to compute. Defaults to DEFAULT_PERCENTILES.
+
+        Returns:
+            dict[str, dict[str, float]]: Count, mean and percentiles of the total duration, of every step that
+                happened and of the amount of bytes, keyed like `p50`.
+        """
+        traces = self.traces()
+        percentiles = list(percentiles)
+        series: dict[str, list[float]] = {'total': [trace.duration for trace in traces]}
+        for name in SPANS:
+            values = [trace.spans[name] for trace in traces if name in trace.spans]
+            if len(values) > 0:
+                series[name] = values
+        series['bytes_sent'] = [float(trace.bytes_sent) for trace in traces]
+        series['bytes_received'] = [float(trace.bytes_received) for trace in traces]
+
+        summary: dict[str, dict[str, float]] = {}
+        for name, values in series.items():
+            if len(values) == 0:
+                continue
+            stats = {'count': float(len(values)), 'mean': float(np.mean(values))}
+            for percentile, value in zip(percentiles, np.percentile(values, percentiles), strict=True):
+                stats[f'p{percentile:g}'] = float(value)
+            summary[name] = stats
+        return summary
+
+
+class JsonLinesExporter:
+    """Hook that appends every finished trace to a file, as a line of JSON."""
+
+    def __init__(self, path: str | Path) -> None:
+        """Create a new exporter.
+
+        Args:
+            path (str | Path): Path of the file, which is created if it does not exist.
+        """
+        self.path = Path(path)
+        self.__lock = Lock()
+
+    def __call__(self, trace: CheckTrace) -> None:
+        """Append a trace to the file.
+
+        Args:
+            trace (CheckTrace): Trace.
+        """
+        line = trace.model_dump_json() + '\n'
+        with self.__lock, self.path.open('a', encoding='utf-8') as file:
+            file.write(line)
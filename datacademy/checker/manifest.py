@@ -0,0 +1,254 @@
+"""Module containing the question manifests, to reject structurally wrong answers without contacting the server."""
+
+import json
+from collections.abc import Callable
+from pathlib import Path
+from threading import Event, Thread
+
+import numpy as np
+import pandas as pd
+import requests
+from pydantic import BaseModel, ValidationError, model_validator
+
+from datacademy.util import get_cache_dir
+
+from .discovery import DISCOVERY_TIMEOUT
+from .response import VerificationResponse
+from .session import CheckerSession
+from .types import ANSWER_TYPES
+
+MANIFEST_URL = '/manifest'
+"""URL relative to the verification endpoint where the manifests of modules are published."""
+
+MANIFEST_CACHE_DIR = 'manifests'
+"""Directory within the cache directory where manifests are kept."""
+
+
+def type_name(answer: ANSWER_TYPES | None) -> str:
+    """Get the name of the type of an answer, as used in manifests.
+
+    Args:
+        answer (ANSWER_TYPES | None): Answer.
+
+    Returns:
+        str: Name of the type, such as `int`, `pandas.DataFrame` or `numpy.ndarray`.
+    """
+    if isinstance(answer, pd.DataFrame):
+        return 'pandas.DataFrame'
+    if isinstance(answer, np.ndarray):
+        return 'numpy.ndarray'
+    return type(answer).__name__
+
+
+def matches_dtype(dtype: object, expected: str) -> bool:
+    """Get whether a dtype matches an expected dtype.
+
+    Args:
+        dtype (object): Dtype, either from NumPy or a pandas extension dtype.
+        expected (str): Name of the expected dtype, such as `int64`, or its NumPy kind character, such as `i`.
+
+    Returns:
+        bool: True if it matches, False otherwise.
+    """
+    return str(dtype) == expected or getattr(dtype, 'kind', None) == expected
+
+
+class QuestionSpec(BaseModel):
+    """Pydantic model for the structure of the answer to a question.
+
+    NOTE: Only states what an answer must look like to possibly be correct, so it never rejects a correct answer.
+    """
+
+    types: list[str] | None = None
+    """Names of the types the answer may have, any type if None."""
+
+    columns: list[str] | None = None
+    """Columns a DataFrame answer must have, in any order."""
+
+    dtypes: dict[str, str] | None = None
+    """Expected dtype of columns of a DataFrame answer, or of the answer itself by the key `''` for arrays."""
+
+    min_shape: list[int] | None = None
+    """Minimum size of each dimension of a DataFrame or array answer, which also sets the amount of dimensions."""
+
+    max_shape: list[int | None] | None = None
+    """Maximum size of each dimension of a DataFrame or array answer, where None is unbounded."""
+
+    @model_validator(mode='after')
+    def _check_shapes(self) -> 'QuestionSpec':
+        """Check that the minimum and maximum shape have the same amount of dimensions.
+
+        Raises:
+            ValueError: If both are given, with a different amount of dimensions.
+
+        Returns:
+            QuestionSpec: This spec.
+        """
+        if self.min_shape is not None and self.max_shape is not None and len(self.min_shape) != len(self.max_shape):
+            raise ValueError(
+                f'min_shape has {len(self.min_shape)} dimension(s), but max_shape has {len(self.max_shape)}',
+            )
+        return self
+
+    def validate_answer(self, answer: ANSWER_TYPES | None) -> VerificationResponse | None:
+        """Validate the structure of an answer.
+
+        Args:
+            answer (ANSWER_TYPES | None): Answer.
+
+        Returns:
+            VerificationResponse | None: Response with the errors if the answer is structurally wrong, None otherwise.
+        """
+        response = VerificationResponse()
+        name = type_name(answer)
+        if self.types is not None and name not in self.types:
+            response.add_error(f'Expected an answer of type {" or ".join(self.types)}, but got {name}.')
+            return response
+
+        if isinstance(answer, pd.DataFrame | np.ndarray):
+            self.__validate_shape(answer.shape, response)
+        if isinstance(answer, pd.DataFrame):
+            self.__validate_columns(answer, response)
+        elif isinstance(answer, np.ndarray) and self.dtypes is not None and '' in self.dtypes \
+                and not matches_dtype(answer.dtype, self.dtypes['']):
+            response.add_error(f'Expected an array of dtype {self.dtypes[""]}, but got {answer.dtype}.')
+
+        return response if response.is_incorrect() else None
+
+    def __validate_shape(self, shape: tuple[int, ...], response: VerificationResponse) -> None:
+        """Validate the shape of a DataFrame or array answer.
+
+        Args:
+            shape (tuple[int, ...]): Shape of the answer.
+            response (VerificationResponse): Response to add the errors to.
+        """
+        # Both are checked, as specs that are not parsed from a manifest are not validated
+        for bounds in (self.min_shape, self.max_shape):
+            if bounds is not None and len(bounds) != len(shape):
+                response.add_error(f'Expected {len(bounds)} dimension(s), but got {len(shape)}.')
+                return
+
+        for dimension, size in enumerate(shape):
+            minimum = None if self.min_shape is None else self.min_shape[dimension]
+            maximum = None if self.max_shape is None else self.max_shape[dimension]
+            if minimum is not None and size < minimum:
+                response.add_error(f'Expected at least {minimum} along dimension {dimension}, but got {size}.')
+            if maximum is not None and size > maximum:
+                response.add_error(f'Expected at most {maximum} along dimension {dimension}, but got {size}.')
+
+    def __validate_columns(self, df: pd.DataFrame, response: VerificationResponse) -> None:
+        """Validate the columns of a DataFrame answer.
+
+        Args:
+            df (pd.DataFrame): Answer.
+            response (VerificationResponse): Response to add the errors to.
+        """
+        if self.columns is not None:
+            missing = [column for column in self.columns if column not in df.columns]
+            if len(missing) > 0:
+                response.add_error('The DataFrame is missing columns.', missing)
+
+        for column, expected in (self.dtypes or {}).items():
+            if column in df.columns and not matches_dtype(df[column].dtype, expected):
+                response.add_error(f'Expected column {column!r} to have dtype {expected}, but got {df[column].dtype}.')
+
+
+class QuestionManifest(BaseModel):
+    """Pydantic model for the structure of the answers to the questions of a module."""
+
+    module: str
+    """Module identifier."""
+
+    version: str
+    """Version of the manifest, which changes whenever the questions change."""
+
+    questions: dict[str, QuestionSpec] = {}
+    """Structure of the answers by question identifier."""
+
+    def validate_answer(self, question: str, answer: ANSWER_TYPES | None) -> VerificationResponse | None:
+        """Validate the structure of the answer to a question.
+
+        Args:
+            question (str): Question identifier.
+            answer (ANSWER_TYPES | None): Answer.
+
+        Returns:
+            VerificationResponse | None: Response with the errors if the answer is structurally wrong, None if it is
+                not or the question is not in the manifest.
+        """
+        spec = self.questions.get(question)
+        return None if spec is None else spec.validate_answer(answer)
+
+
+class ManifestLoader:
+    """Class to load the manifest of a module from the local cache and, in the background, from the server."""
+
+    def __init__(
+        self,
+        module: str,
+        url: Callable[[], str],
+        session: CheckerSession,
+        directory: Path | None = None
+    ) -> None:
+        """Create a new loader, loading the cached manifest and starting to ask the server for a newer version.
+
+        Args:
+            module (str): Module identifier.
+            url (Callable[[], str]): Function that gets the URL of the manifest, which is called in the background.
+            session (CheckerSession): Session to request the manifest with.
+            directory (Path | None, optional): Directory to cache the manifest in. Defaults to the `manifests`
+                directory in the cache directory.
+        """
+        self.module = module
+        self.url = url
+        self.session = session
+        self.directory = directory
+
+        self.manifest: QuestionManifest | None = None
+        try:
+            self.manifest = QuestionManifest.model_validate_json(self.__get_path().read_bytes())
+        except (OSError, ValidationError):
+            # Without a readable cache, the manifest is only used once it is loaded from the server
+            self.manifest = None
+
+        self.__done = Event()
+        Thread(target=self.__load, daemon=True).start()
+
+    def __load(self) -> None:
+        """Ask the server whether there is a newer version of the manifest, and cache it if there is."""
+        try:
+            # The version is sent as entity tag, so the server only returns the manifest if it changed
+            headers = {} if self.manifest is None else {'If-None-Match': json.dumps(self.manifest.version)}
+            response = self.session.request('GET', self.url(), headers=headers, timeout=DISCOVERY_TIMEOUT)
+            if response.status_code == 200:  # noqa: PLR2004
+                self.manifest = QuestionManifest.model_validate_json(response.content)
+                self.__get_path().write_bytes(response.content)
+        except (requests.RequestException, ValidationError, OSError):
+            # Servers without manifests are checked without pre-validation
+            pass
+        finally:
+            self.__done.set()
+
+    def __get_path(self) -> Path:
+        """Get the path where the manifest is cached.
+
+        Raises:
+            OSError: If the cache directory cannot be created.
+
+        Returns:
+            Path: Path.
+        """
+        directory = get_cache_dir(MANIFEST_CACHE_DIR) if self.directory is None else self.directory
+        return directory / f'{self.module}.json'
+
+    def wait(self, timeout: float | None = None) -> QuestionManifest | None:
+        """Wait until the manifest is loaded.
+
+        Args:
+            timeout (float | None, optional): Maximum seconds to wait. Defaults to None.
+
+        Returns:
+            QuestionManifest | None: Manifest, None if there is none or it has not been loaded in time.
+        """
+        self.__done.wait(timeout)
+        return self.manifest
@@ -2,19 +2,23 @@
 
 from datetime import datetime
 from enum import Enum
-from typing import Literal
+from typing import Any, Literal
 
 import numpy as np
 import pandas as pd
-from pydantic import BaseModel
+from pydantic import BaseModel, PrivateAttr, TypeAdapter, field_serializer
 
 from datacademy.util import check_isinstance
 
+from .encoding import decode_array, decode_frame, encode_array, encode_frame
 from .types import ANSWER_TYPES, OBJECT_TYPES
 
 DF_ORIENT: Literal['tight'] = 'tight'
 """DataFrame orientation to use when converting from/to JSON."""
 
+DATETIME_ADAPTER = TypeAdapter(datetime)
+"""Adapter to parse datetimes from JSON, as objects that are not validated keep them as strings."""
+
 
 class ObjectType(str, Enum):
     """Enum to for the type of object that is being sent."""
@@ -27,7 +31,9 @@ class ObjectType(str, Enum):
     LIST = 'list'
     DICT = 'dict'
     CSV = 'csv'
+    DATAFRAME = 'pandas.DataFrame'
     NP_ARRAY = 'numpy.ndarray'
+    NP_BUFFER = 'numpy.ndarray.buffer'
 
 
 class ObjectModel(BaseModel):
@@ -35,12 +41,32 @@ class ObjectModel(BaseModel):
     obj_type: ObjectType
     obj: OBJECT_TYPES
 
+    _value: ANSWER_TYPES | None = PrivateAttr(default=None)
+    _decoded: bool = PrivateAttr(default=False)
+
+    @field_serializer('obj')
+    def _serialize_obj(self, obj: OBJECT_TYPES) -> Any:  # noqa: ANN401
+        """Serialize the object by its own type, instead of matching it against every type of the union.
+
+        Args:
+            obj (OBJECT_TYPES): Object.
+
+        Returns:
+            Any: Object, which is serialized by inferring its type.
+        """
+        return obj
+
     @staticmethod
-    def create(obj: ANSWER_TYPES) -> 'ObjectModel':
+    def create(obj: ANSWER_TYPES, *, legacy: bool = False) -> 'ObjectModel':
         """Create a new request object.
 
+        NOTE: Skips validation, as the object is converted by this method itself. Objects parsed from requests are
+        still validated.
+
         Args:
             obj (obj_types): Object to create this RequestObject for.
+            legacy (bool, optional): Whether to encode DataFrames and arrays like servers without support for the
+                compact encodings expect, in the tight format and as nested lists. Defaults to False.
 
         Raises:
             NotImplementedError: If the type of the object is not supported.
@@ -49,24 +75,60 @@ class ObjectModel(BaseModel):
             RequestObject: Created RequestObject.
         """
         if isinstance(obj, pd.DataFrame):
-            return ObjectModel(
+            # Prefer the compact column by column encoding, which is only used if it keeps dtypes and index exactly
+            encoded = None if legacy else encode_frame(obj)
+            if encoded is not None:
+                return ObjectModel.model_construct(obj_type=ObjectType.DATAFRAME, obj=encoded)
+
+            # The tight format keeps the values, but not necessarily their dtypes and types
+            return ObjectModel.model_construct(
                 obj_type=ObjectType.CSV,
                 obj=obj.to_dict(orient=DF_ORIENT)
             )
 
         if isinstance(obj, np.ndarray):
-            return ObjectModel(
+            # Prefer the raw buffer, which keeps dtype and shape exactly
+            encoded = None if legacy else encode_array(obj)
+            if encoded is not None:
+                return ObjectModel.model_construct(obj_type=ObjectType.NP_BUFFER, obj=encoded)
+
+            return ObjectModel.model_construct(
                 obj_type=ObjectType.NP_ARRAY,
                 obj=obj.tolist()
             )
 
         if isinstance(obj, ANSWER_TYPES):
-            return ObjectModel(obj=obj, obj_type=ObjectType(type(obj).__name__))  # type: ignore
+            return ObjectModel.model_construct(obj=obj, obj_type=ObjectType(type(obj).__name__))
 
         raise NotImplementedError(f'RequestObject is not implemented for {type(obj)}')
 
+    @staticmethod
+    def lazy(data: dict[str, Any]) -> 'ObjectModel':
+        """Create a request object from trusted JSON, without validating or decoding the object until it is used.
+
+        Args:
+            data (dict[str, Any]): Parsed JSON of the request object.
+
+        Returns:
+            ObjectModel: Request object.
+        """
+        return ObjectModel.model_construct(obj_type=ObjectType(data['obj_type']), obj=data['obj'])
+
     def get(self) -> ANSWER_TYPES:
-        """Get the object.
+        """Get the object, which is decoded on first use.
+
+        NOTE: DataFrames and arrays are shared between calls, so changes to them are visible to later calls.
+
+        Returns:
+            Any: Object.
+        """
+        if not self._decoded:
+            self._value = self.__decode()
+            self._decoded = True
+        return self._value
+
+    def __decode(self) -> ANSWER_TYPES:
+        """Decode the object.
 
         Returns:
             Any: Object.
@@ -74,9 +136,15 @@ class ObjectModel(BaseModel):
         match self.obj_type:
             case ObjectType.CSV:
                 return pd.DataFrame.from_dict(check_isinstance(self.obj, dict), orient=DF_ORIENT)
+            case ObjectType.DATAFRAME:
+                return decode_frame(check_isinstance(self.obj, dict))
             case ObjectType.NP_ARRAY:
                 return np.array(check_isinstance(self.obj, list))
+            case ObjectType.NP_BUFFER:
+                return decode_array(check_isinstance(self.obj, dict))
             case ObjectType.DATETIME:
+                if isinstance(self.obj, str):
+                    return DATETIME_ADAPTER.validate_strings(self.obj)
                 check_isinstance(self.obj, datetime)
             case ObjectType.BOOL:
                 check_isinstance(self.obj, bool)
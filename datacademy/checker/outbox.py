@@ -0,0 +1,325 @@
+"""Module containing the durable queue of verification requests that could not be sent."""
+
+import logging
+import sqlite3
+from collections.abc import Callable
+from pathlib import Path
+from threading import Lock, Thread, current_thread
+from time import sleep, time
+
+from pydantic import BaseModel
+
+from .response import VerificationResponse
+
+LOGGER = logging.getLogger(__name__)
+"""Logger of the errors of the background worker, which cannot be raised to the caller."""
+
+DEFAULT_OUTBOX_BATCH_SIZE = 32
+"""Maximum amount of queued verification requests that are sent in a single batch."""
+
+DEFAULT_FLUSH_INTERVAL = 15.0
+"""Seconds to wait before sending queued verification requests again, after the server was unavailable."""
+
+DEFAULT_MAX_ATTEMPTS = 5
+"""Amount of times sending a queued verification request may fail with an error, before it is given up."""
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS outbox (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    module TEXT NOT NULL,
+    question TEXT NOT NULL,
+    digest TEXT NOT NULL,
+    body BLOB NOT NULL,
+    created REAL NOT NULL,
+    checked REAL,
+    response TEXT,
+    error TEXT,
+    shown INTEGER NOT NULL DEFAULT 0,
+    attempts INTEGER NOT NULL DEFAULT 0
+)
+"""
+"""Schema of the table holding the queued verification requests and their results."""
+
+
+class QueuedVerification(BaseModel):
+    """Pydantic model for a queued verification request, including its result once it has been checked."""
+    id: int
+    module: str
+    question: str
+    digest: str
+    created: float
+    checked: float | None = None
+    response: VerificationResponse | None = None
+    error: str | None = None
+
+    def is_checked(self) -> bool:
+        """Get whether the request has been checked by the server.
+
+        Returns:
+            bool: True if a response or error was received, False otherwise.
+        """
+        return self.checked is not None
+
+
+FlushFunction = Callable[[list[QueuedVerification], list[bytes]], list[VerificationResponse | str] | None]
+"""Function that sends a batch of queued requests, returning None if the server is still unavailable."""
+
+
+class Outbox:
+    """Class for a durable queue of verification requests, which are sent in batches in the background.
+
+    NOTE: Requests are kept in a SQLite database, so they survive a restart of the kernel. Results are kept until they
+    are shown.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        *,
+        batch_size: int = DEFAULT_OUTBOX_BATCH_SIZE,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS
+    ) -> None:
+        """Create a new outbox.
+
+        Args:
+            path (str | Path): Path of the SQLite database, which is created if it does not exist.
+            batch_size (int, optional): Maximum amount of requests sent in a single batch.
+                Defaults to DEFAULT_OUTBOX_BATCH_SIZE.
+            flush_interval (float, optional): Seconds to wait before sending requests again, after the server was
+                unavailable. Defaults to DEFAULT_FLUSH_INTERVAL.
+            max_attempts (int, optional): Amount of times sending a request may fail with an error, such as a response
+                that cannot be parsed, before it is checked with that error instead. Times the server was unavailable
+                do not count. Defaults to DEFAULT_MAX_ATTEMPTS.
+        """
+        self.path = Path(path)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_attempts = max_attempts
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # The connection is shared with the worker, so every statement is run while holding the lock
+        self.__connection = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        self.__connection.execute('PRAGMA journal_mode=WAL')
+        self.__connection.execute(SCHEMA)
+        # Databases of earlier versions do not count the attempts yet
+        columns = {row[1] for row in self.__connection.execute('PRAGMA table_info(outbox)')}
+        if 'attempts' not in columns:
+            self.__connection.execute('ALTER TABLE outbox ADD COLUMN attempts INTEGER NOT NULL DEFAULT 0')
+        self.__lock = Lock()
+        self.__worker: Thread | None = None
+
+    def put(self, module: str, question: str, digest: str, body: bytes) -> QueuedVerification:
+        """Queue a verification request, unless the same answer is already waiting to be checked.
+
+        Args:
+            module (str): Module identifier.
+            question (str): Question identifier.
+            digest (str): Digest of the request.
+            body (bytes): JSON body of the request.
+
+        Returns:
+            QueuedVerification: Queued request.
+        """
+        with self.__lock:
+            row = self.__connection.execute(
+                'SELECT id, created FROM outbox WHERE module = ? AND question = ? AND digest = ? AND checked IS NULL',
+                (module, question, digest),
+            ).fetchone()
+            if row is None:
+                created = time()
+                cursor = self.__connection.execute(
+                    'INSERT INTO outbox (module, question, digest, body, created) VALUES (?, ?, ?, ?, ?)',
+                    (module, question, digest, body, created),
+                )
+                row = (cursor.lastrowid, created)
+
+        return QueuedVerification.model_construct(
+            id=row[0], module=module, question=question, digest=digest, created=row[1],
+            checked=None, response=None, error=None,
+        )
+
+    def pending(self, limit: int | None = None) -> list[tuple[QueuedVerification, bytes]]:
+        """Get the requests that are waiting to be checked, oldest first.
+
+        Args:
+            limit (int | None, optional): Maximum amount of requests, all if None. Defaults to None.
+
+        Returns:
+            list[tuple[QueuedVerification, bytes]]: Queued requests and their JSON bodies.
+        """
+        with self.__lock:
+            rows = self.__connection.execute(
+                'SELECT id, module, question, digest, created, body FROM outbox WHERE checked IS NULL '
+                'ORDER BY id LIMIT ?',
+                (-1 if limit is None else limit,),
+            ).fetchall()
+
+        return [
+            (
+                QueuedVerification.model_construct(
+                    id=id_, module=module, question=question, digest=digest, created=created,
+                    checked=None, response=None, error=None,
+                ),
+                body,
+            )
+            for id_, module, question, digest, created, body in rows
+        ]
+
+    def resolve(self, entries: list[QueuedVerification], outcomes: list[VerificationResponse | str]) -> None:
+        """Store the results of queued requests, after which their bodies are discarded.
+
+        Args:
+            entries (list[QueuedVerification]): Queued requests.
+            outcomes (list[VerificationResponse | str]): Verification responses or error messages, in the same order.
+        """
+        checked = time()
+        rows = [
+            (
+                checked,
+                outcome.model_dump_json() if isinstance(outcome, VerificationResponse) else None,
+                outcome if isinstance(outcome, str) else None,
+                entry.id,
+            )
+            for entry, outcome in zip(entries, outcomes, strict=True)
+        ]
+        with self.__lock:
+            self.__connection.executemany(
+                "UPDATE outbox SET checked = ?, response = ?, error = ?, body = x'' WHERE id = ?", rows,
+            )
+
+    def results(self, module: str | None = None, *, unseen: bool = True) -> list[QueuedVerification]:
+        """Get the results of queued requests that have been checked, marking them as shown.
+
+        Args:
+            module (str | None, optional): Module identifier, all modules if None. Defaults to None.
+            unseen (bool, optional): Whether to only get results that were not shown before. Defaults to True.
+
+        Returns:
+            list[QueuedVerification]: Checked requests, oldest first.
+        """
+        conditions = ['checked IS NOT NULL']
+        parameters: list[str] = []
+        if module is not None:
+            conditions.append('module = ?')
+            parameters.append(module)
+        if unseen:
+            conditions.append('shown = 0')
+        where = ' AND '.join(conditions)
+
+        with self.__lock:
+            rows = self.__connection.execute(
+                'SELECT id, module, question, digest, created, checked, response, error FROM outbox '  # noqa: S608
+                f'WHERE {where} ORDER BY id',
+                parameters,
+            ).fetchall()
+            self.__connection.execute(f'UPDATE outbox SET shown = 1 WHERE {where}', parameters)  # noqa: S608
+
+        return [
+            QueuedVerification(
+                id=id_, module=module, question=question, digest=digest, created=created, checked=checked,
+                response=None if response is None else VerificationResponse.parse(response),
+                error=error,
+            )
+            for id_, module, question, digest, created, checked, response, error in rows
+        ]
+
+    def clear(self) -> None:
+        """Remove all checked requests of which the results were shown."""
+        with self.__lock:
+            self.__connection.execute('DELETE FROM outbox WHERE shown = 1')
+
+    def __len__(self) -> int:
+        """Get the amount of requests that are waiting to be checked.
+
+        Returns:
+            int: Amount of requests.
+        """
+        with self.__lock:
+            return self.__connection.execute('SELECT COUNT(*) FROM outbox WHERE checked IS NULL').fetchone()[0]
+
+    def start(self, flush: FlushFunction) -> None:
+        """Send the queued requests in the background, unless this is already being done.
+
+        Args:
+            flush (FlushFunction): Function that sends a batch of queued requests.
+        """
+        with self.__lock:
+            if self.__worker is not None:
+                return
+            self.__worker = Thread(target=self.__flush, args=(flush,), daemon=True)
+            self.__worker.start()
+
+    def close(self) -> None:
+        """Close the database. Requests that were not checked yet are sent by the next outbox using it."""
+        with self.__lock:
+            self.__connection.close()
+
+    def __flush(self, flush: FlushFunction) -> None:
+        """Send the queued requests in batches, until none are left.
+
+        Args:
+            flush (FlushFunction): Function that sends a batch of queued requests.
+        """
+        try:
+            self.__flush_all(flush)
+        finally:
+            # Cleared if the worker stopped unexpectedly too, so the next call of `start` starts a new worker
+            with self.__lock:
+                if self.__worker is current_thread():
+                    self.__worker = None
+
+    def __flush_all(self, flush: FlushFunction) -> None:
+        """Send the queued requests in batches, until none are left or the outbox is closed.
+
+        Args:
+            flush (FlushFunction): Function that sends a batch of queued requests.
+        """
+        while True:
+            try:
+                pending = self.pending(self.batch_size)
+            except sqlite3.ProgrammingError:
+                # The outbox was closed
+                return
+            if len(pending) == 0:
+                with self.__lock:
+                    # Checked again while holding the lock, so requests queued meanwhile are not left behind
+                    if self.__connection.execute('SELECT 1 FROM outbox WHERE checked IS NULL').fetchone() is None:
+                        self.__worker = None
+                        return
+                continue
+
+            entries = [entry for entry, _ in pending]
+            try:
+                outcomes = flush(entries, [body for _, body in pending])
+            except Exception as error:
+                # Such as a response that cannot be parsed, after which the batch is sent again like when the server
+                # is unavailable, unless it failed too often
+                LOGGER.exception('Sending %d queued verification requests failed', len(entries))
+                self.__record_failure(entries, error)
+                outcomes = None
+            if outcomes is None:
+                sleep(self.flush_interval)
+                continue
+            self.resolve(entries, outcomes)
+
+    def __record_failure(self, entries: list[QueuedVerification], error: Exception) -> None:
+        """Count a failed attempt to send queued requests, checking those that failed too often with the error.
+
+        Args:
+            entries (list[QueuedVerification]): Queued requests.
+            error (Exception): Error of the attempt.
+        """
+        ids = [(entry.id,) for entry in entries]
+        with self.__lock:
+            self.__connection.executemany('UPDATE outbox SET attempts = attempts + 1 WHERE id = ?', ids)
+            failed = {
+                id_ for (id_,) in self.__connection.execute(
+                    'SELECT id FROM outbox WHERE attempts >= ? AND checked IS NULL', (self.max_attempts,),
+                )
+            }
+
+        failed_entries = [entry for entry in entries if entry.id in failed]
+        if len(failed_entries) > 0:
+            message = f'Checking the queued answer failed {self.max_attempts} times: {error}'
+            self.resolve(failed_entries, [message] * len(failed_entries))
@@ -1,7 +1,10 @@
 """Module containing the verification request class."""
 
+from collections.abc import Iterable
+
 from pydantic import BaseModel
 
+from .compression import decompress
 from .objects import ObjectModel
 from .types import ANSWER_TYPES
 
@@ -18,19 +21,53 @@ class VerificationRequest(BaseModel):
     answer: ObjectModel
     """ObjectModel containing the answer."""
 
+    digest: str | None = None
+    """Content digest of the answer as computed by the client, which the server remembers the result by."""
+
     @staticmethod
-    def create(module: str, question: str, answer: ANSWER_TYPES) -> 'VerificationRequest':
+    def create(
+        module: str,
+        question: str,
+        answer: ANSWER_TYPES,
+        digest: str | None = None,
+        *,
+        legacy: bool = False
+    ) -> 'VerificationRequest':
         """Creat a new answer.
 
         Args:
             module (str): Module identifier.
             question (str): Question identifier.
             answer (obj_types): Given answer.
+            digest (str | None, optional): Content digest of the answer, not sent if None. Defaults to None.
+            legacy (bool, optional): Whether to encode the answer like servers without support for the compact
+                encodings expect. Defaults to False.
 
         Returns:
             AnswerRequest: Answer object.
         """
-        return VerificationRequest(module=module, question=question, answer=ObjectModel.create(answer))
+        # The answer is converted by this package itself, so validating it again is redundant
+        return VerificationRequest.model_construct(
+            module=module, question=question, answer=ObjectModel.create(answer, legacy=legacy), digest=digest,
+        )
+
+    @staticmethod
+    def parse(
+        body: bytes,
+        content_encoding: str | None = None,
+        max_size: int | None = None
+    ) -> 'VerificationRequest':
+        """Parse the body of a request, which may be compressed.
+
+        Args:
+            body (bytes): Body of the request.
+            content_encoding (str | None, optional): Value of the `Content-Encoding` header. Defaults to None.
+            max_size (int | None, optional): Maximum amount of bytes of the decompressed body. Defaults to None.
+
+        Returns:
+            VerificationRequest: Verification request.
+        """
+        return VerificationRequest.model_validate_json(decompress(body, content_encoding, max_size))
 
     def get(self) -> ANSWER_TYPES | None:
         """Get the given answer.
@@ -39,3 +76,68 @@ class VerificationRequest(BaseModel):
             Any: Given answer.
         """
         return self.answer.get()
+
+
+class VerificationBatchRequest(BaseModel):
+    """Model class for multiple answers that are verified in a single request."""
+
+    requests: list[VerificationRequest]
+    """Verification requests, one for each answer."""
+
+    @staticmethod
+    def create(answers: Iterable[tuple[str, str, ANSWER_TYPES]]) -> 'VerificationBatchRequest':
+        """Create a new batch of answers.
+
+        Args:
+            answers (Iterable[tuple[str, str, ANSWER_TYPES]]): Triples of module identifier, question identifier and
+                given answer.
+
+        Returns:
+            VerificationBatchRequest: Batch of answers.
+        """
+        return VerificationBatchRequest.model_construct(requests=[
+            VerificationRequest.create(module=module, question=question, answer=answer)
+            for module, question, answer in answers
+        ])
+
+    @staticmethod
+    def parse(
+        body: bytes,
+        content_encoding: str | None = None,
+        max_size: int | None = None
+    ) -> 'VerificationBatchRequest':
+        """Parse the body of a request, which may be compressed.
+
+        Args:
+            body (bytes): Body of the request.
+            content_encoding (str | None, optional): Value of the `Content-Encoding` header. Defaults to None.
+            max_size (int | None, optional): Maximum amount of bytes of the decompressed body. Defaults to None.
+
+        Returns:
+            VerificationBatchRequest: Batch of verification requests.
+        """
+        return VerificationBatchRequest.model_validate_json(decompress(body, content_encoding, max_size))
+
+    def get(self) -> list[ANSWER_TYPES | None]:
+        """Get the given answers.
+
+        Returns:
+            list[Any]: Given answers, in the order of the requests.
+        """
+        return [request.get() for request in self.requests]
+
+
+class VerificationDigestRequest(BaseModel):
+    """Model class for an answer that is identified by its content digest, instead of being sent."""
+
+    module: str
+    """Module indentifier."""
+
+    question: str
+    """Question identifier."""
+
+    digest: str
+    """Content digest of the answer."""
+
+    size: int
+    """Amount of bytes of the answer, which would be sent if the server does not know the digest."""
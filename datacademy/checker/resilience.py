@@ -0,0 +1,212 @@
+"""Module containing the retry policy and the health tracking of verification servers."""
+
+import random
+from collections.abc import Callable
+from threading import Lock, Thread
+from time import monotonic, sleep
+from typing import ClassVar
+from urllib.parse import urlsplit
+
+DEFAULT_RETRIES = 2
+"""Amount of times a failed verification request is retried."""
+
+DEFAULT_BACKOFF = 0.5
+"""Seconds to wait at most before the first retry, doubled for every next retry."""
+
+DEFAULT_MAX_BACKOFF = 8.0
+"""Maximum amount of seconds to wait before a retry."""
+
+RETRY_STATUS_CODES = frozenset({502, 503, 504})
+"""Status codes of responses to verification requests that are retried, besides requests that could not connect."""
+
+DEFAULT_FAILURE_THRESHOLD = 5
+"""Amount of consecutive failures after which requests to a server fail instantly."""
+
+DEFAULT_RESET_TIMEOUT = 30.0
+"""Seconds to wait before probing a server to which requests fail instantly."""
+
+MIN_CONNECT_TIMEOUT = 5.0
+"""Minimum amount of seconds of an adaptive connect timeout."""
+
+CONNECT_TIMEOUT_FACTOR = 4.0
+"""Factor between the average latency of a server and its adaptive connect timeout."""
+
+LATENCY_SMOOTHING = 0.2
+"""Weight of the latest latency in the exponentially weighted moving average of a server."""
+
+
+class CircuitOpenError(ConnectionError):
+    """Error raised when requests to a server fail instantly, as too many requests failed before."""
+
+    def __init__(self, retry_in: float) -> None:
+        """Create a new error.
+
+        Args:
+            retry_in (float): Seconds before the server will be probed again.
+        """
+        super().__init__(f'Server is unavailable, retrying in {retry_in:.0f} seconds')
+        self.retry_in = retry_in
+
+
+class RetryPolicy:
+    """Class for the retry policy of failed verification requests, using exponential backoff with jitter."""
+
+    def __init__(
+        self,
+        retries: int = DEFAULT_RETRIES,
+        backoff: float = DEFAULT_BACKOFF,
+        max_backoff: float = DEFAULT_MAX_BACKOFF
+    ) -> None:
+        """Create a new retry policy.
+
+        Args:
+            retries (int, optional): Amount of times a failed request is retried. Defaults to DEFAULT_RETRIES.
+            backoff (float, optional): Seconds to wait at most before the first retry. Defaults to DEFAULT_BACKOFF.
+            max_backoff (float, optional): Maximum seconds to wait before a retry. Defaults to DEFAULT_MAX_BACKOFF.
+        """
+        self.retries = retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+
+    def delay(self, attempt: int) -> float:
+        """Get the seconds to wait before retrying.
+
+        Args:
+            attempt (int): Amount of attempts that failed before, starting at 0.
+
+        Returns:
+            float: Random amount of seconds, so clients that failed at the same time do not retry at the same time.
+        """
+        return random.uniform(0, min(self.max_backoff, self.backoff * 2 ** attempt))  # noqa: S311
+
+
+class ServerHealth:
+    """Class that keeps track of the latency and failures of a server, shared by all checkers using it."""
+
+    __servers: ClassVar[dict[str, 'ServerHealth']] = {}
+    __servers_lock = Lock()
+
+    def __init__(
+        self,
+        failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+        reset_timeout: float = DEFAULT_RESET_TIMEOUT
+    ) -> None:
+        """Create a new health tracker.
+
+        Args:
+            failure_threshold (int, optional): Amount of consecutive failures after which requests fail instantly.
+                Defaults to DEFAULT_FAILURE_THRESHOLD.
+            reset_timeout (float, optional): Seconds to wait before probing the server after requests started to fail
+                instantly. Defaults to DEFAULT_RESET_TIMEOUT.
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+
+        self.latency: float | None = None
+        self.failures = 0
+        self.opened_at: float | None = None
+
+        self.__lock = Lock()
+        self.__probing = False
+
+    def connect_timeout(self, maximum: float) -> float:
+        """Get the timeout for connecting to the server, adapted to its latency.
+
+        NOTE: Only connecting is adapted, as the server can take longer to verify some answers than others.
+
+        Args:
+            maximum (float): Maximum amount of seconds.
+
+        Returns:
+            float: Timeout in seconds.
+        """
+        if self.latency is None:
+            return maximum
+        return min(maximum, max(MIN_CONNECT_TIMEOUT, self.latency * CONNECT_TIMEOUT_FACTOR))
+
+    def is_open(self) -> bool:
+        """Get whether requests to the server fail instantly.
+
+        Returns:
+            bool: True if requests fail instantly, False otherwise.
+        """
+        return self.opened_at is not None
+
+    def check(self, probe: Callable[[], bool]) -> None:
+        """Check whether a request can be sent to the server.
+
+        Args:
+            probe (Callable[[], bool]): Function that checks whether the server is available again, which is run in
+                the background while requests fail instantly.
+
+        Raises:
+            CircuitOpenError: If requests to the server fail instantly.
+        """
+        with self.__lock:
+            if self.opened_at is None:
+                return
+
+            if not self.__probing:
+                self.__probing = True
+                Thread(target=self.__probe, args=(probe,), daemon=True).start()
+            retry_in = max(0.0, self.opened_at + self.reset_timeout - monotonic())
+
+        raise CircuitOpenError(retry_in)
+
+    def record_success(self, latency: float) -> None:
+        """Record a successful request.
+
+        Args:
+            latency (float): Seconds the request took.
+        """
+        with self.__lock:
+            self.failures = 0
+            self.opened_at = None
+            if self.latency is None:
+                self.latency = latency
+            else:
+                self.latency += LATENCY_SMOOTHING * (latency - self.latency)
+
+    def record_failure(self) -> None:
+        """Record a failed request, after which requests fail instantly if too many requests failed in a row."""
+        with self.__lock:
+            self.failures += 1
+            if self.failures >= self.failure_threshold and self.opened_at is None:
+                self.opened_at = monotonic()
+
+    def __probe(self, probe: Callable[[], bool]) -> None:
+        """Probe the server until it is available again.
+
+        Args:
+            probe (Callable[[], bool]): Function that checks whether the server is available again.
+        """
+        try:
+            while self.opened_at is not None:
+                sleep(max(0.0, self.opened_at + self.reset_timeout - monotonic()))
+                if probe():
+                    with self.__lock:
+                        self.failures = 0
+                        self.opened_at = None
+                else:
+                    with self.__lock:
+                        self.opened_at = monotonic()
+        finally:
+            with self.__lock:
+                self.__probing = False
+
+    @classmethod
+    def get(cls, url: str) -> 'ServerHealth':
+        """Get the health tracker of the server of a URL.
+
+        Args:
+            url (str): URL.
+
+        Returns:
+            ServerHealth: Health tracker, shared by all checkers in this process.
+        """
+        parts = urlsplit(url)
+        server = f'{parts.scheme}://{parts.netloc}'
+        with cls.__servers_lock:
+            if server not in cls.__servers:
+                cls.__servers[server] = ServerHealth()
+            return cls.__servers[server]
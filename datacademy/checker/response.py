@@ -1,5 +1,8 @@
 """Module containing classes for the verification response."""
 
+import json
+from typing import Any
+
 from pydantic import BaseModel
 
 from .objects import ObjectModel
@@ -39,8 +42,24 @@ class VerificationMessage(BaseModel):
             Message: Message.
         """
         if obj is not None:
-            return VerificationMessage(message=message, obj=ObjectModel.create(obj))
-        return VerificationMessage(message=message)
+            return VerificationMessage.model_construct(message=message, obj=ObjectModel.create(obj))
+        return VerificationMessage.model_construct(message=message)
+
+    @staticmethod
+    def lazy(data: dict[str, Any]) -> 'VerificationMessage':
+        """Create a message from trusted JSON, of which the object is only decoded when it is used.
+
+        Args:
+            data (dict[str, Any]): Parsed JSON of the message.
+
+        Returns:
+            VerificationMessage: Message.
+        """
+        obj = data.get('obj')
+        return VerificationMessage.model_construct(
+            message=data['message'],
+            obj=None if obj is None else ObjectModel.lazy(obj),
+        )
 
     def get_object(self) -> ANSWER_TYPES | None:
         """Get the object.
@@ -166,3 +185,82 @@ class VerificationResponse(BaseModel):
             message (str): Message.
         """
         self.message_hints = message
+
+    @staticmethod
+    def lazy(data: dict[str, Any]) -> 'VerificationResponse':
+        """Create a response from trusted JSON, of which the objects are only decoded when they are used.
+
+        Args:
+            data (dict[str, Any]): Parsed JSON of the response.
+
+        Returns:
+            VerificationResponse: Response.
+        """
+        fields = {name: value for name, value in data.items() if name in VerificationResponse.model_fields}
+        for name in ('errors', 'hints', 'info'):
+            fields[name] = [VerificationMessage.lazy(message) for message in data.get(name, [])]
+        return VerificationResponse.model_construct(**fields)
+
+    @staticmethod
+    def parse(content: str | bytes) -> 'VerificationResponse':
+        """Parse a response returned by the server.
+
+        NOTE: Skips validation, as the response is created by the server itself. Objects accompanying the messages are
+        decoded when they are used.
+
+        Args:
+            content (str | bytes): JSON of the response.
+
+        Returns:
+            VerificationResponse: Response.
+        """
+        return VerificationResponse.lazy(json.loads(content))
+
+
+class VerificationBatchResponse(BaseModel):
+    """Model class for the responses to a batch of answers."""
+
+    responses: list[VerificationResponse] = []
+    """Responses, in the order of the requests in the batch."""
+
+    @staticmethod
+    def parse(content: str | bytes) -> 'VerificationBatchResponse':
+        """Parse a batch response returned by the server, like `VerificationResponse.parse`.
+
+        Args:
+            content (str | bytes): JSON of the batch response.
+
+        Returns:
+            VerificationBatchResponse: Batch response.
+        """
+        data = json.loads(content)
+        return VerificationBatchResponse.model_construct(
+            responses=[VerificationResponse.lazy(response) for response in data.get('responses', [])],
+        )
+
+
+class VerificationDigestResponse(BaseModel):
+    """Model class for the response to an answer that is identified by its content digest."""
+
+    known: bool = False
+    """Whether the server knows the result for the digest, otherwise the answer should be sent."""
+
+    response: VerificationResponse | None = None
+    """Response to the answer, if the server knows the result."""
+
+    @staticmethod
+    def parse(content: str | bytes) -> 'VerificationDigestResponse':
+        """Parse a digest response returned by the server, like `VerificationResponse.parse`.
+
+        Args:
+            content (str | bytes): JSON of the digest response.
+
+        Returns:
+            VerificationDigestResponse: Digest response.
+        """
+        data = json.loads(content)
+        response = data.get('response')
+        return VerificationDigestResponse.model_construct(
+            known=data.get('known', False),
+            response=None if response is None else VerificationResponse.lazy(response),
+        )
@@ -0,0 +1,100 @@
+"""Module containing the pooled HTTP session used by the checker."""
+
+from threading import Lock
+from time import monotonic
+from types import TracebackType
+from typing import Any
+
+import requests
+from requests import Response
+from requests.adapters import HTTPAdapter
+
+DEFAULT_POOL_SIZE = 10
+"""Maximum amount of keep-alive connections kept open per host."""
+
+DEFAULT_IDLE_TIMEOUT = 60.0
+"""Seconds after which idle connections are dropped instead of reused."""
+
+
+class CheckerSession:
+    """Class wrapping a keep-alive connection pool to the verification server."""
+
+    __shared: 'CheckerSession | None' = None
+    __shared_lock = Lock()
+
+    def __init__(self, *, pool_size: int = DEFAULT_POOL_SIZE, idle_timeout: float = DEFAULT_IDLE_TIMEOUT) -> None:
+        """Create a new session.
+
+        Args:
+            pool_size (int, optional): Maximum amount of connections kept open per host. Defaults to DEFAULT_POOL_SIZE.
+            idle_timeout (float, optional): Seconds after which idle connections are dropped.
+                Defaults to DEFAULT_IDLE_TIMEOUT.
+        """
+        self.pool_size = pool_size
+        self.idle_timeout = idle_timeout
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+        self.__lock = Lock()
+        self.__last_used = monotonic()
+
+    def request(self, method: str, url: str, **kwargs: Any) -> Response:  # noqa: ANN401
+        """Send a request over a pooled connection.
+
+        Args:
+            method (str): HTTP method.
+            url (str): URL to send the request to.
+            **kwargs (Any): Keyword arguments passed to `requests.Session.request`.
+
+        Returns:
+            Response: Response to the request.
+        """
+        with self.__lock:
+            # Connections idle for too long are likely closed by the server, so start with a fresh pool
+            if monotonic() - self.__last_used > self.idle_timeout:
+                self.session.close()
+            self.__last_used = monotonic()
+
+        try:
+            return self.session.request(method, url, **kwargs)
+        finally:
+            self.__last_used = monotonic()
+
+    def close(self) -> None:
+        """Close all pooled connections.
+
+        NOTE: The session stays usable, new connections are opened when needed.
+        """
+        self.session.close()
+
+    def __enter__(self) -> 'CheckerSession':
+        """Enter the context of this session.
+
+        Returns:
+            CheckerSession: This session.
+        """
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None
+    ) -> None:
+        """Exit the context of this session, closing all pooled connections."""
+        self.close()
+
+    @classmethod
+    def shared(cls) -> 'CheckerSession':
+        """Get the session that is shared by all checkers in this process.
+
+        Returns:
+            CheckerSession: Shared session.
+        """
+        with cls.__shared_lock:
+            if cls.__shared is None:
+                cls.__shared = CheckerSession()
+            return cls.__shared
@@ -0,0 +1,262 @@
+"""Module containing the streaming serialization of verification requests."""
+
+import hashlib
+import json
+from collections.abc import Callable, Iterable, Iterator
+from functools import partial
+
+import numpy as np
+import pandas as pd
+from pydantic_core import to_json
+
+from .compression import Codec
+from .encoding import BUFFER_KINDS, can_encode_array, can_encode_frame, iter_buffer
+from .instrumentation import span
+from .objects import ObjectType
+from .request import VerificationRequest
+from .types import ANSWER_TYPES
+
+DEFAULT_STREAM_THRESHOLD = 8 * 1024 * 1024
+"""Minimum amount of bytes of a DataFrame or array answer before its request is streamed."""
+
+
+def iter_column(values: np.ndarray) -> Iterator[str]:
+    """Serialize a one-dimensional array to JSON incrementally, like `encode_column`.
+
+    Args:
+        values (np.ndarray): Array that can be encoded.
+
+    Yields:
+        str: JSON chunks.
+    """
+    if values.dtype.kind in BUFFER_KINDS:
+        yield f'{{"dtype":{json.dumps(values.dtype.str)},"data":"'
+        yield from iter_buffer(values)
+        yield '"}'
+    else:
+        # Serialized like pydantic would, one column at a time
+        yield f'{{"dtype":"object","values":{to_json(values.tolist()).decode()}}}'
+
+
+def iter_index(index: pd.Index) -> Iterator[str]:
+    """Serialize an index to JSON incrementally, like `encode_index`.
+
+    Args:
+        index (pd.Index): Index that can be encoded.
+
+    Yields:
+        str: JSON chunks.
+    """
+    if isinstance(index, pd.RangeIndex):
+        yield json.dumps({'name': index.name, 'start': index.start, 'stop': index.stop, 'step': index.step})
+        return
+
+    yield f'{{"name":{json.dumps(index.name)},"values":'
+    yield from iter_column(index.to_numpy())
+    freq = getattr(index, 'freqstr', None)
+    yield '}' if freq is None else f',"freq":{json.dumps(freq)}}}'
+
+
+def iter_frame(df: pd.DataFrame) -> Iterator[str]:
+    """Serialize a DataFrame to JSON incrementally, like `encode_frame`.
+
+    Args:
+        df (pd.DataFrame): DataFrame that can be encoded.
+
+    Yields:
+        str: JSON chunks.
+    """
+    yield '{"index":'
+    yield from iter_index(df.index)
+    yield ',"columns":'
+    yield from iter_index(df.columns)
+    yield ',"data":['
+    for position, (_, series) in enumerate(df.items()):
+        if position > 0:
+            yield ','
+        yield from iter_column(series.to_numpy())
+    yield ']}'
+
+
+def iter_array(values: np.ndarray) -> Iterator[str]:
+    """Serialize an array to JSON incrementally, like `encode_array`.
+
+    Args:
+        values (np.ndarray): Array that can be encoded.
+
+    Yields:
+        str: JSON chunks.
+    """
+    yield f'{{"dtype":{json.dumps(values.dtype.str)},"shape":{json.dumps(list(values.shape))},"data":"'
+    yield from iter_buffer(values)
+    yield '"}'
+
+
+class RequestBody:
+    """Class for the JSON body of a verification request, which is either serialized at once or streamed."""
+
+    def __init__(
+        self,
+        chunks: Callable[[], Iterable[str | bytes]],
+        *,
+        streamed: bool,
+        legacy: Callable[[], 'RequestBody'] | None = None
+    ) -> None:
+        """Create a new request body.
+
+        Args:
+            chunks (Callable[[], Iterable[str | bytes]]): Function that serializes the body, chunk by chunk.
+            streamed (bool): Whether the body is streamed, instead of being kept in memory.
+            legacy (Callable[[], RequestBody] | None, optional): Function that creates the body in the encoding of
+                servers without support for the compact encodings, None if it is the same. Defaults to None.
+        """
+        self.__chunks = chunks
+        self.streamed = streamed
+        self.legacy = legacy
+
+    def __iter__(self) -> Iterator[bytes]:
+        """Serialize the body, chunk by chunk. A streamed body is serialized again each time.
+
+        Yields:
+            bytes: Chunks of UTF-8 encoded JSON.
+        """
+        for chunk in self.__chunks():
+            yield chunk.encode('utf-8') if isinstance(chunk, str) else chunk
+
+    def read(self) -> bytes:
+        """Serialize the complete body at once.
+
+        Returns:
+            bytes: UTF-8 encoded JSON.
+        """
+        return b''.join(self)
+
+    def digest(self) -> str:
+        """Compute a stable digest of the body, without keeping a streamed body in memory.
+
+        Returns:
+            str: Hexadecimal SHA-256 digest.
+        """
+        digest = hashlib.sha256()
+        for chunk in self:
+            digest.update(chunk)
+        return digest.hexdigest()
+
+    def compress(self, codec: Codec) -> Iterator[bytes]:
+        """Serialize and compress the body, chunk by chunk.
+
+        Args:
+            codec (Codec): Codec to compress with.
+
+        Yields:
+            bytes: Compressed chunks.
+        """
+        compressor = codec.compressor()
+        for chunk in self:
+            compressed = compressor.compress(chunk)
+            if compressed:
+                yield compressed
+        yield compressor.flush()
+
+    @staticmethod
+    def create(
+        module: str,
+        question: str,
+        answer: ANSWER_TYPES,
+        stream_threshold: int | None = DEFAULT_STREAM_THRESHOLD,
+        digest: str | None = None,
+        *,
+        legacy: bool = False
+    ) -> 'RequestBody':
+        """Create the body of a verification request.
+
+        NOTE: Only DataFrames and arrays that can be encoded as raw buffers are streamed, where memory-mapped arrays
+        are streamed regardless of their size.
+
+        Args:
+            module (str): Module identifier.
+            question (str): Question identifier.
+            answer (ANSWER_TYPES): Given answer.
+            stream_threshold (int | None, optional): Minimum amount of bytes of an answer before it is streamed,
+                never streamed if None. Defaults to DEFAULT_STREAM_THRESHOLD.
+            digest (str | None, optional): Content digest of the answer, not sent if None. Defaults to None.
+            legacy (bool, optional): Whether to encode the answer like servers without support for the compact
+                encodings expect, which is never streamed and does not contain the digest. Defaults to False.
+
+        Returns:
+            RequestBody: Request body.
+        """
+        if legacy:
+            with span('create'):
+                request = VerificationRequest.create(module=module, question=question, answer=answer, legacy=True)
+            with span('serialize'):
+                legacy_data = request.model_dump_json(exclude={'digest'})
+            return RequestBody(lambda: (legacy_data,), streamed=False)
+
+        # Only DataFrames and arrays are encoded differently for servers without support for the compact encodings
+        fallback = None
+        if isinstance(answer, pd.DataFrame | np.ndarray):
+            fallback = partial(RequestBody.create, module, question, answer, legacy=True)
+
+        obj_type: ObjectType | None = None
+        if stream_threshold is not None:
+            if isinstance(answer, pd.DataFrame) and can_encode_frame(answer) \
+                    and answer.memory_usage(index=True, deep=False).sum() >= stream_threshold:
+                obj_type, iter_obj = ObjectType.DATAFRAME, iter_frame
+            elif isinstance(answer, np.ndarray) and can_encode_array(answer) \
+                    and (answer.nbytes >= stream_threshold or isinstance(answer, np.memmap)):
+                # Memory-mapped arrays are always streamed, so they are never encoded in memory as a whole
+                obj_type, iter_obj = ObjectType.NP_BUFFER, iter_array
+
+        if obj_type is None:
+            with span('create'):
+                request = VerificationRequest.create(module=module, question=question, answer=answer, digest=digest)
+            with span('serialize'):
+                data = request.model_dump_json()
+            return RequestBody(lambda: (data,), streamed=False, legacy=fallback)
+
+        def _chunks() -> Iterator[str]:
+            yield f'{{"module":{json.dumps(module)},"question":{json.dumps(question)},"digest":{json.dumps(digest)},'
+            yield f'"answer":{{"obj_type":"{obj_type.value}","obj":'
+            yield from iter_obj(answer)
+            yield '}}'
+
+        return RequestBody(_chunks, streamed=True, legacy=fallback)
+
+    @staticmethod
+    def wrap(data: bytes) -> 'RequestBody':
+        """Create a request body from JSON that was serialized before.
+
+        Args:
+            data (bytes): UTF-8 encoded JSON.
+
+        Returns:
+            RequestBody: Request body.
+        """
+        return RequestBody(lambda: (data,), streamed=False)
+
+    @staticmethod
+    def join(bodies: list['RequestBody']) -> 'RequestBody':
+        """Join the bodies of verification requests into the body of a batch verification request.
+
+        Args:
+            bodies (list[RequestBody]): Bodies of the verification requests.
+
+        Returns:
+            RequestBody: Body of the batch verification request.
+        """
+        def _chunks() -> Iterator[str | bytes]:
+            yield '{"requests":['
+            for position, body in enumerate(bodies):
+                if position > 0:
+                    yield ','
+                yield from body
+            yield ']}'
+
+        def _legacy() -> 'RequestBody':
+            return RequestBody.join([body if body.legacy is None else body.legacy() for body in bodies])
+
+        streamed = any(body.streamed for body in bodies)
+        if all(body.legacy is None for body in bodies):
+            return RequestBody(_chunks, streamed=streamed)
+        return RequestBody(_chunks, streamed=streamed, legacy=_legacy)
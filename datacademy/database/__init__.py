@@ -1,5 +1,7 @@
 """Module containing the logic for the database."""
 
-from .connection import DatabaseConnection
+from .connection import DEFAULT_CHUNK_SIZE, DatabaseConnection
+from .frame import CATEGORY_MAX_RATIO, rows_to_frame
+from .tracking import ChangeTracker
 
-__all__ = ['DatabaseConnection']
+__all__ = ['CATEGORY_MAX_RATIO', 'DEFAULT_CHUNK_SIZE', 'ChangeTracker', 'DatabaseConnection', 'rows_to_frame']
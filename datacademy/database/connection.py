@@ -1,18 +1,38 @@
 """Module containing the core database components."""
 
+import sqlite3
+from collections.abc import Iterator
+from pathlib import Path
+
 import pandas as pd
 from sqlalchemy import CursorResult, create_engine
 from sqlalchemy.orm import DeclarativeBase, Session
+from sqlalchemy.pool import StaticPool
 from sqlalchemy.sql import text
 
+from datacademy.util import check_isinstance
+
+from .frame import rows_to_frame
+
+DEFAULT_CHUNK_SIZE = 10_000
+"""Amount of rows per chunk of the results of `DatabaseConnection.query_iter`."""
+
 
 class DatabaseConnection:
     """Class that can be used to establish a new database connection."""
 
-    def __init__(self, database_location: str) -> None:
-        """Create a new database connection."""
+    def __init__(self, database_location: str, *, single_connection: bool = False) -> None:
+        """Create a new database connection.
+
+        Args:
+            database_location (str): Location of the SQLite database.
+            single_connection (bool, optional): Whether all queries share a single connection, so temporary tables
+                and triggers of the connection apply to all of them. Defaults to False.
+        """
         self.engine = create_engine(
-            f'sqlite:///{database_location}', connect_args={'check_same_thread': False},
+            f'sqlite:///{database_location}',
+            connect_args={'check_same_thread': False},
+            **({'poolclass': StaticPool} if single_connection else {}),
         )
 
     def create_database(self, base: type[DeclarativeBase]) -> None:
@@ -27,6 +47,22 @@ class DatabaseConnection:
         base.metadata.drop_all(bind=self.engine)
         base.metadata.create_all(bind=self.engine)
 
+    def copy_from(self, path: str | Path) -> None:
+        """Replace the database by a copy of another SQLite database, using the online backup API.
+
+        NOTE: Drops all existing tables, like `create_database`.
+
+        Args:
+            path (str | Path): Location of the database to copy, which is opened read-only.
+        """
+        source = sqlite3.connect(f'{Path(path).resolve().as_uri()}?mode=ro', uri=True)
+        connection = self.engine.raw_connection()
+        try:
+            source.backup(check_isinstance(connection.driver_connection, sqlite3.Connection))
+        finally:
+            connection.close()
+            source.close()
+
     def get_session(self) -> Session:
         """Get a new session.
 
@@ -35,39 +71,111 @@ class DatabaseConnection:
         """
         return Session(bind=self.engine)
 
-    def query(self, sql: str) -> pd.DataFrame | None:
+    def query(self, sql: str, max_rows: int | None = None, *, categories: bool = False) -> pd.DataFrame | None:
         """Execute an sql query on the database.
 
         Args:
             sql (str): SQL query.
+            max_rows (int | None, optional): Maximum amount of rows to return, such as for a preview, where the other
+                rows are never fetched. Defaults to None, which returns all rows.
+            categories (bool, optional): Whether to convert text columns with mostly repeated values to categories.
+                Defaults to False.
+
+        Raises:
+            ValueError: If the maximum amount of rows is negative.
 
         Returns:
             pd.DataFrame | None: Dataframe if rows are returned, None otherwise.
         """
+        if max_rows is not None and max_rows < 0:
+            raise ValueError(f'Maximum amount of rows must not be negative, but got {max_rows}')
+
         with self.engine.connect() as connection:
             result: CursorResult = connection.execute(text(sql))
 
             if result.returns_rows:
                 columns = list(result.keys())
-                data = [list(row) for row in result]
-
-                return pd.DataFrame(columns=columns, data=data)
-
-            first_command = sql.strip().lower().split(' ')[0]
-            match first_command:
-                case 'create':
-                    print('Table created successfully!')  # noqa: T201
-                case 'insert':
-                    print('Data inserted successfully!')  # noqa: T201
-                case 'update':
-                    print('Data record updated successfully!')  # noqa: T201
-                case 'delete':
-                    print('Data record deleted successfully!')  # noqa: T201
-                case 'drop':
-                    print('Table dropped successfully!')  # noqa: T201
-
+                # Textual SQL has no result processing, so the rows of the cursor are used without a Row for each
+                cursor = result.cursor
+                if max_rows is None:
+                    rows = cursor.fetchall()
+                elif max_rows > 0:
+                    rows = cursor.fetchmany(max_rows)
+                else:
+                    # Fetching zero rows would fetch the default amount of the cursor instead
+                    rows = []
+                result.close()
+
+                return rows_to_frame(columns, rows, categories=categories)
+
+            self.__report(sql)
             connection.commit()
 
             return None
 
+    def query_iter(
+        self,
+        sql: str,
+        chunksize: int = DEFAULT_CHUNK_SIZE,
+        *,
+        categories: bool = False
+    ) -> Iterator[pd.DataFrame]:
+        """Execute an sql query on the database, getting the rows in chunks so only one chunk is in memory at a time.
+
+        NOTE: The connection is in use until all chunks are read or the iterator is closed.
 
+        NOTE: The dtypes are inferred for every chunk, so they can differ between chunks, such as an integer column
+        that is float in a chunk where it contains NULL, or object in a chunk where it contains only NULL.
+
+        Args:
+            sql (str): SQL query.
+            chunksize (int, optional): Maximum amount of rows per chunk. Defaults to DEFAULT_CHUNK_SIZE.
+            categories (bool, optional): Whether to convert text columns with mostly repeated values to categories,
+                which is decided for every chunk. Defaults to False.
+
+        Raises:
+            ValueError: If the amount of rows per chunk is not positive, when the first chunk is requested.
+
+        Yields:
+            Iterator[pd.DataFrame]: Dataframe for every chunk of rows, or a single empty one if no rows are returned.
+                Nothing is yielded if the query does not return rows.
+        """
+        if chunksize < 1:
+            raise ValueError(f'Amount of rows per chunk must be positive, but got {chunksize}')
+
+        with self.engine.connect() as connection:
+            result: CursorResult = connection.execution_options(stream_results=True).execute(text(sql))
+
+            if result.returns_rows:
+                columns = list(result.keys())
+                cursor = result.cursor
+                rows = cursor.fetchmany(chunksize)
+                # The first chunk is yielded even if it is empty, so the columns are known
+                yield rows_to_frame(columns, rows, categories=categories)
+                while len(rows) == chunksize and (rows := cursor.fetchmany(chunksize)):
+                    yield rows_to_frame(columns, rows, categories=categories)
+                result.close()
+                return
+
+            self.__report(sql)
+            connection.commit()
+
+    @staticmethod
+    def __report(sql: str) -> None:
+        """Print the outcome of an sql statement that does not return rows.
+
+        Args:
+            sql (str): SQL statement.
+        """
+        first_command = sql.strip().lower().split(' ')[0]
+        match first_command:
+            case 'create':
+                print('Table created successfully!')  # noqa: T201
+            case 'insert':
+                print('Data inserted successfully!')  # noqa: T201
+            case 'update':
+                print('Data record updated successfully!')  # noqa: T201
+            case 'delete':
+                print('Data record deleted successfully!')  # noqa: T201
+            case 'drop':
+                print('Table dropped successfully!')  # noqa: T201
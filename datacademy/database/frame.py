@@ -0,0 +1,50 @@
+"""Module containing the conversion of query results to DataFrames."""
+
+from collections.abc import Sequence
+
+import pandas as pd
+from pandas.api.types import infer_dtype
+
+CATEGORY_MAX_RATIO = 0.5
+"""Maximum ratio of distinct values to rows of a text column for it to be converted to a category."""
+
+
+def rows_to_frame(columns: Sequence[str], rows: Sequence[tuple], *, categories: bool = False) -> pd.DataFrame:
+    """Create a DataFrame from the rows of a query result, as the tuples of the cursor without a Row or list for each.
+
+    pandas infers the type of every column from its values. The declared types of the tables are not used, as SQLite
+    columns can hold values of any type and an expression can be named like a column, so converting values to the
+    declared type could silently change them, such as an average that is truncated to an integer.
+
+    Args:
+        columns (Sequence[str]): Names of the columns, which do not have to be unique.
+        rows (Sequence[tuple]): Rows, as tuples such as those of a DB-API cursor.
+        categories (bool, optional): Whether to convert text columns with mostly repeated values to categories.
+            Defaults to False.
+
+    Returns:
+        pd.DataFrame: DataFrame, which is the same as `pd.DataFrame(columns=columns, data=rows)` without categories.
+    """
+    frame = pd.DataFrame(rows, columns=pd.Index(columns)) if len(rows) > 0 else pd.DataFrame(columns=columns)
+
+    if categories:
+        for index in range(len(columns)):
+            column = frame.iloc[:, index]
+            if column.dtype == object and infer_dtype(column, skipna=True) == 'string':
+                frame.isetitem(index, to_category(column))
+    return frame
+
+
+def to_category(column: pd.Series) -> pd.Series:
+    """Convert a text column to a category, if its values are repeated often enough for that to save memory.
+
+    Args:
+        column (pd.Series): Column, of which the values are strings or None.
+
+    Returns:
+        pd.Series: Category, or the column itself if most values are distinct.
+    """
+    codes, uniques = pd.factorize(column)
+    if len(uniques) > CATEGORY_MAX_RATIO * len(column):
+        return column
+    return pd.Series(pd.Categorical.from_codes(codes, categories=uniques), index=column.index, name=column.name)
@@ -0,0 +1,231 @@
+"""Module containing the tracking of changed rows, so a database can be reset without copying all of it."""
+
+import sqlite3
+from collections.abc import Iterator
+from contextlib import contextmanager, suppress
+from pathlib import Path
+
+from datacademy.util import check_isinstance
+
+from .connection import DatabaseConnection
+
+JOURNAL_TABLE = 'datacademy_changes'
+"""Temporary table with the rowid of every changed row, by name of its table."""
+
+TRIGGER_PREFIX = 'datacademy_track_'
+"""Prefix of the names of the temporary triggers that fill the journal."""
+
+TRACKED_ROWS = {'INSERT': ('NEW',), 'UPDATE': ('OLD', 'NEW'), 'DELETE': ('OLD',)}
+"""Rows added to the journal by event, where both rows of an update are added as it can change the rowid."""
+
+PRISTINE_SCHEMA = 'datacademy_pristine'
+"""Name under which the pristine database is attached while resetting."""
+
+
+def quote(name: str) -> str:
+    """Quote an SQL identifier.
+
+    Args:
+        name (str): Identifier.
+
+    Returns:
+        str: Quoted identifier.
+    """
+    return '"' + name.replace('"', '""') + '"'
+
+
+class ChangeTracker:
+    """Class that keeps a journal of the rows changed in a database, to restore only those rows from a pristine copy.
+
+    NOTE: The journal and its triggers are temporary objects of the connection, so they do not show up in
+    `sqlite_master` and never end up in the database file. For them to see every query, the database must use a
+    single connection, see `DatabaseConnection(single_connection=True)`.
+    """
+
+    def __init__(self, database: DatabaseConnection, pristine_location: str | Path) -> None:
+        """Create a new change tracker.
+
+        Args:
+            database (DatabaseConnection): Database, which has the same content as the pristine database.
+            pristine_location (str | Path): Location of the pristine database.
+        """
+        self.database = database
+        self.pristine_location = Path(pristine_location)
+
+    def start(self) -> None:
+        """Start tracking the changes to every table of the database, which has the content of the pristine database."""
+        with self.__connect() as connection:
+            connection.execute(
+                f'CREATE TEMP TABLE IF NOT EXISTS {JOURNAL_TABLE} '
+                '(table_name TEXT NOT NULL, row_id INTEGER NOT NULL, PRIMARY KEY (table_name, row_id)) WITHOUT ROWID',
+            )
+            for (table,) in connection.execute(
+                "SELECT name FROM main.sqlite_master WHERE type = 'table' AND name NOT LIKE 'sqlite_%'",
+            ).fetchall():
+                self.__track(connection, table)
+            # A row replaced because of a conflict is deleted without firing the delete trigger otherwise
+            connection.execute('PRAGMA recursive_triggers = ON')
+            # The database is the same as the pristine database again, such as after it is copied
+            connection.execute(f'DELETE FROM temp.{JOURNAL_TABLE}')  # noqa: S608
+            connection.commit()
+
+    def reset(self) -> None:
+        """Restore the database to the content of the pristine database.
+
+        Rows in the journal are deleted and copied from the pristine database again. Tables that were dropped,
+        altered or recreated, which the journal does not cover, are copied as a whole. Objects that are not in the
+        pristine database, such as new tables, are dropped.
+
+        Raises:
+            FileNotFoundError: If the pristine database does not exist (anymore), in which case nothing is changed.
+        """
+        # Attaching a database that does not exist creates an empty one, which would drop every table
+        if not self.pristine_location.is_file():
+            raise FileNotFoundError(f'Pristine database {self.pristine_location} does not exist')
+
+        with self.__connect() as connection:
+            self.__attach(connection)
+            try:
+                connection.execute('BEGIN')
+                try:
+                    self.__restore(connection)
+                    connection.commit()
+                except BaseException:
+                    connection.rollback()
+                    raise
+            finally:
+                # Detaching fails while the rows of a query are being read, so it is left attached for the next reset
+                with suppress(sqlite3.Error):
+                    connection.execute(f'DETACH DATABASE {PRISTINE_SCHEMA}')
+
+    def __attach(self, connection: sqlite3.Connection) -> None:
+        """Attach the pristine database, unless it is still attached because a previous reset could not detach it.
+
+        Args:
+            connection (sqlite3.Connection): Connection.
+        """
+        attached = {name: file for _, name, file in connection.execute('PRAGMA database_list')}
+        if PRISTINE_SCHEMA in attached:
+            if Path(attached[PRISTINE_SCHEMA]) == self.pristine_location.resolve():
+                return
+            connection.execute(f'DETACH DATABASE {PRISTINE_SCHEMA}')
+        connection.execute(f'ATTACH DATABASE ? AS {PRISTINE_SCHEMA}', (str(self.pristine_location),))
+
+    def __restore(self, connection: sqlite3.Connection) -> None:
+        """Restore the changed rows and objects, within an open transaction.
+
+        Args:
+            connection (sqlite3.Connection): Connection, with the pristine database attached.
+        """
+        pristine = self.__get_objects(connection, PRISTINE_SCHEMA)
+        if len(pristine) == 0:
+            # Removed or replaced after it was checked, so the transaction is rolled back
+            raise FileNotFoundError(f'Pristine database {self.pristine_location} is empty')
+        current = self.__get_objects(connection, 'main')
+        triggers = {
+            name for (name,) in connection.execute("SELECT name FROM temp.sqlite_master WHERE type = 'trigger'")
+        }
+
+        # Dropping a table also drops its indexes and triggers, so tables go last
+        for (kind, name), sql in sorted(current.items(), key=lambda item: item[0][0] == 'table'):
+            if pristine.get((kind, name)) != sql:
+                connection.execute(f'DROP {kind.upper()} IF EXISTS main.{quote(name)}')
+
+        for (kind, name), sql in pristine.items():
+            if kind != 'table':
+                continue
+            if current.get((kind, name)) == sql and set(self.__get_triggers(name).values()) <= triggers:
+                self.__restore_rows(connection, name)
+            else:
+                # The journal does not cover this table, as it changed or its triggers are gone with the old table
+                connection.execute(f'DROP TABLE IF EXISTS main.{quote(name)}')
+                connection.execute(sql)
+                connection.execute(
+                    f'INSERT INTO main.{quote(name)} SELECT * FROM {PRISTINE_SCHEMA}.{quote(name)}',  # noqa: S608
+                )
+                self.__track(connection, name)
+
+        # Other objects that are missing, because they were dropped themselves or with their table
+        current = self.__get_objects(connection, 'main')
+        for (kind, name), sql in pristine.items():
+            if kind != 'table' and (kind, name) not in current:
+                connection.execute(sql)
+
+        connection.execute(f'DELETE FROM temp.{JOURNAL_TABLE}')  # noqa: S608
+
+    @staticmethod
+    def __restore_rows(connection: sqlite3.Connection, table: str) -> None:
+        """Restore the rows of a table that are in the journal.
+
+        Args:
+            connection (sqlite3.Connection): Connection, with the pristine database attached.
+            table (str): Name of the table.
+        """
+        changed = f'SELECT row_id FROM temp.{JOURNAL_TABLE} WHERE table_name = ?'  # noqa: S608
+        connection.execute(f'DELETE FROM main.{quote(table)} WHERE rowid IN ({changed})', (table,))  # noqa: S608
+        connection.execute(
+            f'INSERT INTO main.{quote(table)} SELECT * FROM {PRISTINE_SCHEMA}.{quote(table)} '  # noqa: S608
+            f'WHERE rowid IN ({changed})',
+            (table,),
+        )
+
+    @staticmethod
+    def __get_objects(connection: sqlite3.Connection, schema: str) -> dict[tuple[str, str], str]:
+        """Get the tables, indexes, views and triggers of a schema, except those SQLite creates itself.
+
+        Args:
+            connection (sqlite3.Connection): Connection.
+            schema (str): Name of the schema.
+
+        Returns:
+            dict[tuple[str, str], str]: SQL that created every object, by type and name.
+        """
+        objects = connection.execute(
+            f'SELECT type, name, sql FROM {schema}.sqlite_master '  # noqa: S608
+            "WHERE name NOT LIKE 'sqlite_%' AND sql IS NOT NULL",
+        )
+        return {(kind, name): sql for kind, name, sql in objects}
+
+    @staticmethod
+    def __get_triggers(table: str) -> dict[str, str]:
+        """Get the names of the triggers that track the changes to a table.
+
+        Args:
+            table (str): Name of the table.
+
+        Returns:
+            dict[str, str]: Name of the trigger by event.
+        """
+        return {event: f'{TRIGGER_PREFIX}{table}_{event.lower()}' for event in TRACKED_ROWS}
+
+    def __track(self, connection: sqlite3.Connection, table: str) -> None:
+        """Create the triggers that add the rows changed in a table to the journal.
+
+        Args:
+            connection (sqlite3.Connection): Connection.
+            table (str): Name of the table.
+        """
+        # Statements in triggers cannot name the schema, but temporary tables are found before those of the database
+        literal = "'" + table.replace("'", "''") + "'"
+        for event, trigger in self.__get_triggers(table).items():
+            inserts = ' '.join(
+                f'INSERT OR IGNORE INTO {JOURNAL_TABLE} VALUES ({literal}, {row}.rowid);'  # noqa: S608
+                for row in TRACKED_ROWS[event]
+            )
+            connection.execute(
+                f'CREATE TEMP TRIGGER IF NOT EXISTS {quote(trigger)} AFTER {event} ON main.{quote(table)} '
+                f'BEGIN {inserts} END',
+            )
+
+    @contextmanager
+    def __connect(self) -> Iterator[sqlite3.Connection]:
+        """Get the connection of the database, outside of SQLAlchemy so transactions can be controlled directly.
+
+        Yields:
+            Iterator[sqlite3.Connection]: Connection.
+        """
+        connection = self.database.engine.raw_connection()
+        try:
+            yield check_isinstance(connection.driver_connection, sqlite3.Connection)
+        finally:
+            connection.close()
@@ -1,10 +1,58 @@
-"""Module containing the logic for the different modules."""
+"""Module containing the logic for the different modules.
 
-from .m02_pcc import Module02
-from .m03_sql import Module03
-from .m04_ml import Module04
-from .m05_api import Module05
-from .m07_mla import Module07
-from .m09_final import Module09
+NOTE: Modules are imported when they are first used, so only the dependencies of the modules that are used are
+imported.
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .m02_pcc import Module02
+    from .m03_sql import Module03
+    from .m04_ml import Module04
+    from .m05_api import Module05
+    from .m07_mla import Module07
+    from .m09_final import Module09
+
+MODULES = {
+    'Module02': 'm02_pcc',
+    'Module03': 'm03_sql',
+    'Module04': 'm04_ml',
+    'Module05': 'm05_api',
+    'Module07': 'm07_mla',
+    'Module09': 'm09_final',
+}
+"""Submodule containing each module, by name of the module class."""
 
 __all__ = ['Module02', 'Module03', 'Module04', 'Module05', 'Module07', 'Module09']
+
+
+def __getattr__(name: str) -> type:
+    """Import a module class when it is first used.
+
+    Args:
+        name (str): Name of the module class.
+
+    Raises:
+        AttributeError: If there is no module class with the name.
+
+    Returns:
+        type: Module class.
+    """
+    if name not in MODULES:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+    module = getattr(import_module(f'.{MODULES[name]}', __name__), name)
+    # Later uses get the class directly, without calling this function
+    globals()[name] = module
+    return module
+
+
+def __dir__() -> list[str]:
+    """Get the names of this package, including the module classes that are not imported yet.
+
+    Returns:
+        list[str]: Names.
+    """
+    return sorted({*globals(), *MODULES})
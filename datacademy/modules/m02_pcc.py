@@ -1,8 +1,6 @@
 """Module containing the logic for module 2."""
-import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
-from sklearn.datasets import load_diabetes
 
 from datacademy.checker import DEFAULT_ADDRESS, DEFAULT_TIMEOUT, DEFAULT_URL
 
@@ -46,6 +44,9 @@ class Module02(Module):
         Returns:
             tuple[np.ndarray, np.ndarray, pd.DataFrame]: Tuple of X, Y and the DataFrame.
         """
+        # Imported here, as scikit-learn is slow to import
+        from sklearn.datasets import load_diabetes
+
         data = load_diabetes()
         x: np.ndarray = data['data']  # type: ignore
         y: np.ndarray = data['target']  # type: ignore
@@ -63,6 +64,9 @@ class Module02(Module):
             y (np.ndarray): Y.
             dataframe (pd.DataFrame): DataFrame from exercise.
         """
+        # Imported here, as matplotlib is slow to import
+        import matplotlib.pyplot as plt
+
         plt.scatter(y, dataframe['column_1'].to_list(), color='green', label='Column 1')
         plt.scatter(y, dataframe['column_2'].to_list(), color='red', label='Column 2')
 
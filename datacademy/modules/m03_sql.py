@@ -1,16 +1,45 @@
 """Module containing the logic for module 3."""
 
-from datetime import datetime
+import hashlib
+import os
+from collections.abc import Iterator
+from pathlib import Path
+from tempfile import mkstemp
 
 import pandas as pd
+from sqlalchemy import Connection, Date, Table, insert
+from sqlalchemy.schema import CreateTable
 
 from datacademy.checker import DEFAULT_ADDRESS, DEFAULT_TIMEOUT, DEFAULT_URL
-from datacademy.database import DatabaseConnection
+from datacademy.database import DEFAULT_CHUNK_SIZE, ChangeTracker, DatabaseConnection
 from datacademy.database.m03 import Base, Customer, Order, Product
 from datacademy.modules.module import Module
+from datacademy.util import get_cache_dir
 
 DEFAULT_DB_LOCATION = 'database.db'
 
+CSV_CHUNK_SIZE = 100_000
+"""Amount of rows of a resource CSV that are read and inserted at once, so large CSVs do not have to fit in memory."""
+
+DATE_FORMAT = '%d/%m/%Y'
+"""Format of the dates in the resource CSVs."""
+
+RESOURCES = {
+    Customer.__tablename__: 'customers.csv',
+    Product.__tablename__: 'products.csv',
+    Order.__tablename__: 'orders.csv',
+}
+"""Resource CSV of every table, in the order in which they are populated."""
+
+TEMPLATE_CACHE_DIR = 'm03'
+"""Directory within the cache directory where the template databases are kept."""
+
+TEMPLATE_VERSION = 1
+"""Version of the way template databases are built, which is part of their digest."""
+
+DIGEST_CHUNK_SIZE = 1024 * 1024
+"""Amount of bytes of a resource CSV that are read at once while computing the digest."""
+
 class Module03(Module):
     """Class for module 3."""
 
@@ -22,7 +51,8 @@ class Module03(Module):
         server_port: int | None = None,
         server_url: str = DEFAULT_URL,
         timeout: float = DEFAULT_TIMEOUT,
-        notebook: bool = True
+        notebook: bool = True,
+        template: bool = True
     ) -> None:
         """Create a new module 3 instance.
 
@@ -33,6 +63,8 @@ class Module03(Module):
             server_url (str, optional): URL from address[:port] to verification endpoint. Defaults to DEFAULT_URL.
             timeout (float, optional): Seconds before a checking request will time out. Defaults to DEFAULT_TIMEOUT.
             notebook (bool, optional): Whether this checker is run in a notebook. Defaults to True.
+            template (bool, optional): Whether to copy the database from a template in the cache directory, which
+                is built once for the content of the resources. Defaults to True.
         """
         super().__init__(
             'M03_SQL',
@@ -43,42 +75,157 @@ class Module03(Module):
             notebook=notebook
         )
 
-        self.connection = DatabaseConnection(database_location)
-        self.connection.create_database(Base)
-        self.__init_database()
-
-    def __init_database(self) -> None:
-        """Populate the database."""
-        with self.connection.get_session() as session:
-            # Add customers
-            df_customers = pd.read_csv(self.get_resource_path('customers.csv'))
-            for _, row in df_customers.iterrows():
-                session.add(Customer(row['id'], row['first_name'], row['last_name'], row['address']))
-
-            # Add products
-            df_products = pd.read_csv(self.get_resource_path('products.csv'))
-            for _, row in df_products.iterrows():
-                session.add(Product(row['id'], row['name'], row['price'], row['stock']))
-
-            # Add orders
-            df_orders = pd.read_csv(self.get_resource_path('orders.csv'))
-            for _, row in df_orders.iterrows():
-                date = datetime.strptime(row['date'], '%d/%m/%Y').date()  # noqa: DTZ007
-                session.add(Order(row['id'], row['customer_id'], row['product_id'], date, row['quantity']))
-
-            # Commit to DB
-            session.commit()
-
-    def query(self, sql: str) -> pd.DataFrame | None:
+        # A single connection, so the triggers that track changes for `reset` see every query
+        self.connection = DatabaseConnection(database_location, single_connection=True)
+
+        self.template_location = self.__get_template() if template else None
+        """Location of the template database the database was copied from, None if it was built from the CSVs."""
+
+        self.__tracker: ChangeTracker | None = None
+        self.__populate()
+
+    def reset(self) -> None:
+        """Undo all changes made to the database, such as deleted rows and dropped tables.
+
+        NOTE: If the database was copied from a template, only the changed rows and tables are copied from it again,
+        so this takes time proportional to the changes. Otherwise, or if the template was removed from the cache
+        directory, the database is populated again.
+        """
+        if self.__tracker is not None:
+            try:
+                self.__tracker.reset()
+                return
+            except FileNotFoundError:
+                # Built again if possible, such as after the cache directory was cleaned
+                self.template_location = self.__get_template()
+        self.__populate()
+
+    def __populate(self) -> None:
+        """Populate the database, by copying the template if there is one, or from the resource CSVs otherwise."""
+        self.__tracker = None
+        if self.template_location is None:
+            self.connection.create_database(Base)
+            self.__init_database(self.connection)
+        else:
+            self.connection.copy_from(self.template_location)
+            self.__tracker = ChangeTracker(self.connection, self.template_location)
+            self.__tracker.start()
+
+    def __get_template(self) -> Path | None:
+        """Get the template database for the content of the resources, building it if it does not exist yet.
+
+        Returns:
+            Path | None: Location of the template database, None if the cache directory cannot be written.
+        """
+        try:
+            path = get_cache_dir(TEMPLATE_CACHE_DIR) / f'{self.__get_resource_digest()}.db'
+            if not path.exists():
+                self.__build_template(path)
+        except OSError:
+            return None
+        return path
+
+    def __get_resource_digest(self) -> str:
+        """Compute the digest of the schema and the content of the resource CSVs.
+
+        Returns:
+            str: Hexadecimal digest.
+        """
+        digest = hashlib.blake2b(str(TEMPLATE_VERSION).encode(), digest_size=16)
+        for table in Base.metadata.sorted_tables:
+            digest.update(str(CreateTable(table)).encode())
+        for file in RESOURCES.values():
+            with self.get_resource_path(file).open('rb') as stream:
+                while chunk := stream.read(DIGEST_CHUNK_SIZE):
+                    digest.update(chunk)
+        return digest.hexdigest()
+
+    def __build_template(self, path: Path) -> None:
+        """Build a template database from the resource CSVs.
+
+        Args:
+            path (Path): Location of the template database.
+        """
+        # Built in a temporary file that is renamed once it is complete, so other processes never see a partial file
+        handle, temporary = mkstemp(suffix='.db', dir=path.parent)
+        os.close(handle)
+        try:
+            template = DatabaseConnection(temporary)
+            template.create_database(Base)
+            self.__init_database(template)
+            template.engine.dispose()
+            Path(temporary).replace(path)
+        finally:
+            Path(temporary).unlink(missing_ok=True)
+
+    def __init_database(self, database: DatabaseConnection) -> None:
+        """Populate a database in a single transaction, inserting the rows of every resource CSV in batches.
+
+        Args:
+            database (DatabaseConnection): Database, of which the tables are created.
+        """
+        with database.engine.begin() as connection:
+            for table_name, file in RESOURCES.items():
+                self.__load_csv(connection, Base.metadata.tables[table_name], file)
+
+    def __load_csv(self, connection: Connection, table: Table, file: str) -> None:
+        """Insert the rows of a resource CSV into a table, with a single statement per chunk of rows.
+
+        Args:
+            connection (Connection): Connection with an open transaction.
+            table (Table): Table.
+            file (str): Name of the resource CSV, which has a column for every column of the table.
+        """
+        columns = [column.name for column in table.columns]
+        dates = [column.name for column in table.columns if isinstance(column.type, Date)]
+        for chunk in pd.read_csv(self.get_resource_path(file), usecols=columns, chunksize=CSV_CHUNK_SIZE):
+            for column in dates:
+                chunk[column] = pd.to_datetime(chunk[column], format=DATE_FORMAT).dt.date
+            # Passing a list of rows runs the statement with executemany, without creating ORM objects
+            connection.execute(insert(table), chunk[columns].to_dict(orient='records'))
+
+    def query(self, sql: str, max_rows: int | None = None, *, categories: bool = False) -> pd.DataFrame | None:
         """Execute an sql query on the database.
 
         Args:
             sql (str): SQL query.
+            max_rows (int | None, optional): Maximum amount of rows to return, such as for a preview.
+                Defaults to None, which returns all rows.
+            categories (bool, optional): Whether to convert text columns with mostly repeated values to categories.
+                Defaults to False.
+
+        Raises:
+            ValueError: If the maximum amount of rows is negative.
 
         Returns:
             pd.DataFrame | None: Dataframe if rows are returned, None otherwise.
         """
-        return self.connection.query(sql)
+        return self.connection.query(sql, max_rows=max_rows, categories=categories)
+
+    def query_iter(
+        self,
+        sql: str,
+        chunksize: int = DEFAULT_CHUNK_SIZE,
+        *,
+        categories: bool = False
+    ) -> Iterator[pd.DataFrame]:
+        """Execute an sql query on the database, getting the rows in chunks so large results fit in memory.
+
+        NOTE: The dtypes are inferred for every chunk, so they can differ between chunks.
+
+        Args:
+            sql (str): SQL query.
+            chunksize (int, optional): Maximum amount of rows per chunk. Defaults to DEFAULT_CHUNK_SIZE.
+            categories (bool, optional): Whether to convert text columns with mostly repeated values to categories.
+                Defaults to False.
+
+        Raises:
+            ValueError: If the amount of rows per chunk is not positive, when the first chunk is requested.
+
+        Returns:
+            Iterator[pd.DataFrame]: Dataframe for every chunk of rows.
+        """
+        return self.connection.query_iter(sql, chunksize=chunksize, categories=categories)
 
     def check_query(self, question: str, sql: str) -> None:
         """Check the outcome of a query.
@@ -4,7 +4,6 @@ import random
 
 import numpy as np
 import pandas as pd
-from sklearn import datasets
 
 from datacademy.checker import DEFAULT_ADDRESS, DEFAULT_TIMEOUT, DEFAULT_URL
 
@@ -48,7 +47,9 @@ class Module04(Module):
         # Set imputed outlier index
         self.imputed_outlier_index = 72
 
-        # Load data
+        # Load data, where scikit-learn is imported here as it is slow to import
+        from sklearn import datasets
+
         self.data: dict[str, np.ndarray | list] = datasets.load_iris() # type: ignore
 
         # Initialize unsupervised dataset variable
@@ -1,22 +1,23 @@
 """Module containing the logic for module 5."""
 
 import json
-
-from fastapi import FastAPI
-from fastapi.testclient import TestClient
-from httpx import Response
+from typing import TYPE_CHECKING
 
 from datacademy.checker import DEFAULT_ADDRESS, DEFAULT_TIMEOUT, DEFAULT_URL
 
 from .module import Module
 
+if TYPE_CHECKING:
+    from fastapi import FastAPI
+    from httpx import Response
+
 
 class Module05(Module):
     """Class for module 5."""
 
     def __init__(
         self,
-        app: FastAPI | None = None,
+        app: 'FastAPI | None' = None,
         *,
         server_address: str = DEFAULT_ADDRESS,
         server_port: int | None = None,
@@ -43,6 +44,9 @@ class Module05(Module):
             notebook=notebook
         )
         if app:
+            # Imported here, as the test client imports FastAPI and httpx, which are slow to import
+            from fastapi.testclient import TestClient
+
             self.client = TestClient(app)
 
     def load_customers(self) -> dict[int, dict[str, str]]:
@@ -54,7 +58,7 @@ class Module05(Module):
         with self.get_resource_path('customers.json').open() as file:
             return dict(enumerate(json.load(file)))
 
-    def __check_status(self, response: Response, url: str) -> Response:
+    def __check_status(self, response: 'Response', url: str) -> 'Response':
         if response.status_code != 200:  # noqa: PLR2004
             raise ValueError(f'Expected response code 200 for {url}, but got {response.status_code} instead.')
 
@@ -1,7 +1,17 @@
 """Module containing the module base class."""
+from collections.abc import Iterable
 from pathlib import Path
+from types import TracebackType
 
-from datacademy.checker.checker import DEFAULT_ADDRESS, DEFAULT_TIMEOUT, DEFAULT_URL, Checker, T
+from datacademy.checker.checker import (
+    DEFAULT_ADDRESS,
+    DEFAULT_CONCURRENCY,
+    DEFAULT_TIMEOUT,
+    DEFAULT_URL,
+    Checker,
+    T,
+)
+from datacademy.checker.outbox import Outbox
 
 
 class Module:
@@ -54,6 +64,79 @@ class Module:
         """
         self.checker.check(question, answer)
 
+    async def acheck(self, question: str, answer: T) -> None:
+        """Check an answer without blocking the event loop.
+
+        Args:
+            question (str): Question identifier.
+            answer (T): The answer.
+        """
+        await self.checker.acheck(question, answer)
+
+    def check_many(self, answers: Iterable[tuple[str, T]], concurrency: int = DEFAULT_CONCURRENCY) -> None:
+        """Check multiple answers concurrently. Results are shown in the order of the answers.
+
+        Args:
+            answers (Iterable[tuple[str, T]]): Pairs of question identifier and answer.
+            concurrency (int, optional): Maximum amount of answers checked at the same time.
+                Defaults to DEFAULT_CONCURRENCY.
+        """
+        self.checker.check_many(answers, concurrency=concurrency)
+
+    def check_batch(self, answers: Iterable[tuple[str, T]]) -> None:
+        """Check multiple answers with a single request. Results are shown in the order of the answers.
+
+        Args:
+            answers (Iterable[tuple[str, T]]): Pairs of question identifier and answer.
+        """
+        self.checker.check_batch(answers)
+
+    async def acheck_many(self, answers: Iterable[tuple[str, T]], concurrency: int = DEFAULT_CONCURRENCY) -> None:
+        """Check multiple answers concurrently without blocking the event loop.
+
+        Args:
+            answers (Iterable[tuple[str, T]]): Pairs of question identifier and answer.
+            concurrency (int, optional): Maximum amount of answers checked at the same time.
+                Defaults to DEFAULT_CONCURRENCY.
+        """
+        await self.checker.acheck_many(answers, concurrency=concurrency)
+
+    def enable_outbox(self, outbox: Outbox | str | Path) -> Outbox:
+        """Queue answers when the server is unavailable, which are checked in the background once it is available.
+
+        Args:
+            outbox (Outbox | str | Path): Outbox, or path of its database.
+
+        Returns:
+            Outbox: Outbox.
+        """
+        return self.checker.enable_outbox(outbox)
+
+    def show_queued(self) -> None:
+        """Show the results of queued answers that have been checked since they were last shown."""
+        self.checker.show_queued()
+
+    def close(self) -> None:
+        """Close the pooled connections of the checker of this module."""
+        self.checker.close()
+
+    def __enter__(self) -> 'Module':
+        """Enter the context of this module.
+
+        Returns:
+            Module: This module.
+        """
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None
+    ) -> None:
+        """Exit the context of this module, closing the pooled connections of its checker."""
+        self.close()
+
     def get_resource_path(self, *path: str | Path) -> Path:
         """Get the path to a resource.
 
@@ -0,0 +1,6 @@
+"""Module containing a stand-in verification server, to test checkers without the hosted API."""
+
+from .app import DEFAULT_ERROR_STATUS, DEFAULT_MAX_BODY_SIZE, StandInServer, create_app
+from .local import LocalServer
+
+__all__ = ['DEFAULT_ERROR_STATUS', 'DEFAULT_MAX_BODY_SIZE', 'LocalServer', 'StandInServer', 'create_app']
@@ -0,0 +1,246 @@
+"""Module containing the stand-in verification server."""
+
+import asyncio
+import json
+import random
+from collections.abc import Callable
+
+from fastapi import FastAPI, HTTPException, Request, Response
+from pydantic import ValidationError
+
+from datacademy.checker.cache import ResultCache
+from datacademy.checker.checker import BATCH_URL, DEFAULT_URL, DIGEST_URL
+from datacademy.checker.digest import content_digest
+from datacademy.checker.manifest import MANIFEST_URL, QuestionManifest
+from datacademy.checker.request import VerificationBatchRequest, VerificationDigestRequest, VerificationRequest
+from datacademy.checker.response import VerificationBatchResponse, VerificationDigestResponse, VerificationResponse
+
+DEFAULT_MAX_BODY_SIZE = 256 * 1024 * 1024
+"""Maximum amount of bytes of a decompressed request body."""
+
+DEFAULT_ERROR_STATUS = 503
+"""Status code of injected errors."""
+
+VerifyFunction = Callable[[VerificationRequest], VerificationResponse]
+"""Function that verifies an answer."""
+
+
+def accept(request: VerificationRequest) -> VerificationResponse:  # noqa: ARG001
+    """Verify an answer by accepting it, whatever it is.
+
+    Args:
+        request (VerificationRequest): Verification request.
+
+    Returns:
+        VerificationResponse: Response stating the answer is correct.
+    """
+    return VerificationResponse()
+
+
+class StandInServer:
+    """Class for a server that verifies answers like the hosted API, including the digest-first protocol.
+
+    NOTE: Results are remembered by the content digest of the answers, so answers can be identified by their digest
+    after they were uploaded once.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        verify: VerifyFunction | None = None,
+        *,
+        results: ResultCache | None = None,
+        manifests: dict[str, QuestionManifest] | None = None,
+        max_body_size: int = DEFAULT_MAX_BODY_SIZE,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        error_status: int = DEFAULT_ERROR_STATUS,
+        seed: int | None = None
+    ) -> None:
+        """Create a new stand-in server.
+
+        Args:
+            verify (VerifyFunction | None, optional): Function that verifies an answer. Defaults to accepting every
+                answer.
+            results (ResultCache | None, optional): Cache of results by content digest. Defaults to a new in-memory
+                cache.
+            manifests (dict[str, QuestionManifest] | None, optional): Manifests of the questions by module identifier.
+                Defaults to no manifests.
+            max_body_size (int, optional): Maximum amount of bytes of a decompressed request body.
+                Defaults to DEFAULT_MAX_BODY_SIZE.
+            latency (float, optional): Seconds added to every verification request. Defaults to 0.0.
+            jitter (float, optional): Maximum seconds randomly added to the latency. Defaults to 0.0.
+            error_rate (float, optional): Fraction of verification requests that fail with the error status.
+                Defaults to 0.0.
+            error_status (int, optional): Status code of injected errors. Defaults to DEFAULT_ERROR_STATUS.
+            seed (int | None, optional): Seed of the random jitter and errors, for repeatable runs. Defaults to None.
+        """
+        self.verify = accept if verify is None else verify
+        self.results = ResultCache() if results is None else results
+        self.manifests = {} if manifests is None else manifests
+        self.max_body_size = max_body_size
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.__random = random.Random(seed)
+
+        self.requests = 0
+        """Amount of verification requests received, including digests and failed requests."""
+
+        self.errors = 0
+        """Amount of verification requests that failed because of an injected error."""
+
+        self.uploads = 0
+        """Amount of answers that were uploaded."""
+
+        self.uploaded_bytes = 0
+        """Amount of bytes of request bodies with answers, as received."""
+
+        self.digest_hits = 0
+        """Amount of digests for which the result was known."""
+
+        self.digest_misses = 0
+        """Amount of digests for which the result was not known."""
+
+        self.app = self.__create_app()
+
+    def __create_app(self) -> FastAPI:
+        """Create the FastAPI app with the verification endpoints.
+
+        Returns:
+            FastAPI: App.
+        """
+        app = FastAPI(title='Datacademy stand-in server')
+
+        @app.post(DEFAULT_URL)
+        async def verify(request: Request) -> Response:
+            await self.__inject_faults()
+            body = await request.body()
+            self.uploads += 1
+            self.uploaded_bytes += len(body)
+            return await asyncio.to_thread(self.__verify_body, body, request.headers.get('Content-Encoding'))
+
+        @app.post(DEFAULT_URL + BATCH_URL)
+        async def verify_batch(request: Request) -> Response:
+            await self.__inject_faults()
+            body = await request.body()
+            self.uploaded_bytes += len(body)
+            return await asyncio.to_thread(self.__verify_batch_body, body, request.headers.get('Content-Encoding'))
+
+        @app.post(DEFAULT_URL + DIGEST_URL)
+        async def verify_digest(request: VerificationDigestRequest) -> Response:
+            await self.__inject_faults()
+            cached = self.results.get(request.module, request.question, request.digest)
+            if cached is None:
+                self.digest_misses += 1
+            else:
+                self.digest_hits += 1
+            response = VerificationDigestResponse(known=cached is not None, response=cached)
+            return Response(response.model_dump_json(), media_type='application/json')
+
+        @app.get(DEFAULT_URL + MANIFEST_URL + '/{module}')
+        async def get_manifest(module: str, request: Request) -> Response:
+            manifest = self.manifests.get(module)
+            if manifest is None:
+                raise HTTPException(status_code=404, detail=f'No manifest for module {module}')
+
+            # The version is the entity tag, so clients only download a manifest when it changed
+            etag = json.dumps(manifest.version)
+            if request.headers.get('If-None-Match') == etag:
+                return Response(status_code=304, headers={'ETag': etag})
+            return Response(manifest.model_dump_json(), media_type='application/json', headers={'ETag': etag})
+
+        return app
+
+    async def __inject_faults(self) -> None:
+        """Delay a verification request by the latency, and fail it at the error rate.
+
+        Raises:
+            HTTPException: If an error is injected.
+        """
+        self.requests += 1
+        delay = self.latency + self.jitter * self.__random.random()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        if self.error_rate > 0 and self.__random.random() < self.error_rate:
+            self.errors += 1
+            raise HTTPException(status_code=self.error_status, detail='Injected error')
+
+    def __verify_body(self, body: bytes, content_encoding: str | None) -> Response:
+        """Verify the answer in the body of a verification request.
+
+        Args:
+            body (bytes): Body of the request.
+            content_encoding (str | None): Value of the `Content-Encoding` header.
+
+        Raises:
+            HTTPException: If the body is invalid.
+
+        Returns:
+            Response: Verification response.
+        """
+        try:
+            request = VerificationRequest.parse(body, content_encoding, self.max_body_size)
+        except (ValueError, ValidationError) as error:
+            raise HTTPException(status_code=400, detail=str(error)) from error
+
+        return Response(self.__verify(request).model_dump_json(), media_type='application/json')
+
+    def __verify_batch_body(self, body: bytes, content_encoding: str | None) -> Response:
+        """Verify the answers in the body of a batch verification request.
+
+        Args:
+            body (bytes): Body of the request.
+            content_encoding (str | None): Value of the `Content-Encoding` header.
+
+        Raises:
+            HTTPException: If the body is invalid.
+
+        Returns:
+            Response: Batch verification response.
+        """
+        try:
+            batch = VerificationBatchRequest.parse(body, content_encoding, self.max_body_size)
+        except (ValueError, ValidationError) as error:
+            raise HTTPException(status_code=400, detail=str(error)) from error
+
+        self.uploads += len(batch.requests)
+        response = VerificationBatchResponse(responses=[self.__verify(request) for request in batch.requests])
+        return Response(response.model_dump_json(), media_type='application/json')
+
+    def __verify(self, request: VerificationRequest) -> VerificationResponse:
+        """Verify an answer, remembering the result by the content digest of the answer.
+
+        NOTE: The digest sent with the answer is used, as some answers are not decoded exactly as they were encoded,
+        so their digest would differ when it is computed again. It is only computed for clients that do not send it.
+
+        Args:
+            request (VerificationRequest): Verification request.
+
+        Returns:
+            VerificationResponse: Verification response.
+        """
+        response = self.verify(request)
+        digest = request.digest
+        if digest is None:
+            try:
+                digest, _ = content_digest(request.get())
+            except (NotImplementedError, TypeError):
+                return response
+
+        self.results.put(request.module, request.question, digest, response)
+        return response
+
+
+def create_app(verify: VerifyFunction | None = None) -> FastAPI:
+    """Create the FastAPI app of a new stand-in server.
+
+    Args:
+        verify (VerifyFunction | None, optional): Function that verifies an answer. Defaults to accepting every answer.
+
+    Returns:
+        FastAPI: App.
+    """
+    return StandInServer(verify).app
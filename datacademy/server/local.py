@@ -0,0 +1,165 @@
+"""Module containing a server that serves an app on localhost, without an ASGI server."""
+
+import sys
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Thread
+from types import TracebackType
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+DEFAULT_HOST = '127.0.0.1'
+"""Host the local server listens on."""
+
+HOP_HEADERS = frozenset(('connection', 'content-length', 'keep-alive', 'transfer-encoding'))
+"""Headers that only apply to a single connection, which are not passed between the server and the app."""
+
+DISCONNECT_ERRORS = (BrokenPipeError, ConnectionAbortedError, ConnectionResetError)
+"""Errors raised when a client closes its connection before the response is written, such as after a timeout."""
+
+
+class BridgeHandler(BaseHTTPRequestHandler):
+    """Handler that passes the requests of a local server to its app."""
+
+    protocol_version = 'HTTP/1.1'
+    # Headers and body are written separately, which would otherwise be delayed until the client acknowledges them
+    disable_nagle_algorithm = True
+    server: 'BridgeHTTPServer'
+
+    def do_GET(self) -> None:  # noqa: N802
+        """Handle a GET request."""
+        self.__handle()
+
+    def do_POST(self) -> None:  # noqa: N802
+        """Handle a POST request."""
+        self.__handle()
+
+    def log_message(self, format: str, *args: object) -> None:  # noqa: A002
+        """Do not log requests, as load tests send many of them."""
+
+    def __handle(self) -> None:
+        """Pass the request to the app and write its response."""
+        headers = {key: value for key, value in self.headers.items() if key.lower() not in HOP_HEADERS}
+        response = self.server.client.request(self.command, self.path, headers=headers, content=self.__read_body())
+
+        self.send_response(response.status_code)
+        for key, value in response.headers.items():
+            if key.lower() not in HOP_HEADERS:
+                self.send_header(key, value)
+        self.send_header('Content-Length', str(len(response.content)))
+        self.end_headers()
+        self.wfile.write(response.content)
+
+    def __read_body(self) -> bytes:
+        """Read the body of the request, which is sent at once or in chunks.
+
+        Returns:
+            bytes: Body.
+        """
+        if self.headers.get('Transfer-Encoding', '').lower() != 'chunked':
+            return self.rfile.read(int(self.headers.get('Content-Length', 0)))
+
+        chunks = []
+        while (size := int(self.rfile.readline().split(b';')[0], 16)) > 0:
+            chunks.append(self.rfile.read(size))
+            self.rfile.readline()
+        # Skip the trailer, which ends with an empty line
+        while self.rfile.readline() not in (b'\r\n', b'\n', b''):
+            pass
+        return b''.join(chunks)
+
+
+class BridgeHTTPServer(ThreadingHTTPServer):
+    """HTTP server with the client of the app that requests are passed to."""
+
+    daemon_threads = True
+
+    def __init__(self, address: tuple[str, int], client: TestClient) -> None:
+        """Create a new HTTP server.
+
+        Args:
+            address (tuple[str, int]): Host and port to listen on.
+            client (TestClient): Client of the app.
+        """
+        super().__init__(address, BridgeHandler)
+        self.client = client
+
+    def handle_error(self, request: object, client_address: tuple[str, int]) -> None:
+        """Handle an error of a request, ignoring clients that disconnected, which checkers do when they time out.
+
+        Args:
+            request (object): Socket of the request.
+            client_address (tuple[str, int]): Host and port of the client.
+        """
+        if not isinstance(sys.exc_info()[1], DISCONNECT_ERRORS):
+            super().handle_error(request, client_address)
+
+
+class LocalServer:
+    """Class for a server that serves an app on localhost, so checkers can reach it like the hosted API.
+
+    NOTE: Every connection is handled by its own thread, while the app runs on a single event loop. No ASGI server,
+    such as uvicorn, is needed.
+    """
+
+    def __init__(self, app: FastAPI, host: str = DEFAULT_HOST, port: int = 0) -> None:
+        """Create a new local server.
+
+        Args:
+            app (FastAPI): App to serve.
+            host (str, optional): Host to listen on. Defaults to DEFAULT_HOST.
+            port (int, optional): Port to listen on, where 0 picks a free port. Defaults to 0.
+        """
+        self.app = app
+        self.host = host
+        self.port = port
+        self.__client: TestClient | None = None
+        self.__server: BridgeHTTPServer | None = None
+
+    @property
+    def address(self) -> str:
+        """Address of the server, including scheme and port."""
+        return f'http://{self.host}:{self.port}'
+
+    def start(self) -> 'LocalServer':
+        """Start serving in the background, unless this is already being done.
+
+        Returns:
+            LocalServer: This server.
+        """
+        if self.__server is not None:
+            return self
+
+        # Entering the client starts the event loop of the app, which is shared by all requests
+        self.__client = TestClient(self.app, raise_server_exceptions=False).__enter__()
+        self.__server = BridgeHTTPServer((self.host, self.port), self.__client)
+        self.port = self.__server.server_address[1]
+        Thread(target=self.__server.serve_forever, daemon=True).start()
+        return self
+
+    def stop(self) -> None:
+        """Stop serving."""
+        if self.__server is not None:
+            self.__server.shutdown()
+            self.__server.server_close()
+            self.__server = None
+        if self.__client is not None:
+            self.__client.__exit__(None, None, None)
+            self.__client = None
+
+    def __enter__(self) -> 'LocalServer':
+        """Start serving.
+
+        Returns:
+            LocalServer: This server.
+        """
+        return self.start()
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None
+    ) -> None:
+        """Stop serving."""
+        self.stop()
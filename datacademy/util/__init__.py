@@ -1,4 +1,6 @@
 """Module containing utility functions and classes."""
+from .concurrency import iterate_async, run_sync
+from .paths import get_cache_dir
 from .types import check_isinstance
 
-__all__ = ['check_isinstance']
+__all__ = ['check_isinstance', 'get_cache_dir', 'iterate_async', 'run_sync']
@@ -1,63 +1,174 @@
-"""Module containing an animation thread."""
+"""Module containing text animations, which are shown by a single shared thread."""
+import logging
 from collections.abc import Callable
-from threading import Thread
-from time import sleep, time
+from threading import Condition, Lock, Thread
+from time import monotonic
 
+LOGGER = logging.getLogger(__name__)
 
-class TextAnimation(Thread):
-    """Class to animate console text using a Thread."""
 
-    def __init__(self, func: Callable[[int], str], frequency: int = 10) -> None:
-        """Create a new animation thread.
+class AnimationScheduler:
+    """Class to show any amount of text animations using a single thread.
+
+    NOTE: The thread is started when the first animation starts, and sleeps until the next frame is due. Without
+    running animations, it waits until one is started, so it does not wake up at all.
+    """
+
+    __shared: 'AnimationScheduler | None' = None
+    __shared_lock = Lock()
+
+    def __init__(self) -> None:
+        """Create a new animation scheduler, of which the thread is started once it is needed."""
+        self.__condition = Condition()
+        self.__animations: list[TextAnimation] = []
+        self.__thread: Thread | None = None
+
+    def add(self, animation: 'TextAnimation') -> None:
+        """Start showing an animation, of which the first frame is shown right away.
+
+        Args:
+            animation (TextAnimation): Animation.
+        """
+        with self.__condition:
+            if animation in self.__animations:
+                return
+            animation.due = monotonic()
+            self.__animations.append(animation)
+            if self.__thread is None:
+                self.__thread = Thread(target=self.__run, name='TextAnimation', daemon=True)
+                self.__thread.start()
+            self.__condition.notify()
+
+    def remove(self, animation: 'TextAnimation') -> bool:
+        """Stop showing an animation. Does not wait for the thread, as frames are only shown while holding the lock.
+
+        Args:
+            animation (TextAnimation): Animation.
+
+        Returns:
+            bool: True if the animation was being shown, False otherwise.
+        """
+        with self.__condition:
+            if animation not in self.__animations:
+                return False
+            self.__animations.remove(animation)
+            animation.clear()
+            # Wakes up the thread, so it waits without timeout if this was the last animation
+            self.__condition.notify()
+            return True
+
+    def __len__(self) -> int:
+        """Get the amount of animations that are being shown.
+
+        Returns:
+            int: Amount of animations.
+        """
+        with self.__condition:
+            return len(self.__animations)
+
+    def __run(self) -> None:
+        """Show the frames of the animations when they are due, where animations that fail to show are removed."""
+        with self.__condition:
+            try:
+                while True:
+                    if len(self.__animations) == 0:
+                        self.__condition.wait()
+                        continue
+
+                    now = monotonic()
+                    for animation in list(self.__animations):
+                        if animation.due <= now:
+                            try:
+                                animation.render()
+                            except Exception:
+                                # Such as a closed stdout or a failing animation function, which would fail again
+                                LOGGER.exception('Showing a text animation failed, so it is stopped')
+                                self.__animations.remove(animation)
+                                continue
+                            animation.due = now + animation.speed
+
+                    if len(self.__animations) > 0:
+                        self.__condition.wait(
+                            max(0.0, min(animation.due for animation in self.__animations) - monotonic()),
+                        )
+            finally:
+                # If this thread stops anyway, the animations are not shown, and the next one starts a new thread
+                self.__animations.clear()
+                self.__thread = None
+
+    @classmethod
+    def shared(cls) -> 'AnimationScheduler':
+        """Get the scheduler shared by all animations in this process.
+
+        Returns:
+            AnimationScheduler: Scheduler.
+        """
+        with cls.__shared_lock:
+            if cls.__shared is None:
+                cls.__shared = AnimationScheduler()
+            return cls.__shared
+
+
+class TextAnimation:
+    """Class to animate console text, of which the frames are shown by an animation scheduler."""
+
+    def __init__(
+        self,
+        func: Callable[[int], str],
+        frequency: int = 10,
+        scheduler: AnimationScheduler | None = None
+    ) -> None:
+        """Create a new animation.
 
         Args:
             func (Callable[[int], str]): Animation function from step to string.
             frequency (int, optional): Amount of string updates per second. Defaults to 10.
+            scheduler (AnimationScheduler | None, optional): Scheduler to show the animation with. Defaults to the
+                scheduler shared by all animations in this process.
         """
-        super().__init__(daemon=True)
         self.func = func
         self.step = 0
         self.speed = 1.0 / frequency
-        self.wait = min(0.1, self.speed)
-        self.should_stop = False
+        self.due = 0.0
         self.longest_line = 0
+        self.scheduler = AnimationScheduler.shared() if scheduler is None else scheduler
 
-    def run(self) -> None:
-        """Run the animation."""
-        last_run = time() - self.speed
-        while not self.should_stop:
-            if time() - self.speed >= last_run:
-                last_run = time()
-                text = self.func(self.step)
-                print(' ' * self.longest_line, end='\r')
-                print(text, end='\r', flush=True)
-                self.longest_line = max(self.longest_line, len(bytes(text, encoding='utf-8')))
-                self.step += 1
-
-            sleep(max(0, self.wait - (time() - last_run)))
-        print(' ' * self.longest_line, end='\r', flush=True)
+    def start(self) -> None:
+        """Start the animation."""
+        self.scheduler.add(self)
 
     def stop(self, text: str | None = None) -> None:
-        """Stop the animation. Blocks until animation is stopped.
+        """Stop the animation. Returns right away, as no frame is shown after the animation is removed.
 
         Args:
             text (str | None, optional): A text to print when the animation is complete. Defaults to None.
         """
-        self.should_stop = True
+        self.scheduler.remove(self)
         if text is not None:
             print(text, flush=True)
-        self.join()
+
+    def render(self) -> None:
+        """Show the next frame of the animation."""
+        text = self.func(self.step)
+        print(' ' * self.longest_line, end='\r')
+        print(text, end='\r', flush=True)
+        self.longest_line = max(self.longest_line, len(bytes(text, encoding='utf-8')))
+        self.step += 1
+
+    def clear(self) -> None:
+        """Clear the line of the animation."""
+        print(' ' * self.longest_line, end='\r', flush=True)
 
     @staticmethod
     def start_new(func: Callable[[int], str], frequency: int = 10) -> 'TextAnimation':
-        """Create a new AnimationThread and immediately start it.
+        """Create a new TextAnimation and immediately start it.
 
         Args:
             func (Callable[[int], str]): Animation function from step to string.
             frequency (int, optional): Amount of string updates per second. Defaults to 10.
 
         Returns:
-            AnimationThread: Started AnimationThread.
+            TextAnimation: Started TextAnimation.
         """
         animation = TextAnimation(func, frequency=frequency)
         animation.start()
@@ -72,7 +183,7 @@ class TextAnimation(Thread):
             frequency (int, optional): Amount of string updates per second. Defaults to 10.
 
         Returns:
-            AnimationThread: _description_
+            TextAnimation: Started TextAnimation.
         """
         def _loop(step: int) -> str:
             return loop_list[step % len(loop_list)]
@@ -0,0 +1,41 @@
+"""Module containing utilities related to concurrency."""
+import asyncio
+from collections.abc import AsyncIterator, Coroutine, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, TypeVar
+
+T = TypeVar('T')
+
+
+def run_sync(coroutine: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine to completion from synchronous code.
+
+    NOTE: If an event loop is already running in this thread, like in a notebook, the coroutine is run in a new
+    event loop in a separate thread.
+
+    Args:
+        coroutine (Coroutine[Any, Any, T]): Coroutine to run.
+
+    Returns:
+        T: Result of the coroutine.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coroutine)
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coroutine).result()
+
+
+async def iterate_async(iterable: Iterable[T]) -> AsyncIterator[T]:
+    """Iterate over a synchronous iterable from asynchronous code.
+
+    Args:
+        iterable (Iterable[T]): Iterable.
+
+    Yields:
+        T: Items of the iterable.
+    """
+    for item in iterable:
+        yield item
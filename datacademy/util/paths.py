@@ -0,0 +1,27 @@
+"""Module containing utilities related to paths."""
+import os
+from pathlib import Path
+
+CACHE_DIR_VARIABLE = 'DATACADEMY_CACHE_DIR'
+"""Environment variable that overrides the directory where local caches are kept."""
+
+
+def get_cache_dir(*path: str | Path) -> Path:
+    """Get a directory where local caches are kept, creating it if it does not exist.
+
+    NOTE: Uses the directory in the `DATACADEMY_CACHE_DIR` environment variable if it is set, otherwise the
+    `datacademy` directory in the user cache directory.
+
+    Args:
+        *path (str | Path): Path within the cache directory.
+
+    Returns:
+        Path: Cache directory.
+    """
+    root = os.environ.get(CACHE_DIR_VARIABLE)
+    if root is None:
+        root = Path(os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache', 'datacademy')
+
+    directory = Path(root, *path)
+    directory.mkdir(parents=True, exist_ok=True)
+    return directory